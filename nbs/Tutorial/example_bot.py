@@ -9,6 +9,7 @@ import pandas as pd
 
 from tk_slack.slack_actions import ActionHandler
 from tk_slack.message_templates import MessageTemplate
+from tk_slack.slack_client import PooledSlackClient
 
 # Load environment variables
 load_dotenv()
@@ -17,6 +18,9 @@ load_dotenv()
 app = App(token=os.environ.get("SLACK_BOT_TOKEN"))
 action_handler = ActionHandler.setup_slack_action_handler(app)
 
+# One long-lived Web API client for all alerts sent by this process
+slack_client = PooledSlackClient(token=os.environ.get("SLACK_BOT_TOKEN"))
+
 # Example event handlers
 @app.event("app_mention")
 def handle_app_mention_events(body, logger):
@@ -35,21 +39,10 @@ def send_to_slack(message_payload, message_id):
         message_id: ID for logging/tracking
         
     Returns:
-        Tuple of (success, error_details)
+        Tuple of (success, error_details, response)
     """
-    try:
-        # Use the Slack Web API to send the message
-        from slack_sdk import WebClient
-        
-        # Create a client with the bot token
-        client = WebClient(token=os.environ.get("SLACK_BOT_TOKEN"))
-        
-        # Send the message
-        response = client.chat_postMessage(**message_payload)
-        
-        return True, None
-    except Exception as e:
-        return False, str(e)
+    # Reuse the pooled client's keep-alive connections for every message
+    return slack_client.send_message(message_payload, message_id)
 
 def log_history(*args, **kwargs):
     """Log history of messages sent."""
@@ -5,7 +5,99 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://Datatistics.github.io',
                 'git_url': 'https://github.com/Datatistics/tk_slack',
                 'lib_path': 'tk_slack'},
-  'syms': { 'tk_slack.block_builder': { 'tk_slack.block_builder.BlockBuilder': ( 'API/block_builder.html#blockbuilder',
+  'syms': { 'tk_slack.action_dedupe': { 'tk_slack.action_dedupe.ActionDeduplicator': ( 'API/action_dedupe.html#actiondeduplicator',
+                                                                                       'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator.__init__': ( 'API/action_dedupe.html#actiondeduplicator.__init__',
+                                                                                                'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator._seen_in_memory': ( 'API/action_dedupe.html#actiondeduplicator._seen_in_memory',
+                                                                                                       'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator._seen_in_store': ( 'API/action_dedupe.html#actiondeduplicator._seen_in_store',
+                                                                                                      'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator.action_key': ( 'API/action_dedupe.html#actiondeduplicator.action_key',
+                                                                                                  'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator.action_value': ( 'API/action_dedupe.html#actiondeduplicator.action_value',
+                                                                                                    'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator.close': ( 'API/action_dedupe.html#actiondeduplicator.close',
+                                                                                             'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator.is_duplicate': ( 'API/action_dedupe.html#actiondeduplicator.is_duplicate',
+                                                                                                    'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator.purge': ( 'API/action_dedupe.html#actiondeduplicator.purge',
+                                                                                             'tk_slack/action_dedupe.py'),
+                                        'tk_slack.action_dedupe.ActionDeduplicator.release': ( 'API/action_dedupe.html#actiondeduplicator.release',
+                                                                                               'tk_slack/action_dedupe.py')},
+            'tk_slack.action_registry': { 'tk_slack.action_registry.ActionRegistry': ( 'API/action_registry.html#actionregistry',
+                                                                                       'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRegistry.__init__': ( 'API/action_registry.html#actionregistry.__init__',
+                                                                                                'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRegistry.action': ( 'API/action_registry.html#actionregistry.action',
+                                                                                              'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRegistry.register': ( 'API/action_registry.html#actionregistry.register',
+                                                                                                'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRegistry.resolve': ( 'API/action_registry.html#actionregistry.resolve',
+                                                                                               'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRegistry.unregister': ( 'API/action_registry.html#actionregistry.unregister',
+                                                                                                  'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRoute': ( 'API/action_registry.html#actionroute',
+                                                                                    'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRoute.__init__': ( 'API/action_registry.html#actionroute.__init__',
+                                                                                             'tk_slack/action_registry.py'),
+                                          'tk_slack.action_registry.ActionRoute.__repr__': ( 'API/action_registry.html#actionroute.__repr__',
+                                                                                             'tk_slack/action_registry.py')},
+            'tk_slack.alert_history': { 'tk_slack.alert_history.AlertHistoryBatch': ( 'API/alert_history.html#alerthistorybatch',
+                                                                                      'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.__init__': ( 'API/alert_history.html#alerthistorybatch.__init__',
+                                                                                               'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.__len__': ( 'API/alert_history.html#alerthistorybatch.__len__',
+                                                                                              'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.add': ( 'API/alert_history.html#alerthistorybatch.add',
+                                                                                          'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.bulk_insert_func': ( 'API/alert_history.html#alerthistorybatch.bulk_insert_func',
+                                                                                                       'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.clear': ( 'API/alert_history.html#alerthistorybatch.clear',
+                                                                                            'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.flush': ( 'API/alert_history.html#alerthistorybatch.flush',
+                                                                                            'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.records': ( 'API/alert_history.html#alerthistorybatch.records',
+                                                                                              'tk_slack/alert_history.py'),
+                                        'tk_slack.alert_history.AlertHistoryBatch.to_dataframe': ( 'API/alert_history.html#alerthistorybatch.to_dataframe',
+                                                                                                   'tk_slack/alert_history.py')},
+            'tk_slack.async_actions': { 'tk_slack.async_actions.AsyncActionWriter': ( 'API/async_actions.html#asyncactionwriter',
+                                                                                      'tk_slack/async_actions.py'),
+                                        'tk_slack.async_actions.AsyncActionWriter.__init__': ( 'API/async_actions.html#asyncactionwriter.__init__',
+                                                                                               'tk_slack/async_actions.py'),
+                                        'tk_slack.async_actions.AsyncActionWriter._ensure_started': ( 'API/async_actions.html#asyncactionwriter._ensure_started',
+                                                                                                      'tk_slack/async_actions.py'),
+                                        'tk_slack.async_actions.AsyncActionWriter._next_batch': ( 'API/async_actions.html#asyncactionwriter._next_batch',
+                                                                                                  'tk_slack/async_actions.py'),
+                                        'tk_slack.async_actions.AsyncActionWriter._run': ( 'API/async_actions.html#asyncactionwriter._run',
+                                                                                           'tk_slack/async_actions.py'),
+                                        'tk_slack.async_actions.AsyncActionWriter.close': ( 'API/async_actions.html#asyncactionwriter.close',
+                                                                                            'tk_slack/async_actions.py'),
+                                        'tk_slack.async_actions.AsyncActionWriter.flush': ( 'API/async_actions.html#asyncactionwriter.flush',
+                                                                                            'tk_slack/async_actions.py'),
+                                        'tk_slack.async_actions.AsyncActionWriter.put': ( 'API/async_actions.html#asyncactionwriter.put',
+                                                                                          'tk_slack/async_actions.py')},
+            'tk_slack.benchmarks': { 'tk_slack.benchmarks._bench_build_individual_message_blocks': ( 'API/benchmarks.html#_bench_build_individual_message_blocks',
+                                                                                                     'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks._bench_format_data_for_logging': ( 'API/benchmarks.html#_bench_format_data_for_logging',
+                                                                                             'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks._bench_format_value': ( 'API/benchmarks.html#_bench_format_value',
+                                                                                  'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks._bench_template_f1': ( 'API/benchmarks.html#_bench_template_f1',
+                                                                                 'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks._bench_template_f2': ( 'API/benchmarks.html#_bench_template_f2',
+                                                                                 'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks._bench_template_f2_parallel': ( 'API/benchmarks.html#_bench_template_f2_parallel',
+                                                                                          'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks._post_stub': ('API/benchmarks.html#_post_stub', 'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks._send_stub': ('API/benchmarks.html#_send_stub', 'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks.compare_benchmarks': ( 'API/benchmarks.html#compare_benchmarks',
+                                                                                 'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks.make_alert_frame': ( 'API/benchmarks.html#make_alert_frame',
+                                                                               'tk_slack/benchmarks.py'),
+                                     'tk_slack.benchmarks.run_benchmarks': ( 'API/benchmarks.html#run_benchmarks',
+                                                                             'tk_slack/benchmarks.py')},
+            'tk_slack.block_builder': { 'tk_slack.block_builder.BlockBuilder': ( 'API/block_builder.html#blockbuilder',
                                                                                  'tk_slack/block_builder.py'),
                                         'tk_slack.block_builder.BlockBuilder.create_context_block': ( 'API/block_builder.html#blockbuilder.create_context_block',
                                                                                                       'tk_slack/block_builder.py'),
@@ -21,6 +113,49 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'tk_slack/block_builder.py'),
                                         'tk_slack.block_builder.BlockBuilder.create_section_block': ( 'API/block_builder.html#blockbuilder.create_section_block',
                                                                                                       'tk_slack/block_builder.py')},
+            'tk_slack.block_template': { 'tk_slack.block_template.BlockTemplate': ( 'API/block_template.html#blocktemplate',
+                                                                                    'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.BlockTemplate.__init__': ( 'API/block_template.html#blocktemplate.__init__',
+                                                                                             'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.BlockTemplate._compile': ( 'API/block_template.html#blocktemplate._compile',
+                                                                                             'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.BlockTemplate._compile_string': ( 'API/block_template.html#blocktemplate._compile_string',
+                                                                                                    'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.BlockTemplate._emit_slot': ( 'API/block_template.html#blocktemplate._emit_slot',
+                                                                                               'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.BlockTemplate.render': ( 'API/block_template.html#blocktemplate.render',
+                                                                                           'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.BlockTemplate.render_str': ( 'API/block_template.html#blocktemplate.render_str',
+                                                                                               'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.BlockTemplate.slots': ( 'API/block_template.html#blocktemplate.slots',
+                                                                                          'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.Slot': ('API/block_template.html#slot', 'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.Slot.__format__': ( 'API/block_template.html#slot.__format__',
+                                                                                      'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.Slot.__init__': ( 'API/block_template.html#slot.__init__',
+                                                                                    'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.Slot.__repr__': ( 'API/block_template.html#slot.__repr__',
+                                                                                    'tk_slack/block_template.py'),
+                                         'tk_slack.block_template.Slot.__str__': ( 'API/block_template.html#slot.__str__',
+                                                                                   'tk_slack/block_template.py')},
+            'tk_slack.concurrent_send': { 'tk_slack.concurrent_send.ConcurrentSender': ( 'API/concurrent_send.html#concurrentsender',
+                                                                                         'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender.__enter__': ( 'API/concurrent_send.html#concurrentsender.__enter__',
+                                                                                                   'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender.__exit__': ( 'API/concurrent_send.html#concurrentsender.__exit__',
+                                                                                                  'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender.__init__': ( 'API/concurrent_send.html#concurrentsender.__init__',
+                                                                                                  'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender._call': ( 'API/concurrent_send.html#concurrentsender._call',
+                                                                                               'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender._channel_slot': ( 'API/concurrent_send.html#concurrentsender._channel_slot',
+                                                                                                       'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender._get_executor': ( 'API/concurrent_send.html#concurrentsender._get_executor',
+                                                                                                       'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender.close': ( 'API/concurrent_send.html#concurrentsender.close',
+                                                                                               'tk_slack/concurrent_send.py'),
+                                          'tk_slack.concurrent_send.ConcurrentSender.map': ( 'API/concurrent_send.html#concurrentsender.map',
+                                                                                             'tk_slack/concurrent_send.py')},
             'tk_slack.core': { 'tk_slack.core.ColumnUtils': ('API/core.html#columnutils', 'tk_slack/core.py'),
                                'tk_slack.core.ColumnUtils.get_column_synonyms': ( 'API/core.html#columnutils.get_column_synonyms',
                                                                                   'tk_slack/core.py'),
@@ -29,18 +164,44 @@ d = { 'settings': { 'branch': 'main',
                                'tk_slack.core.ColumnUtils.normalize_columns': ( 'API/core.html#columnutils.normalize_columns',
                                                                                 'tk_slack/core.py'),
                                'tk_slack.core.DebugLogger': ('API/core.html#debuglogger', 'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger._level_from_env': ( 'API/core.html#debuglogger._level_from_env',
+                                                                              'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger._to_level': ('API/core.html#debuglogger._to_level', 'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger.configure': ('API/core.html#debuglogger.configure', 'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger.debug': ('API/core.html#debuglogger.debug', 'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger.error': ('API/core.html#debuglogger.error', 'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger.info': ('API/core.html#debuglogger.info', 'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger.is_enabled': ('API/core.html#debuglogger.is_enabled', 'tk_slack/core.py'),
                                'tk_slack.core.DebugLogger.log': ('API/core.html#debuglogger.log', 'tk_slack/core.py'),
+                               'tk_slack.core.DebugLogger.warning': ('API/core.html#debuglogger.warning', 'tk_slack/core.py'),
                                'tk_slack.core.SlackFormatter': ('API/core.html#slackformatter', 'tk_slack/core.py'),
+                               'tk_slack.core.SlackFormatter._clean_copper_ids': ( 'API/core.html#slackformatter._clean_copper_ids',
+                                                                                   'tk_slack/core.py'),
+                               'tk_slack.core.SlackFormatter._clean_titles': ( 'API/core.html#slackformatter._clean_titles',
+                                                                               'tk_slack/core.py'),
+                               'tk_slack.core.SlackFormatter._is_finite_number': ( 'API/core.html#slackformatter._is_finite_number',
+                                                                                   'tk_slack/core.py'),
+                               'tk_slack.core.SlackFormatter._string_values': ( 'API/core.html#slackformatter._string_values',
+                                                                                'tk_slack/core.py'),
                                'tk_slack.core.SlackFormatter.format_section_name': ( 'API/core.html#slackformatter.format_section_name',
                                                                                      'tk_slack/core.py'),
+                               'tk_slack.core.SlackFormatter.format_section_names': ( 'API/core.html#slackformatter.format_section_names',
+                                                                                      'tk_slack/core.py'),
                                'tk_slack.core.SlackFormatter.right_hand_details': ( 'API/core.html#slackformatter.right_hand_details',
                                                                                     'tk_slack/core.py'),
                                'tk_slack.core.SlackMessenger': ('API/core.html#slackmessenger', 'tk_slack/core.py'),
+                               'tk_slack.core.SlackMessenger._alert_record': ( 'API/core.html#slackmessenger._alert_record',
+                                                                               'tk_slack/core.py'),
                                'tk_slack.core.SlackMessenger._format_data_for_logging': ( 'API/core.html#slackmessenger._format_data_for_logging',
                                                                                           'tk_slack/core.py'),
                                'tk_slack.core.SlackMessenger._log_alert': ('API/core.html#slackmessenger._log_alert', 'tk_slack/core.py'),
+                               'tk_slack.core.SlackMessenger._logging_data': ( 'API/core.html#slackmessenger._logging_data',
+                                                                               'tk_slack/core.py'),
+                               'tk_slack.core.SlackMessenger._message_ts': ('API/core.html#slackmessenger._message_ts', 'tk_slack/core.py'),
                                'tk_slack.core.SlackMessenger._send_alert_to_slack': ( 'API/core.html#slackmessenger._send_alert_to_slack',
                                                                                       'tk_slack/core.py'),
+                               'tk_slack.core.SlackMessenger._unpack_send_result': ( 'API/core.html#slackmessenger._unpack_send_result',
+                                                                                     'tk_slack/core.py'),
                                'tk_slack.core.SlackMessenger.create_header_block': ( 'API/core.html#slackmessenger.create_header_block',
                                                                                      'tk_slack/core.py'),
                                'tk_slack.core.SlackMessenger.get_metadata': ( 'API/core.html#slackmessenger.get_metadata',
@@ -50,6 +211,31 @@ d = { 'settings': { 'branch': 'main',
                                'tk_slack.core.ValueFormatter': ('API/core.html#valueformatter', 'tk_slack/core.py'),
                                'tk_slack.core.ValueFormatter.format_value': ( 'API/core.html#valueformatter.format_value',
                                                                               'tk_slack/core.py')},
+            'tk_slack.incremental': { 'tk_slack.incremental.AlertDeduplicator': ( 'API/incremental.html#alertdeduplicator',
+                                                                                  'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.AlertDeduplicator.__init__': ( 'API/incremental.html#alertdeduplicator.__init__',
+                                                                                           'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.AlertDeduplicator._digest': ( 'API/incremental.html#alertdeduplicator._digest',
+                                                                                          'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.AlertDeduplicator._key_values': ( 'API/incremental.html#alertdeduplicator._key_values',
+                                                                                              'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.AlertDeduplicator.row_hashes': ( 'API/incremental.html#alertdeduplicator.row_hashes',
+                                                                                             'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.AlertDeduplicator.row_keys': ( 'API/incremental.html#alertdeduplicator.row_keys',
+                                                                                           'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.AlertDeduplicator.start': ( 'API/incremental.html#alertdeduplicator.start',
+                                                                                        'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.DedupeRun': ('API/incremental.html#deduperun', 'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.DedupeRun.__init__': ( 'API/incremental.html#deduperun.__init__',
+                                                                                   'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.DedupeRun.commit': ( 'API/incremental.html#deduperun.commit',
+                                                                                 'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.DedupeRun.mark_all_sent': ( 'API/incremental.html#deduperun.mark_all_sent',
+                                                                                        'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.DedupeRun.mark_sent': ( 'API/incremental.html#deduperun.mark_sent',
+                                                                                    'tk_slack/incremental.py'),
+                                      'tk_slack.incremental.DedupeRun.message_ts': ( 'API/incremental.html#deduperun.message_ts',
+                                                                                     'tk_slack/incremental.py')},
             'tk_slack.interaction_builder': { 'tk_slack.interaction_builder.InteractionBuilder': ( 'API/interection_builder.html#interactionbuilder',
                                                                                                    'tk_slack/interaction_builder.py'),
                                               'tk_slack.interaction_builder.InteractionBuilder.create_actions_block': ( 'API/interection_builder.html#interactionbuilder.create_actions_block',
@@ -68,12 +254,88 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                        'tk_slack/interaction_builder.py'),
                                               'tk_slack.interaction_builder.InteractionBuilder.detect_and_create_interactive_elements': ( 'API/interection_builder.html#interactionbuilder.detect_and_create_interactive_elements',
                                                                                                                                           'tk_slack/interaction_builder.py')},
+            'tk_slack.interaction_cache': { 'tk_slack.interaction_cache.InteractionCache': ( 'API/interaction_cache.html#interactioncache',
+                                                                                             'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache.__init__': ( 'API/interaction_cache.html#interactioncache.__init__',
+                                                                                                      'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache._drop': ( 'API/interaction_cache.html#interactioncache._drop',
+                                                                                                   'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache._evict': ( 'API/interaction_cache.html#interactioncache._evict',
+                                                                                                    'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache._lookup': ( 'API/interaction_cache.html#interactioncache._lookup',
+                                                                                                     'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache._put': ( 'API/interaction_cache.html#interactioncache._put',
+                                                                                                  'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache._row': ( 'API/interaction_cache.html#interactioncache._row',
+                                                                                                  'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache.add': ( 'API/interaction_cache.html#interactioncache.add',
+                                                                                                 'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache.get_interactions_by_view': ( 'API/interaction_cache.html#interactioncache.get_interactions_by_view',
+                                                                                                                      'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache.get_user_interactions': ( 'API/interaction_cache.html#interactioncache.get_user_interactions',
+                                                                                                                   'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache.invalidate': ( 'API/interaction_cache.html#interactioncache.invalidate',
+                                                                                                        'tk_slack/interaction_cache.py'),
+                                            'tk_slack.interaction_cache.InteractionCache.size_bytes': ( 'API/interaction_cache.html#interactioncache.size_bytes',
+                                                                                                        'tk_slack/interaction_cache.py')},
+            'tk_slack.load_harness': { 'tk_slack.load_harness.ActionLoadGenerator': ( 'API/load_harness.html#actionloadgenerator',
+                                                                                      'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.ActionLoadGenerator.__init__': ( 'API/load_harness.html#actionloadgenerator.__init__',
+                                                                                               'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.ActionLoadGenerator._action': ( 'API/load_harness.html#actionloadgenerator._action',
+                                                                                              'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.ActionLoadGenerator.bodies': ( 'API/load_harness.html#actionloadgenerator.bodies',
+                                                                                             'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.ActionLoadGenerator.body': ( 'API/load_harness.html#actionloadgenerator.body',
+                                                                                           'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector': ( 'API/load_harness.html#inmemoryconnector',
+                                                                                    'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector.__init__': ( 'API/load_harness.html#inmemoryconnector.__init__',
+                                                                                             'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector._select': ( 'API/load_harness.html#inmemoryconnector._select',
+                                                                                            'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector._wait': ( 'API/load_harness.html#inmemoryconnector._wait',
+                                                                                          'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector.bulk_insert': ( 'API/load_harness.html#inmemoryconnector.bulk_insert',
+                                                                                                'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector.get_interactions_by_view': ( 'API/load_harness.html#inmemoryconnector.get_interactions_by_view',
+                                                                                                             'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector.get_user_interactions': ( 'API/load_harness.html#inmemoryconnector.get_user_interactions',
+                                                                                                          'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.InMemoryConnector.insert_record': ( 'API/load_harness.html#inmemoryconnector.insert_record',
+                                                                                                  'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness._percentile': ( 'API/load_harness.html#_percentile',
+                                                                              'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.load_bodies': ( 'API/load_harness.html#load_bodies',
+                                                                              'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.run_action_load': ( 'API/load_harness.html#run_action_load',
+                                                                                  'tk_slack/load_harness.py'),
+                                       'tk_slack.load_harness.save_bodies': ( 'API/load_harness.html#save_bodies',
+                                                                              'tk_slack/load_harness.py')},
             'tk_slack.message_templates': { 'tk_slack.message_templates.MessageTemplate': ( 'API/message_templates.html#messagetemplate',
                                                                                             'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._build_digest_blocks': ( 'API/message_templates.html#messagetemplate._build_digest_blocks',
+                                                                                                                 'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._iter_f2_compiled_messages': ( 'API/message_templates.html#messagetemplate._iter_f2_compiled_messages',
+                                                                                                                       'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._iter_f2_messages': ( 'API/message_templates.html#messagetemplate._iter_f2_messages',
+                                                                                                              'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._render_f2_payloads': ( 'API/message_templates.html#messagetemplate._render_f2_payloads',
+                                                                                                                'tk_slack/message_templates.py'),
                                             'tk_slack.message_templates.MessageTemplate._send_messages_and_log': ( 'API/message_templates.html#messagetemplate._send_messages_and_log',
                                                                                                                    'tk_slack/message_templates.py'),
                                             'tk_slack.message_templates.MessageTemplate._send_messages_and_log_with_metadata': ( 'API/message_templates.html#messagetemplate._send_messages_and_log_with_metadata',
                                                                                                                                  'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._send_pages': ( 'API/message_templates.html#messagetemplate._send_pages',
+                                                                                                        'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._with_message_ts': ( 'API/message_templates.html#messagetemplate._with_message_ts',
+                                                                                                             'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._with_row_data': ( 'API/message_templates.html#messagetemplate._with_row_data',
+                                                                                                           'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate._wrap_send_func': ( 'API/message_templates.html#messagetemplate._wrap_send_func',
+                                                                                                            'tk_slack/message_templates.py'),
+                                            'tk_slack.message_templates.MessageTemplate.template_digest': ( 'API/message_templates.html#messagetemplate.template_digest',
+                                                                                                            'tk_slack/message_templates.py'),
                                             'tk_slack.message_templates.MessageTemplate.template_f1': ( 'API/message_templates.html#messagetemplate.template_f1',
                                                                                                         'tk_slack/message_templates.py'),
                                             'tk_slack.message_templates.MessageTemplate.template_f2': ( 'API/message_templates.html#messagetemplate.template_f2',
@@ -88,22 +350,185 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                'tk_slack/metadata_handler.py'),
                                            'tk_slack.metadata_handler.MessageMetadataHandler.get_event_payload': ( 'API/metadata_handler.html#messagemetadatahandler.get_event_payload',
                                                                                                                    'tk_slack/metadata_handler.py')},
+            'tk_slack.mock_slack': { 'tk_slack.mock_slack.MockSlackServer': ( 'API/mock_slack.html#mockslackserver',
+                                                                              'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.__enter__': ( 'API/mock_slack.html#mockslackserver.__enter__',
+                                                                                        'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.__exit__': ( 'API/mock_slack.html#mockslackserver.__exit__',
+                                                                                       'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.__init__': ( 'API/mock_slack.html#mockslackserver.__init__',
+                                                                                       'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer._respond': ( 'API/mock_slack.html#mockslackserver._respond',
+                                                                                       'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer._throttle': ( 'API/mock_slack.html#mockslackserver._throttle',
+                                                                                        'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.base_url': ( 'API/mock_slack.html#mockslackserver.base_url',
+                                                                                       'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.handle': ( 'API/mock_slack.html#mockslackserver.handle',
+                                                                                     'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.post_to_slack_func': ( 'API/mock_slack.html#mockslackserver.post_to_slack_func',
+                                                                                                 'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.reset': ( 'API/mock_slack.html#mockslackserver.reset',
+                                                                                    'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.send_to_slack_func': ( 'API/mock_slack.html#mockslackserver.send_to_slack_func',
+                                                                                                 'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.start': ( 'API/mock_slack.html#mockslackserver.start',
+                                                                                    'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack.MockSlackServer.stop': ( 'API/mock_slack.html#mockslackserver.stop',
+                                                                                   'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack._MockSlackHandler': ( 'API/mock_slack.html#_mockslackhandler',
+                                                                                'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack._MockSlackHandler.do_POST': ( 'API/mock_slack.html#_mockslackhandler.do_post',
+                                                                                        'tk_slack/mock_slack.py'),
+                                     'tk_slack.mock_slack._MockSlackHandler.log_message': ( 'API/mock_slack.html#_mockslackhandler.log_message',
+                                                                                            'tk_slack/mock_slack.py')},
+            'tk_slack.outbox': { 'tk_slack.outbox.AlertOutbox': ('API/outbox.html#alertoutbox', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.__init__': ('API/outbox.html#alertoutbox.__init__', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox._dump_rows': ('API/outbox.html#alertoutbox._dump_rows', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox._load_rows': ('API/outbox.html#alertoutbox._load_rows', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.clear': ('API/outbox.html#alertoutbox.clear', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.close': ('API/outbox.html#alertoutbox.close', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.enqueue': ('API/outbox.html#alertoutbox.enqueue', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.has_run': ('API/outbox.html#alertoutbox.has_run', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.runs': ('API/outbox.html#alertoutbox.runs', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.start': ('API/outbox.html#alertoutbox.start', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.AlertOutbox.stats': ('API/outbox.html#alertoutbox.stats', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.OutboxRun': ('API/outbox.html#outboxrun', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.OutboxRun.__init__': ('API/outbox.html#outboxrun.__init__', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.OutboxRun.finish': ('API/outbox.html#outboxrun.finish', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.OutboxRun.mark': ('API/outbox.html#outboxrun.mark', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.OutboxRun.pending': ('API/outbox.html#outboxrun.pending', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.OutboxRun.remaining': ('API/outbox.html#outboxrun.remaining', 'tk_slack/outbox.py'),
+                                 'tk_slack.outbox.OutboxRun.stats': ('API/outbox.html#outboxrun.stats', 'tk_slack/outbox.py')},
+            'tk_slack.pagination': { 'tk_slack.pagination.BlockPaginator': ('API/pagination.html#blockpaginator', 'tk_slack/pagination.py'),
+                                     'tk_slack.pagination.BlockPaginator.__init__': ( 'API/pagination.html#blockpaginator.__init__',
+                                                                                      'tk_slack/pagination.py'),
+                                     'tk_slack.pagination.BlockPaginator.block_size': ( 'API/pagination.html#blockpaginator.block_size',
+                                                                                        'tk_slack/pagination.py'),
+                                     'tk_slack.pagination.BlockPaginator.paginate': ( 'API/pagination.html#blockpaginator.paginate',
+                                                                                      'tk_slack/pagination.py')},
+            'tk_slack.parallel_render': { 'tk_slack.parallel_render.ParallelRenderer': ( 'API/parallel_render.html#parallelrenderer',
+                                                                                         'tk_slack/parallel_render.py'),
+                                          'tk_slack.parallel_render.ParallelRenderer.__enter__': ( 'API/parallel_render.html#parallelrenderer.__enter__',
+                                                                                                   'tk_slack/parallel_render.py'),
+                                          'tk_slack.parallel_render.ParallelRenderer.__exit__': ( 'API/parallel_render.html#parallelrenderer.__exit__',
+                                                                                                  'tk_slack/parallel_render.py'),
+                                          'tk_slack.parallel_render.ParallelRenderer.__init__': ( 'API/parallel_render.html#parallelrenderer.__init__',
+                                                                                                  'tk_slack/parallel_render.py'),
+                                          'tk_slack.parallel_render.ParallelRenderer._get_executor': ( 'API/parallel_render.html#parallelrenderer._get_executor',
+                                                                                                       'tk_slack/parallel_render.py'),
+                                          'tk_slack.parallel_render.ParallelRenderer.close': ( 'API/parallel_render.html#parallelrenderer.close',
+                                                                                               'tk_slack/parallel_render.py'),
+                                          'tk_slack.parallel_render.ParallelRenderer.render': ( 'API/parallel_render.html#parallelrenderer.render',
+                                                                                                'tk_slack/parallel_render.py'),
+                                          'tk_slack.parallel_render.ParallelRenderer.uses_workers': ( 'API/parallel_render.html#parallelrenderer.uses_workers',
+                                                                                                      'tk_slack/parallel_render.py')},
+            'tk_slack.rate_limit': { 'tk_slack.rate_limit.SlackRateLimiter': ( 'API/rate_limit.html#slackratelimiter',
+                                                                               'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.SlackRateLimiter.__init__': ( 'API/rate_limit.html#slackratelimiter.__init__',
+                                                                                        'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.SlackRateLimiter._buckets_for': ( 'API/rate_limit.html#slackratelimiter._buckets_for',
+                                                                                            'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.SlackRateLimiter._count': ( 'API/rate_limit.html#slackratelimiter._count',
+                                                                                      'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.SlackRateLimiter.call': ( 'API/rate_limit.html#slackratelimiter.call',
+                                                                                    'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.SlackRateLimiter.retry_after': ( 'API/rate_limit.html#slackratelimiter.retry_after',
+                                                                                           'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.SlackRateLimiter.wrap': ( 'API/rate_limit.html#slackratelimiter.wrap',
+                                                                                    'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket': ('API/rate_limit.html#tokenbucket', 'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket.__init__': ( 'API/rate_limit.html#tokenbucket.__init__',
+                                                                                   'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket._refill': ( 'API/rate_limit.html#tokenbucket._refill',
+                                                                                  'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket.acquire': ( 'API/rate_limit.html#tokenbucket.acquire',
+                                                                                  'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket.pause': ( 'API/rate_limit.html#tokenbucket.pause',
+                                                                                'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket.reserve': ( 'API/rate_limit.html#tokenbucket.reserve',
+                                                                                  'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket.slow_down': ( 'API/rate_limit.html#tokenbucket.slow_down',
+                                                                                    'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket.speed_up': ( 'API/rate_limit.html#tokenbucket.speed_up',
+                                                                                   'tk_slack/rate_limit.py'),
+                                     'tk_slack.rate_limit.TokenBucket.wait_time': ( 'API/rate_limit.html#tokenbucket.wait_time',
+                                                                                    'tk_slack/rate_limit.py')},
+            'tk_slack.scheduler': { 'tk_slack.scheduler.SendScheduler': ('API/scheduler.html#sendscheduler', 'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.__init__': ( 'API/scheduler.html#sendscheduler.__init__',
+                                                                                   'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler._pick': ( 'API/scheduler.html#sendscheduler._pick',
+                                                                                'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler._setting': ( 'API/scheduler.html#sendscheduler._setting',
+                                                                                   'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.acquire': ( 'API/scheduler.html#sendscheduler.acquire',
+                                                                                  'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.metrics': ( 'API/scheduler.html#sendscheduler.metrics',
+                                                                                  'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.release': ( 'API/scheduler.html#sendscheduler.release',
+                                                                                  'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.run': ( 'API/scheduler.html#sendscheduler.run',
+                                                                              'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.set_group': ( 'API/scheduler.html#sendscheduler.set_group',
+                                                                                    'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.set_view': ( 'API/scheduler.html#sendscheduler.set_view',
+                                                                                   'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.slot': ( 'API/scheduler.html#sendscheduler.slot',
+                                                                               'tk_slack/scheduler.py'),
+                                    'tk_slack.scheduler.SendScheduler.wrap': ( 'API/scheduler.html#sendscheduler.wrap',
+                                                                               'tk_slack/scheduler.py')},
+            'tk_slack.serialization': { 'tk_slack.serialization._json_dumps': ( 'API/serialization.html#_json_dumps',
+                                                                                'tk_slack/serialization.py'),
+                                        'tk_slack.serialization._orjson_dumps': ( 'API/serialization.html#_orjson_dumps',
+                                                                                  'tk_slack/serialization.py'),
+                                        'tk_slack.serialization._orjson_dumps_bytes': ( 'API/serialization.html#_orjson_dumps_bytes',
+                                                                                        'tk_slack/serialization.py'),
+                                        'tk_slack.serialization._replace_non_finite': ( 'API/serialization.html#_replace_non_finite',
+                                                                                        'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.available_backends': ( 'API/serialization.html#available_backends',
+                                                                                       'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.benchmark_backends': ( 'API/serialization.html#benchmark_backends',
+                                                                                       'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.dumps': ('API/serialization.html#dumps', 'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.dumps_bytes': ( 'API/serialization.html#dumps_bytes',
+                                                                                'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.get_backend': ( 'API/serialization.html#get_backend',
+                                                                                'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.loads': ('API/serialization.html#loads', 'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.set_backend': ( 'API/serialization.html#set_backend',
+                                                                                'tk_slack/serialization.py'),
+                                        'tk_slack.serialization.to_jsonable': ( 'API/serialization.html#to_jsonable',
+                                                                                'tk_slack/serialization.py')},
             'tk_slack.slack_actions': { 'tk_slack.slack_actions.ActionHandler': ( 'API/slack_actions.html#actionhandler',
                                                                                   'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler.__init__': ( 'API/slack_actions.html#actionhandler.__init__',
                                                                                            'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler._format_response_text': ( 'API/slack_actions.html#actionhandler._format_response_text',
                                                                                                         'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions.ActionHandler._parse_action': ( 'API/slack_actions.html#actionhandler._parse_action',
+                                                                                                'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions.ActionHandler._release_action': ( 'API/slack_actions.html#actionhandler._release_action',
+                                                                                                  'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions.ActionHandler._response_payload': ( 'API/slack_actions.html#actionhandler._response_payload',
+                                                                                                    'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler._send_response': ( 'API/slack_actions.html#actionhandler._send_response',
                                                                                                  'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions.ActionHandler._snowflake_record': ( 'API/slack_actions.html#actionhandler._snowflake_record',
+                                                                                                    'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler._store_action_in_snowflake': ( 'API/slack_actions.html#actionhandler._store_action_in_snowflake',
                                                                                                              'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions.ActionHandler._store_actions_in_snowflake': ( 'API/slack_actions.html#actionhandler._store_actions_in_snowflake',
+                                                                                                              'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler.get_instance': ( 'API/slack_actions.html#actionhandler.get_instance',
                                                                                                'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler.get_payload_from_body': ( 'API/slack_actions.html#actionhandler.get_payload_from_body',
                                                                                                         'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler.process_slack_action': ( 'API/slack_actions.html#actionhandler.process_slack_action',
                                                                                                        'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions.ActionHandler.process_slack_action_async': ( 'API/slack_actions.html#actionhandler.process_slack_action_async',
+                                                                                                             'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions.ActionHandler.setup_async_slack_action_handler': ( 'API/slack_actions.html#actionhandler.setup_async_slack_action_handler',
+                                                                                                                   'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionHandler.setup_slack_action_handler': ( 'API/slack_actions.html#actionhandler.setup_slack_action_handler',
                                                                                                              'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionIdManager': ( 'API/slack_actions.html#actionidmanager',
@@ -111,7 +536,71 @@ d = { 'settings': { 'branch': 'main',
                                         'tk_slack.slack_actions.ActionIdManager.generate_action_id': ( 'API/slack_actions.html#actionidmanager.generate_action_id',
                                                                                                        'tk_slack/slack_actions.py'),
                                         'tk_slack.slack_actions.ActionIdManager.parse_action_id': ( 'API/slack_actions.html#actionidmanager.parse_action_id',
-                                                                                                    'tk_slack/slack_actions.py')},
+                                                                                                    'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions._compile_response_template': ( 'API/slack_actions.html#_compile_response_template',
+                                                                                               'tk_slack/slack_actions.py'),
+                                        'tk_slack.slack_actions._format_response_date': ( 'API/slack_actions.html#_format_response_date',
+                                                                                          'tk_slack/slack_actions.py')},
+            'tk_slack.slack_client': { 'tk_slack.slack_client.PooledSlackClient': ( 'API/slack_client.html#pooledslackclient',
+                                                                                    'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.__enter__': ( 'API/slack_client.html#pooledslackclient.__enter__',
+                                                                                              'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.__exit__': ( 'API/slack_client.html#pooledslackclient.__exit__',
+                                                                                             'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.__init__': ( 'API/slack_client.html#pooledslackclient.__init__',
+                                                                                             'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient._get_connection': ( 'API/slack_client.html#pooledslackclient._get_connection',
+                                                                                                    'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient._post_url': ( 'API/slack_client.html#pooledslackclient._post_url',
+                                                                                              'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient._release': ( 'API/slack_client.html#pooledslackclient._release',
+                                                                                             'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient._send_payload': ( 'API/slack_client.html#pooledslackclient._send_payload',
+                                                                                                  'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.api_call': ( 'API/slack_client.html#pooledslackclient.api_call',
+                                                                                             'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.close': ( 'API/slack_client.html#pooledslackclient.close',
+                                                                                          'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.post_message': ( 'API/slack_client.html#pooledslackclient.post_message',
+                                                                                                 'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.send_message': ( 'API/slack_client.html#pooledslackclient.send_message',
+                                                                                                 'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.update_message': ( 'API/slack_client.html#pooledslackclient.update_message',
+                                                                                                   'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.PooledSlackClient.upload_file': ( 'API/slack_client.html#pooledslackclient.upload_file',
+                                                                                                'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.SlackAPIResponse': ( 'API/slack_client.html#slackapiresponse',
+                                                                                   'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.SlackAPIResponse.__getitem__': ( 'API/slack_client.html#slackapiresponse.__getitem__',
+                                                                                               'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.SlackAPIResponse.__init__': ( 'API/slack_client.html#slackapiresponse.__init__',
+                                                                                            'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.SlackAPIResponse.get': ( 'API/slack_client.html#slackapiresponse.get',
+                                                                                       'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.SlackAPIResponse.json': ( 'API/slack_client.html#slackapiresponse.json',
+                                                                                        'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.SlackAPIResponse.ok': ( 'API/slack_client.html#slackapiresponse.ok',
+                                                                                      'tk_slack/slack_client.py'),
+                                       'tk_slack.slack_client.SlackAPIResponse.text': ( 'API/slack_client.html#slackapiresponse.text',
+                                                                                        'tk_slack/slack_client.py')},
+            'tk_slack.smoothing': { 'tk_slack.smoothing.SendSmoother': ('API/smoothing.html#sendsmoother', 'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SendSmoother.__init__': ( 'API/smoothing.html#sendsmoother.__init__',
+                                                                                  'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SendSmoother._phase': ( 'API/smoothing.html#sendsmoother._phase',
+                                                                                'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SendSmoother.reserve': ( 'API/smoothing.html#sendsmoother.reserve',
+                                                                                 'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SendSmoother.slots': ( 'API/smoothing.html#sendsmoother.slots',
+                                                                               'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SendSmoother.start': ( 'API/smoothing.html#sendsmoother.start',
+                                                                               'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SmoothedRun': ('API/smoothing.html#smoothedrun', 'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SmoothedRun.__init__': ( 'API/smoothing.html#smoothedrun.__init__',
+                                                                                 'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SmoothedRun.next_slot': ( 'API/smoothing.html#smoothedrun.next_slot',
+                                                                                  'tk_slack/smoothing.py'),
+                                    'tk_slack.smoothing.SmoothedRun.wrap': ( 'API/smoothing.html#smoothedrun.wrap',
+                                                                             'tk_slack/smoothing.py')},
             'tk_slack.snowflake_connector': { 'tk_slack.snowflake_connector.SnowflakeConnector': ( 'API/snowflake_connector.html#snowflakeconnector',
                                                                                                    'tk_slack/snowflake_connector.py'),
                                               'tk_slack.snowflake_connector.SnowflakeConnector.__del__': ( 'API/snowflake_connector.html#snowflakeconnector.__del__',
@@ -152,6 +641,39 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                          'tk_slack/snowflake_connector.py'),
                                               'tk_slack.snowflake_connector.SnowflakeConnector.insert_record': ( 'API/snowflake_connector.html#snowflakeconnector.insert_record',
                                                                                                                  'tk_slack/snowflake_connector.py')},
+            'tk_slack.state_store': { 'tk_slack.state_store.FileStateStore': ( 'API/state_store.html#filestatestore',
+                                                                               'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.FileStateStore.__init__': ( 'API/state_store.html#filestatestore.__init__',
+                                                                                        'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.FileStateStore._save': ( 'API/state_store.html#filestatestore._save',
+                                                                                     'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.SQLiteStateStore': ( 'API/state_store.html#sqlitestatestore',
+                                                                                 'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.SQLiteStateStore.__init__': ( 'API/state_store.html#sqlitestatestore.__init__',
+                                                                                          'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.SQLiteStateStore.close': ( 'API/state_store.html#sqlitestatestore.close',
+                                                                                       'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.SQLiteStateStore.delete': ( 'API/state_store.html#sqlitestatestore.delete',
+                                                                                        'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.SQLiteStateStore.get': ( 'API/state_store.html#sqlitestatestore.get',
+                                                                                     'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.SQLiteStateStore.put': ( 'API/state_store.html#sqlitestatestore.put',
+                                                                                     'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.StateStore': ('API/state_store.html#statestore', 'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.StateStore.__init__': ( 'API/state_store.html#statestore.__init__',
+                                                                                    'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.StateStore._save': ( 'API/state_store.html#statestore._save',
+                                                                                 'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.StateStore.delete': ( 'API/state_store.html#statestore.delete',
+                                                                                  'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.StateStore.get': ( 'API/state_store.html#statestore.get',
+                                                                               'tk_slack/state_store.py'),
+                                      'tk_slack.state_store.StateStore.put': ( 'API/state_store.html#statestore.put',
+                                                                               'tk_slack/state_store.py')},
+            'tk_slack.streaming': { 'tk_slack.streaming._ProducerError': ('API/streaming.html#_producererror', 'tk_slack/streaming.py'),
+                                    'tk_slack.streaming._ProducerError.__init__': ( 'API/streaming.html#_producererror.__init__',
+                                                                                    'tk_slack/streaming.py'),
+                                    'tk_slack.streaming.stream_ahead': ('API/streaming.html#stream_ahead', 'tk_slack/streaming.py')},
             'tk_slack.template_engine': { 'tk_slack.template_engine.TemplateEngine': ( 'API/template_engine.html#templateengine',
                                                                                        'tk_slack/template_engine.py'),
                                           'tk_slack.template_engine.TemplateEngine._extract_detail_fields': ( 'API/template_engine.html#templateengine._extract_detail_fields',
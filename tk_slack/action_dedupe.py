@@ -0,0 +1,181 @@
+"""Dropping duplicate deliveries and double clicks of Slack actions"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/23_action_dedupe.ipynb.
+
+# %% auto 0
+__all__ = ['ActionDeduplicator']
+
+# %% ../nbs/API/23_action_dedupe.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from . import serialization
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+import threading
+import sqlite3
+import time
+
+# %% ../nbs/API/23_action_dedupe.ipynb 5
+class ActionDeduplicator:
+    """
+    TTL and size bounded set of recent Slack actions, optionally shared through SQLite.
+    """
+    
+    # Action data fields holding the selected value, depending on the action type
+    VALUE_FIELDS = ('value', 'values', 'selected_options', 'selected_date', 'selected_user', 'selected_channel')
+    
+    def __init__(self, 
+                 ttl: float = 300.0, 
+                 max_size: int = 10000, 
+                 store_path: Optional[str] = None, 
+                 table: str = 'action_dedupe'):
+        """Initialize the deduplicator.
+        
+        Args:
+            ttl: Seconds during which a repeat of an action is a duplicate
+            max_size: Maximum number of actions kept in memory
+            store_path: Path of an SQLite database shared between processes (or None)
+            table: Table name in the shared database
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.table = table
+        self.stats = {'checked': 0, 'duplicates': 0, 'memory_hits': 0, 'store_hits': 0}
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if store_path is not None:
+            self._conn = sqlite3.connect(store_path, check_same_thread=False, timeout=30)
+            with self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        action_key TEXT PRIMARY KEY,
+                        action_value TEXT NOT NULL,
+                        expires_at REAL NOT NULL
+                    )
+                """)
+    
+    def close(self):
+        """Close the shared database, if any."""
+        if self._conn is not None:
+            self._conn.close()
+    
+    @classmethod
+    def action_key(cls, action_data: Dict[str, Any]) -> str:
+        """Get the key of the element an action is on: user, message and action ID.
+        
+        Args:
+            action_data: Action data from `ActionHandler.process_slack_action`
+            
+        Returns:
+            Key string
+        """
+        return serialization.dumps([
+            action_data.get('user_id'), action_data.get('message_ts'), action_data.get('action_id')
+        ])
+    
+    @classmethod
+    def action_value(cls, action_data: Dict[str, Any]) -> str:
+        """Get the value selected by an action (button value, select options, date, user or channel).
+        
+        Args:
+            action_data: Action data from `ActionHandler.process_slack_action`
+            
+        Returns:
+            Value string
+        """
+        return serialization.dumps([action_data.get(field) for field in cls.VALUE_FIELDS])
+
+# %% ../nbs/API/23_action_dedupe.ipynb 6
+@patch_to(ActionDeduplicator)
+def _seen_in_memory(self, key: str, value: str, now: float) -> bool:
+    """Check whether a key was last seen with the same value, claiming it with `value` otherwise."""
+    with self._lock:
+        seen = self._seen.get(key)
+        if seen is not None and seen[0] == value and seen[1] > now:
+            return True
+        
+        # Keys are kept in the order they expire in: a claim moves its key to the end
+        self._seen.pop(key, None)
+        self._seen[key] = (value, now + self.ttl)
+        
+        # Drop expired keys from the oldest end, then the oldest ones beyond `max_size`
+        while self._seen:
+            oldest_value, oldest_expiry = next(iter(self._seen.values()))
+            if oldest_expiry > now and len(self._seen) <= self.max_size:
+                break
+            self._seen.popitem(last=False)
+        return False
+
+@patch_to(ActionDeduplicator)
+def _seen_in_store(self, key: str, value: str, now: float) -> bool:
+    """Claim a key with `value` in the shared database, returning whether another process claimed it first."""
+    with self._lock, self._conn:
+        # Take over the key when its claim expired or was for another value, or claim it if it's new
+        claimed = self._conn.execute(
+            f"UPDATE {self.table} SET action_value = ?, expires_at = ? "
+            f"WHERE action_key = ? AND (expires_at <= ? OR action_value <> ?)", 
+            (value, now + self.ttl, key, now, value)
+        ).rowcount or self._conn.execute(
+            f"INSERT OR IGNORE INTO {self.table} (action_key, action_value, expires_at) VALUES (?, ?, ?)", 
+            (key, value, now + self.ttl)
+        ).rowcount
+    return claimed == 0
+
+@patch_to(ActionDeduplicator)
+def is_duplicate(self, action_data: Dict[str, Any]) -> bool:
+    """Check whether an action was the last one seen on its element within the TTL, claiming it otherwise.
+    
+    Only a repeat of the latest value is a duplicate: choosing A, then B, then A again
+    on the same select lets the three actions through.
+    
+    Args:
+        action_data: Action data from `ActionHandler.process_slack_action`
+        
+    Returns:
+        True if the action is a duplicate to drop
+    """
+    key, value = self.action_key(action_data), self.action_value(action_data)
+    now = time.time()
+    
+    # The shared database, when there is one, knows the latest values selected in the other processes
+    hit = None
+    if self._conn is not None:
+        if self._seen_in_store(key, value, now):
+            hit = 'store_hits'
+    elif self._seen_in_memory(key, value, now):
+        hit = 'memory_hits'
+    
+    with self._lock:
+        self.stats['checked'] += 1
+        if hit is not None:
+            self.stats[hit] += 1
+            self.stats['duplicates'] += 1
+    return hit is not None
+
+@patch_to(ActionDeduplicator)
+def release(self, action_data: Dict[str, Any]):
+    """Forget the claim of an action whose processing failed, so that its retry goes through.
+    
+    Args:
+        action_data: Action data passed to `is_duplicate`
+    """
+    key, value = self.action_key(action_data), self.action_value(action_data)
+    with self._lock:
+        if self._seen.get(key, (None,))[0] == value:
+            del self._seen[key]
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE action_key = ? AND action_value = ?", (key, value))
+
+@patch_to(ActionDeduplicator)
+def purge(self):
+    """Forget the expired actions, in memory and in the shared database."""
+    now = time.time()
+    with self._lock:
+        for key in [key for key, (value, expires_at) in self._seen.items() if expires_at <= now]:
+            del self._seen[key]
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (now,))
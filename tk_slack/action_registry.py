@@ -0,0 +1,113 @@
+"""Dispatch of Slack interactive actions to handlers by action type and view"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/22_action_registry.ipynb.
+
+# %% auto 0
+__all__ = ['ActionRoute', 'ActionRegistry']
+
+# %% ../nbs/API/22_action_registry.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from typing import Dict, Any, Callable, Optional, Tuple
+import threading
+
+# %% ../nbs/API/22_action_registry.ipynb 5
+class ActionRoute:
+    """
+    How the actions of a type (and optionally of a view) are handled.
+    """
+    
+    def __init__(self, handler: Optional[Callable] = None, store: bool = True, respond: bool = True):
+        """Initialize the route.
+        
+        Args:
+            handler: Function called with (action_data, body, respond) instead of the built-in response;
+                it may return the action data to store
+            store: Store the action in Snowflake
+            respond: Send the built-in response, when there is no `handler`
+        """
+        self.handler = handler
+        self.store = store
+        self.respond = respond
+    
+    def __repr__(self):
+        handler = getattr(self.handler, '__name__', self.handler)
+        return f'ActionRoute(handler={handler}, store={self.store}, respond={self.respond})'
+
+# %% ../nbs/API/22_action_registry.ipynb 6
+class ActionRegistry:
+    """
+    Routes of Slack actions, keyed by action type and view.
+    """
+    
+    def __init__(self, default: Optional[ActionRoute] = None):
+        """Initialize the registry.
+        
+        Args:
+            default: Route of the actions without a registered route (the built-in handling)
+        """
+        self.default = default or ActionRoute()
+        self._routes = {}
+        self._lock = threading.Lock()
+    
+    def register(self, 
+                 action_type: Optional[str] = None, 
+                 handler: Optional[Callable] = None, 
+                 view: Optional[str] = None, 
+                 store: bool = True, 
+                 respond: bool = True) -> ActionRoute:
+        """Register a route.
+        
+        Args:
+            action_type: Slack action type (e.g. 'button', 'static_select'), None for all types
+            handler: Function called with (action_data, body, respond) instead of the built-in response
+            view: View name, None for all views
+            store: Store the actions in Snowflake
+            respond: Send the built-in response, when there is no `handler`
+            
+        Returns:
+            The registered route
+        """
+        route = ActionRoute(handler, store=store, respond=respond)
+        with self._lock:
+            self._routes[(action_type, view)] = route
+        return route
+    
+    def action(self, action_type: Optional[str] = None, view: Optional[str] = None, store: bool = True) -> Callable:
+        """Decorator registering a handler, like Bolt's `app.action`.
+        
+        Args:
+            action_type: Slack action type, None for all types
+            view: View name, None for all views
+            store: Store the actions in Snowflake
+            
+        Returns:
+            Decorator registering the function and returning it unchanged
+        """
+        def decorator(handler):
+            self.register(action_type, handler, view=view, store=store)
+            return handler
+        return decorator
+    
+    def unregister(self, action_type: Optional[str] = None, view: Optional[str] = None):
+        """Remove a route, going back to the next most specific one."""
+        with self._lock:
+            self._routes.pop((action_type, view), None)
+    
+    def resolve(self, action_type: Optional[str], view: Optional[str] = None) -> ActionRoute:
+        """Get the route of an action.
+        
+        Args:
+            action_type: Slack action type
+            view: View the action's message was sent for
+            
+        Returns:
+            The most specific registered route, or the default route
+        """
+        routes = self._routes
+        route = routes.get((action_type, view))
+        if route is None:
+            route = routes.get((action_type, None))
+        if route is None and view is not None:
+            route = routes.get((None, view))
+        return route if route is not None else self.default
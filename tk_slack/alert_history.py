@@ -0,0 +1,133 @@
+"""Collect the alert history of a send run and log it in one batch"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/15_alert_history.ipynb.
+
+# %% auto 0
+__all__ = ['AlertHistoryBatch']
+
+# %% ../nbs/API/15_alert_history.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from .core import SlackMessenger
+from typing import List, Dict, Any, Callable, Optional
+import pandas as pd
+
+# %% ../nbs/API/15_alert_history.ipynb 5
+class AlertHistoryBatch:
+    """
+    Collects alert history records and hands them over in one batch.
+    """
+    
+    COLUMNS = ['related_view', 'team', 'channel', 'rows_grouped', 'row_num', 
+               'data', 'was_success', 'error_details', 'message_details']
+    
+    def __init__(self):
+        self._records = []
+        self._frames = []
+    
+    def __len__(self) -> int:
+        return len(self._records)
+
+# %% ../nbs/API/15_alert_history.ipynb 6
+@patch_to(AlertHistoryBatch)
+def add(
+    self,
+    view: str,
+    view_group: str,
+    channel_id: str,
+    success: bool,
+    error_details: Optional[Dict[str, Any]],
+    row_data: pd.DataFrame,
+    message_text: str
+):
+    """Add the record of one sent message; its rows are formatted later, with the whole batch,
+    unless the renderer already formatted them.
+    
+    Args:
+        view: View name
+        view_group: Group name for the view
+        channel_id: Slack channel ID
+        success: Whether the alert was sent successfully
+        error_details: Details of any error
+        row_data: Rows the message was built from
+        message_text: Main message text
+    """
+    data = row_data.attrs.get(SlackMessenger.LOGGING_DATA_ATTR)
+    self._records.append(SlackMessenger._alert_record(
+        view, view_group, channel_id, success, error_details, data, message_text
+    ))
+    self._frames.append(row_data if data is None else None)
+
+@patch_to(AlertHistoryBatch)
+def records(self) -> List[Dict[str, Any]]:
+    """Get the records, formatting the rows of all pending records in one pass.
+    
+    Returns:
+        List of alert history records
+    """
+    # Frames with the same columns and dtypes (e.g. all the rows of a view) are formatted together;
+    # concatenating frames of different dtypes would upcast their values (e.g. int to float)
+    groups = {}
+    for pos, frame in enumerate(self._frames):
+        if frame is not None:
+            groups.setdefault((tuple(frame.columns), tuple(map(str, frame.dtypes))), []).append(pos)
+    
+    for positions in groups.values():
+        frames = [self._frames[pos] for pos in positions]
+        data = SlackMessenger._format_data_for_logging(pd.concat(frames, ignore_index=True))
+        start = 0
+        for pos, frame in zip(positions, frames):
+            self._records[pos]['data'] = data[start:start + len(frame)]
+            self._frames[pos] = None
+            start += len(frame)
+    
+    return self._records
+
+@patch_to(AlertHistoryBatch)
+def to_dataframe(self) -> pd.DataFrame:
+    """Get the records as a DataFrame, with one row per record and a column per field."""
+    return pd.DataFrame(self.records(), columns=self.COLUMNS)
+
+@patch_to(AlertHistoryBatch)
+def clear(self):
+    """Drop all records."""
+    self._records = []
+    self._frames = []
+
+# %% ../nbs/API/15_alert_history.ipynb 7
+@patch_to(AlertHistoryBatch)
+def flush(self, log_alert_history_batch_func: Callable) -> bool:
+    """Hand the records over as one DataFrame and clear the batch.
+    
+    Args:
+        log_alert_history_batch_func: Function taking a DataFrame of alert history records
+        
+    Returns:
+        True if the records were logged (or there were none)
+    """
+    if not self._records:
+        return True
+    try:
+        log_alert_history_batch_func(self.to_dataframe())
+        return True
+    except Exception as e:
+        print(f"Error logging alert history: {e}")
+        return False
+    finally:
+        self.clear()
+
+@patch_to(AlertHistoryBatch, cls_method=True)
+def bulk_insert_func(cls, connector, table_name: str, **kwargs) -> Callable:
+    """Get a batch logging function writing the records to Snowflake with one bulk load.
+    
+    Args:
+        connector: `SnowflakeConnector` to write with
+        table_name: Alert history table
+        **kwargs: Options for `SnowflakeConnector.bulk_insert`
+        
+    Returns:
+        Function taking a DataFrame of alert history records
+    """
+    def log_alert_history_batch(df: pd.DataFrame):
+        return connector.bulk_insert(table_name, df, **kwargs)
+    return log_alert_history_batch
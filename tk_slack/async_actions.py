@@ -0,0 +1,114 @@
+"""Batched, off-loop persistence of Slack actions handled on an asyncio event loop"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/24_async_actions.ipynb.
+
+# %% auto 0
+__all__ = ['AsyncActionWriter']
+
+# %% ../nbs/API/24_async_actions.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from typing import List, Dict, Any, Callable, Optional
+from concurrent.futures import Executor
+import asyncio
+
+# %% ../nbs/API/24_async_actions.ipynb 5
+class AsyncActionWriter:
+    """
+    Writes actions queued from an event loop in batches, in a thread pool.
+    """
+    
+    def __init__(self, 
+                 write_func: Callable[[List[Dict[str, Any]]], Any], 
+                 batch_size: int = 100, 
+                 flush_interval: float = 0.5, 
+                 max_pending: int = 10000,
+                 executor: Optional[Executor] = None):
+        """Initialize the writer.
+        
+        Args:
+            write_func: Blocking function storing a list of action data
+            batch_size: Maximum number of actions per call of `write_func`
+            flush_interval: Seconds to wait for more actions before writing a partial batch
+            max_pending: Maximum number of queued actions before `put` waits
+            executor: Executor running `write_func` (defaults to the event loop's)
+        """
+        self.write_func = write_func
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.executor = executor
+        self.stats = {'queued': 0, 'written': 0, 'batches': 0, 'errors': 0}
+        self._queue = None
+        self._task = None
+    
+    def _ensure_started(self):
+        """Create the queue and the writing task on the running event loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+# %% ../nbs/API/24_async_actions.ipynb 6
+@patch_to(AsyncActionWriter)
+async def put(self, action_data: Dict[str, Any]):
+    """Queue an action to be written."""
+    self._ensure_started()
+    await self._queue.put(action_data)
+    self.stats['queued'] += 1
+
+@patch_to(AsyncActionWriter)
+async def _next_batch(self) -> List[Dict[str, Any]]:
+    """Wait for an action, then collect more until the batch is full or the interval is over."""
+    loop = asyncio.get_running_loop()
+    batch = [await self._queue.get()]
+    deadline = loop.time() + self.flush_interval
+    while len(batch) < self.batch_size:
+        try:
+            batch.append(self._queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+@patch_to(AsyncActionWriter)
+async def _run(self):
+    """Write batches of queued actions until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = await self._next_batch()
+        try:
+            await loop.run_in_executor(self.executor, self.write_func, batch)
+            self.stats['written'] += len(batch)
+            self.stats['batches'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"Error writing {len(batch)} actions: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+@patch_to(AsyncActionWriter)
+async def flush(self):
+    """Wait until all queued actions are written."""
+    if self._queue is not None:
+        await self._queue.join()
+
+@patch_to(AsyncActionWriter)
+async def close(self):
+    """Write the queued actions, then stop the writing task."""
+    await self.flush()
+    if self._task is not None:
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
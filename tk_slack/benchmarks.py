@@ -0,0 +1,221 @@
+"""Rendering benchmarks of the message templates, saved as JSON to compare versions"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/28_benchmarks.ipynb.
+
+# %% auto 0
+__all__ = ['BENCHMARKS', 'make_alert_frame', 'run_benchmarks', 'compare_benchmarks']
+
+# %% ../nbs/API/28_benchmarks.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+import tk_slack
+from .core import ColumnUtils, ValueFormatter, SlackMessenger
+from .template_engine import TemplateEngine
+from .message_templates import MessageTemplate
+from .parallel_render import ParallelRenderer
+from .slack_client import SlackAPIResponse
+from . import serialization
+from typing import List, Dict, Any, Callable, Optional, Sequence, Union
+from contextlib import redirect_stdout
+import datetime
+import io
+import platform
+import random
+import statistics
+import time
+import weakref
+
+import numpy as np
+import pandas as pd
+
+# %% ../nbs/API/28_benchmarks.ipynb 5
+_COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Stark', 'Wayne', 'Wonka', 'Tyrell', 'Cyberdyne', 'Soylent']
+_SUFFIXES = ['Corp', 'Industries', 'Holdings', 'Labs', 'Group', 'Partners']
+_STAGES = ['Lead', 'Qualified', 'Proposal', 'Negotiation', 'Won', 'Lost']
+_OWNERS = ['Ana Lopez', 'Ben Carter', 'Chloe Kim', 'Dev Patel']
+
+def make_alert_frame(rows: int, detail_cols: int = 6, seed: int = 0) -> pd.DataFrame:
+    """Generate a synthetic alert DataFrame.
+    
+    Args:
+        rows: Number of rows
+        detail_cols: Number of detail columns (at most 8)
+        seed: Random seed
+        
+    Returns:
+        DataFrame with title, Copper ID, `_meta`, detail, option, config and message text columns
+    """
+    rng = random.Random(seed)
+    pick = lambda values: [rng.choice(values) for _ in range(rows)]
+    maybe = lambda values, rate=0.1: [None if rng.random() < rate else value for value in values]
+    start = datetime.datetime(2024, 1, 1)
+    
+    details = {
+        'AMOUNT': maybe([round(rng.uniform(1000, 250000), 2) for _ in range(rows)]),
+        'STAGE': pick(_STAGES),
+        'CLOSE_DATE': [pd.Timestamp(start + datetime.timedelta(days=rng.randrange(365))) for _ in range(rows)],
+        'PROBABILITY': maybe([rng.random() for _ in range(rows)], 0.2),
+        'SEATS': [rng.randrange(1, 500) for _ in range(rows)],
+        'TAGS': [rng.sample(['enterprise', 'renewal', 'upsell', 'churn-risk', 'pilot'], rng.randint(0, 3)) for _ in range(rows)],
+        'NOTES': maybe([' '.join(rng.choice(_STAGES + _COMPANIES).lower() for _ in range(rng.randint(5, 40))) for _ in range(rows)], 0.3),
+        'IS_STRATEGIC': [rng.random() < 0.2 for _ in range(rows)],
+    }
+    
+    options = [(['Approve', 'Snooze', 'Dismiss'], ['approve', 'snooze', 'dismiss']), 
+               ([f'Stage {s}' for s in _STAGES], [s.lower() for s in _STAGES]),
+               (['Follow-up date'], ['2024-06-01'])]
+    option_rows = pick(options)
+    return pd.DataFrame({
+        'NAME': [f'{rng.choice(_COMPANIES)} {rng.choice(_SUFFIXES)}' for _ in range(rows)],
+        'COPPER_ID': pd.array(maybe([rng.randrange(10 ** 6, 10 ** 8) for _ in range(rows)]), dtype='Int64'),
+        'OWNER_meta': pick(_OWNERS),
+        'REGION_meta': pick(['EMEA', 'AMER', 'APAC']),
+        **dict(list(details.items())[:detail_cols]),
+        'OPTION_NAME': [names for names, _ in option_rows],
+        'OPTION_VALUE': [values for _, values in option_rows],
+        'CONFIG': [serialization.dumps({'response_message': 'Thanks {user}, noted: {value}', 
+                                        'replace_original': rng.random() < 0.5}) for _ in range(rows)],
+        'MESSAGE_TEXT': [f'Deal update {i}' for i in range(rows)],
+    })
+
+# %% ../nbs/API/28_benchmarks.ipynb 8
+def _post_stub(channel, text, payload_blocks=None, **kwargs):
+    return SlackAPIResponse(200, {}, b'{"ok": true, "ts": "1700000000.000001"}')
+
+def _send_stub(payload, message_id, **kwargs):
+    return True, None, {'ok': True, 'ts': '1700000000.000001'}
+
+def _bench_template_f1(df: pd.DataFrame) -> Callable:
+    return lambda: MessageTemplate.template_f1(df, 'deals', 'sales', 'New deals', 'C1', {}, 
+                                               send_to_slack_func=_post_stub, 
+                                               log_alert_history_batch_func=lambda records: None)
+
+def _bench_template_f2(df: pd.DataFrame) -> Callable:
+    return lambda: MessageTemplate.template_f2(df, 'deals', 'sales', 'New deals', 'C1', {}, 
+                                               send_to_slack_func=_send_stub, 
+                                               log_alert_history_batch_func=lambda records: None)
+
+def _bench_template_f2_parallel(df: pd.DataFrame) -> Callable:
+    # Two chunks per worker; the pool is started by the warm-up run and shut down with the call
+    renderer = ParallelRenderer(min_rows=0)
+    renderer.chunk_size = max(1, -(-len(df) // (2 * renderer.workers)))
+    call = lambda: MessageTemplate.template_f2(df, 'deals', 'sales', 'New deals', 'C1', {}, 
+                                               send_to_slack_func=_send_stub, 
+                                               log_alert_history_batch_func=lambda records: None,
+                                               renderer=renderer)
+    weakref.finalize(call, renderer.close)
+    return call
+
+def _bench_build_individual_message_blocks(df: pd.DataFrame) -> Callable:
+    df_columns = list(df.columns)
+    col_map = ColumnUtils.normalize_columns(df_columns)
+    rows = [row for _, row in df.iterrows()]
+    configs = [TemplateEngine._parse_row_config(row, {'view': 'deals', 'view_group': 'sales'}, col_map) for row in rows]
+    return lambda: [TemplateEngine.build_individual_message_blocks(row, df_columns, col_map, config) 
+                    for row, config in zip(rows, configs)]
+
+def _bench_format_value(df: pd.DataFrame) -> Callable:
+    values = [value for column in df.columns for value in df[column].tolist()]
+    return lambda: [ValueFormatter.format_value(value) for value in values]
+
+def _bench_format_data_for_logging(df: pd.DataFrame) -> Callable:
+    return lambda: SlackMessenger._format_data_for_logging(df)
+
+# Benchmarks by name, each taking a frame and returning the call to time
+BENCHMARKS = {
+    'template_f1': _bench_template_f1,
+    'template_f2': _bench_template_f2,
+    'template_f2_parallel': _bench_template_f2_parallel,
+    'build_individual_message_blocks': _bench_build_individual_message_blocks,
+    'format_value': _bench_format_value,
+    'format_data_for_logging': _bench_format_data_for_logging,
+}
+
+# %% ../nbs/API/28_benchmarks.ipynb 9
+def run_benchmarks(sizes: Sequence[int] = (10, 100, 1000), 
+                   repeat: int = 5, 
+                   benchmarks: Optional[Sequence[str]] = None, 
+                   path: Optional[str] = None) -> Dict[str, Any]:
+    """Time the benchmarks at several frame sizes.
+    
+    Args:
+        sizes: Numbers of rows of the generated frames
+        repeat: Number of timed runs of each benchmark (after one warm-up run)
+        benchmarks: Names of the benchmarks to run, from `BENCHMARKS` (all by default)
+        path: JSON file to save the results to
+        
+    Returns:
+        Results, with the versions they were measured with and, for each benchmark and size,
+        the best and median seconds per run and the best microseconds per row
+    """
+    results = []
+    for rows in sizes:
+        df = make_alert_frame(rows)
+        for name in benchmarks or BENCHMARKS:
+            call = BENCHMARKS[name](df)
+            timings = []
+            # Templates print their progress, keep it out of the output
+            with redirect_stdout(io.StringIO()):
+                call()
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    call()
+                    timings.append(time.perf_counter() - start)
+            results.append({
+                'benchmark': name,
+                'rows': rows,
+                'repeat': repeat,
+                'best': min(timings),
+                'median': statistics.median(timings),
+                'per_row_us': 1e6 * min(timings) / rows,
+            })
+    
+    report = {
+        'tk_slack': tk_slack.__version__,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'results': results,
+    }
+    if path:
+        with open(path, 'w') as f:
+            f.write(serialization.dumps(report))
+    return report
+
+# %% ../nbs/API/28_benchmarks.ipynb 10
+def compare_benchmarks(baseline: Union[str, Dict[str, Any]], 
+                       current: Union[str, Dict[str, Any]], 
+                       threshold: float = 0.1) -> List[Dict[str, Any]]:
+    """Compare the results of two benchmark runs.
+    
+    Args:
+        baseline: Results of the reference run, or the JSON file they were saved to
+        current: Results of the run to check, or the JSON file they were saved to
+        threshold: Relative slowdown of the best time above which a benchmark is a regression
+        
+    Returns:
+        For each benchmark and size measured in both runs, the best times, their ratio
+        (current / baseline) and whether it's a regression
+    """
+    def load(results):
+        if isinstance(results, str):
+            with open(results) as f:
+                results = serialization.loads(f.read())
+        return {(r['benchmark'], r['rows']): r for r in results['results']}
+    
+    baseline, current = load(baseline), load(current)
+    comparison = []
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        ratio = result['best'] / baseline[key]['best']
+        comparison.append({
+            'benchmark': key[0],
+            'rows': key[1],
+            'baseline': baseline[key]['best'],
+            'current': result['best'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+    return comparison
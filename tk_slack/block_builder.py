@@ -8,7 +8,6 @@ from fastcore.basics import patch_to
 from fastcore.test import *
 from typing import List, Tuple, Dict, Any, Callable, Optional
 import pandas as pd
-import json
 
 # %% ../nbs/API/02_block_builder.ipynb 5
 class BlockBuilder:
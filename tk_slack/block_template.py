@@ -0,0 +1,169 @@
+"""Pre-serialized Slack block skeletons with value slots"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/08_block_template.ipynb.
+
+# %% auto 0
+__all__ = ['Slot', 'BlockTemplate']
+
+# %% ../nbs/API/08_block_template.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from typing import List, Tuple, Dict, Any, Callable, Optional
+from json.encoder import encode_basestring
+from . import serialization
+
+# %% ../nbs/API/08_block_template.ipynb 6
+class Slot:
+    """
+    Placeholder for a value that is filled in when a `BlockTemplate` is rendered.
+    
+    A slot can stand in for a whole JSON value (string, list, dict, ...) or be
+    embedded in a string, e.g. by the f-strings in `BlockBuilder.create_field`.
+    Embedded slots are tracked with a private-use character as a marker.
+    """
+    
+    MARKER = "\ue000"
+    
+    def __init__(self, name: str):
+        """Initialize the slot.
+        
+        Args:
+            name: Name of the value to fill in at render time (must be an identifier)
+        """
+        if not isinstance(name, str) or not name.isidentifier():
+            raise ValueError(f"Slot name must be a valid identifier, got {name!r}")
+        self.name = name
+    
+    def __str__(self) -> str:
+        return f"{Slot.MARKER}{self.name}{Slot.MARKER}"
+    
+    def __format__(self, format_spec: str) -> str:
+        return str(self)
+    
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+# %% ../nbs/API/08_block_template.ipynb 10
+class BlockTemplate:
+    """
+    Compiled Slack payload skeleton.
+    
+    The static structure is serialized once at construction; `render` only
+    escapes the slot values and joins them with the pre-serialized pieces.
+    """
+    
+    def __init__(self, description: Any):
+        """Compile a template from a block (or full message) description.
+        
+        Args:
+            description: Blocks, a list of blocks, or a whole message payload as
+                produced by the existing builders, with `Slot` placeholders
+        """
+        self._static: List[str] = []
+        self._slots: List[Tuple[str, bool]] = []
+        self._buffer: List[str] = []
+        self._compile(description)
+        self._static.append(''.join(self._buffer))
+        del self._buffer
+    
+    @property
+    def slots(self) -> List[str]:
+        """Names of the slots in render order (a name appears once per use)."""
+        return [name for name, _ in self._slots]
+
+# %% ../nbs/API/08_block_template.ipynb 12
+@patch_to(BlockTemplate)
+def _emit_slot(self, name: str, embedded: bool):
+    """Close the current static piece and record a slot."""
+    self._static.append(''.join(self._buffer))
+    self._buffer = []
+    self._slots.append((name, embedded))
+
+@patch_to(BlockTemplate)
+def _compile_string(self, text: str):
+    """Compile a string, splitting out any embedded slot markers."""
+    if Slot.MARKER not in text:
+        self._buffer.append(encode_basestring(text))
+        return
+    
+    pieces = text.split(Slot.MARKER)
+    if len(pieces) % 2 == 0:
+        raise ValueError(f"Unbalanced slot marker in {text!r}")
+    
+    self._buffer.append('"')
+    for i, piece in enumerate(pieces):
+        if i % 2:
+            self._emit_slot(piece, embedded=True)
+        elif piece:
+            self._buffer.append(encode_basestring(piece)[1:-1])
+    self._buffer.append('"')
+
+@patch_to(BlockTemplate)
+def _compile(self, obj: Any):
+    """Serialize `obj` into the static pieces, recording slots as they appear."""
+    if isinstance(obj, Slot):
+        self._emit_slot(obj.name, embedded=False)
+    elif isinstance(obj, str):
+        self._compile_string(obj)
+    elif isinstance(obj, dict):
+        self._buffer.append('{')
+        for i, (key, value) in enumerate(obj.items()):
+            if not isinstance(key, str) or Slot.MARKER in key:
+                raise TypeError(f"Block keys must be static strings, got {key!r}")
+            if i: self._buffer.append(',')
+            self._buffer.append(encode_basestring(key) + ':')
+            self._compile(value)
+        self._buffer.append('}')
+    elif isinstance(obj, (list, tuple)):
+        self._buffer.append('[')
+        for i, value in enumerate(obj):
+            if i: self._buffer.append(',')
+            self._compile(value)
+        self._buffer.append(']')
+    else:
+        self._buffer.append(serialization.dumps(obj))
+
+# %% ../nbs/API/08_block_template.ipynb 14
+@patch_to(BlockTemplate)
+def render_str(self, values: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+    """Render the template to a JSON string.
+    
+    Args:
+        values: Mapping of slot names to values
+        **kwargs: Slot values given as keyword arguments
+        
+    Returns:
+        JSON text of the filled-in payload
+    """
+    if kwargs: values = {**(values or {}), **kwargs}
+    elif values is None: values = {}
+    
+    parts = [self._static[0]]
+    for (name, embedded), tail in zip(self._slots, self._static[1:]):
+        try:
+            value = values[name]
+        except KeyError:
+            raise KeyError(f"No value given for slot '{name}'") from None
+        
+        if embedded:
+            parts.append(encode_basestring(str(value))[1:-1])
+        elif isinstance(value, str):
+            parts.append(encode_basestring(value))
+        else:
+            parts.append(serialization.dumps(value))
+        parts.append(tail)
+        
+    return ''.join(parts)
+
+@patch_to(BlockTemplate)
+def render(self, values: Optional[Dict[str, Any]] = None, **kwargs) -> bytes:
+    """Render the template to UTF-8 encoded JSON bytes, ready to send.
+    
+    Args:
+        values: Mapping of slot names to values
+        **kwargs: Slot values given as keyword arguments
+        
+    Returns:
+        JSON bytes of the filled-in payload
+    """
+    return self.render_str(values, **kwargs).encode('utf-8')
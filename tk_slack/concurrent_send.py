@@ -0,0 +1,123 @@
+"""Send Slack messages concurrently while keeping results in order"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/12_concurrent_send.ipynb.
+
+# %% auto 0
+__all__ = ['ConcurrentSender']
+
+# %% ../nbs/API/12_concurrent_send.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from typing import Tuple, Dict, Any, Callable, Optional, Iterable, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor, Future
+from collections import deque
+import threading
+
+# %% ../nbs/API/12_concurrent_send.ipynb 5
+class ConcurrentSender:
+    """
+    Runs send calls in a thread pool with global and per-channel concurrency limits.
+    
+    The pool is created on first use and reused across calls; use the sender as
+    a context manager (or call `close`) to shut the threads down.
+    """
+    
+    def __init__(self, 
+                 max_workers: int = 8, 
+                 per_channel: Optional[int] = None,
+                 max_pending: Optional[int] = None):
+        """Initialize the sender.
+        
+        Args:
+            max_workers: Maximum number of sends in flight overall
+            per_channel: Maximum number of sends in flight per channel (defaults to `max_workers`)
+            max_pending: Maximum number of items taken ahead of the results (defaults to 2 per worker)
+        """
+        self.max_workers = max(1, max_workers)
+        self.per_channel = max(1, per_channel or self.max_workers)
+        self.max_pending = max_pending or 2 * self.max_workers
+        self._executor = None
+        self._channel_slots = {}
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+# %% ../nbs/API/12_concurrent_send.ipynb 6
+@patch_to(ConcurrentSender)
+def _get_executor(self) -> ThreadPoolExecutor:
+    """Get the thread pool, creating it if needed."""
+    with self._lock:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='tk_slack-send')
+        return self._executor
+
+@patch_to(ConcurrentSender)
+def close(self):
+    """Shut down the sending threads if they were started."""
+    if self._executor is not None:
+        self._executor.shutdown()
+        self._executor = None
+
+@patch_to(ConcurrentSender)
+def _channel_slot(self, channel: Optional[str]) -> threading.BoundedSemaphore:
+    """Get the semaphore limiting the concurrent sends to a channel."""
+    with self._lock:
+        if channel not in self._channel_slots:
+            self._channel_slots[channel] = threading.BoundedSemaphore(self.per_channel)
+        return self._channel_slots[channel]
+
+# %% ../nbs/API/12_concurrent_send.ipynb 7
+@patch_to(ConcurrentSender)
+def _call(self, func: Callable, item: Any, channel: Optional[str]) -> Tuple[Any, Optional[Exception]]:
+    """Call `func(item)` within the channel's limit, returning (result, error)."""
+    with self._channel_slot(channel):
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+@patch_to(ConcurrentSender)
+def map(
+    self, 
+    func: Callable, 
+    items: Iterable[Any], 
+    channel: Union[str, Callable, None] = None
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """Call `func` on every item concurrently, yielding the outcomes in input order.
+    
+    Exceptions raised by `func` do not stop the other sends; they are returned
+    as the error of their item.
+    
+    Args:
+        func: Send function taking a single item
+        items: Items to send (consumed lazily)
+        channel: Channel ID of all items, or a function returning the channel ID of an item
+        
+    Yields:
+        (item, result, error) tuples, with error None when `func` returned normally
+    """
+    channel_of = channel if callable(channel) else (lambda item: channel)
+    
+    if self.max_workers == 1:
+        for item in items:
+            yield (item, *self._call(func, item, channel_of(item)))
+        return
+    
+    executor = self._get_executor()
+    pending = deque()
+    
+    for item in items:
+        pending.append((item, executor.submit(self._call, func, item, channel_of(item))))
+        
+        # Keep a bounded number of items in flight, yielding the oldest first
+        if len(pending) >= self.max_pending:
+            item, future = pending.popleft()
+            yield (item, *future.result())
+            
+    while pending:
+        item, future = pending.popleft()
+        yield (item, *future.result())
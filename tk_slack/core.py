@@ -6,23 +6,119 @@
 __all__ = ['DebugLogger', 'ColumnUtils', 'ValueFormatter', 'SlackFormatter', 'SlackMessenger']
 
 # %% ../nbs/API/01_core.ipynb 3
-from typing import List, Tuple, Dict, Any, Callable, Optional
+from typing import List, Tuple, Dict, Any, Callable, Optional, Union
 import os
+import threading
 from datetime import datetime
+from decimal import Decimal
 import pandas as pd
 import numpy as np
 
 # %% ../nbs/API/01_core.ipynb 4
 class DebugLogger:
-    """Simple debug logger to centralize logging logic."""
+    """Level-based debug logger that never formats messages it won't emit.
     
-    @staticmethod
-    def log(message: str) -> None:
-        """Log a debug message if DEBUG environment variable is TRUE."""
-        if os.environ.get('DEBUG', 'FALSE').upper() == 'TRUE':
-            print(message)
+    The level is read once from the environment and cached: `TK_SLACK_LOG_LEVEL`
+    (DEBUG, INFO, WARNING, ERROR or OFF) if set, otherwise DEBUG when the `DEBUG`
+    environment variable is TRUE and WARNING when it isn't. Call `configure` to
+    change it at runtime.
+    
+    Messages can be `%`-style format strings with arguments or zero-argument
+    callables returning the message, so formatting (and any payload
+    serialization) only happens when the level is enabled.
+    """
+    
+    LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40, 'OFF': 100}
+    
+    _level: Optional[int] = None
+    _sample_counts: Dict[Any, int] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def _to_level(cls, level: Union[str, int]) -> int:
+        """Convert a level name or number to a level number."""
+        if isinstance(level, int):
+            return level
+        try:
+            return cls.LEVELS[level.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown log level '{level}'. Choose from: {list(cls.LEVELS)}") from None
+    
+    @classmethod
+    def _level_from_env(cls) -> int:
+        """Read the log level from the environment."""
+        level = os.environ.get('TK_SLACK_LOG_LEVEL')
+        if level:
+            return cls._to_level(level)
+        return cls.LEVELS['DEBUG'] if os.environ.get('DEBUG', 'FALSE').upper() == 'TRUE' else cls.LEVELS['WARNING']
+    
+    @classmethod
+    def configure(cls, level: Optional[Union[str, int]] = None) -> None:
+        """Set the log level and reset message sampling.
+        
+        Args:
+            level: Level name or number. If None, re-reads the environment.
+        """
+        cls._level = cls._level_from_env() if level is None else cls._to_level(level)
+        with cls._lock:
+            cls._sample_counts.clear()
+    
+    @classmethod
+    def is_enabled(cls, level: Union[str, int] = 'DEBUG') -> bool:
+        """Check whether messages at `level` would be emitted."""
+        if cls._level is None:
+            cls._level = cls._level_from_env()
+        return cls._to_level(level) >= cls._level
+    
+    @classmethod
+    def log(cls, message: Union[str, Callable[[], str]], *args, level: Union[str, int] = 'DEBUG',
+            sample_every: int = 1) -> None:
+        """Log a message if `level` is enabled.
+        
+        Args:
+            message: Message, `%`-style format string, or callable returning the message
+            *args: Arguments for a `%`-style format string
+            level: Level of the message (default DEBUG)
+            sample_every: Only emit every Nth call with the same message (for noisy messages)
+        """
+        if not cls.is_enabled(level):
+            return
+            
+        if sample_every > 1:
+            key = getattr(message, '__code__', message)
+            with cls._lock:
+                count = cls._sample_counts.get(key, 0)
+                cls._sample_counts[key] = count + 1
+            if count % sample_every:
+                return
+                
+        if callable(message):
+            message = message()
+        if args:
+            message = message % args
+        print(message)
+    
+    @classmethod
+    def debug(cls, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
+        """Log a DEBUG message."""
+        cls.log(message, *args, level='DEBUG', **kwargs)
+    
+    @classmethod
+    def info(cls, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
+        """Log an INFO message."""
+        cls.log(message, *args, level='INFO', **kwargs)
+    
+    @classmethod
+    def warning(cls, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
+        """Log a WARNING message."""
+        cls.log(message, *args, level='WARNING', **kwargs)
+    
+    @classmethod
+    def error(cls, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
+        """Log an ERROR message."""
+        cls.log(message, *args, level='ERROR', **kwargs)
 
-# %% ../nbs/API/01_core.ipynb 5
+# %% ../nbs/API/01_core.ipynb 7
 class ColumnUtils:
     """Utilities for column operations in DataFrames."""
     
@@ -73,7 +169,7 @@ class ColumnUtils:
             and not (column in excluded_columns)
         ]
 
-# %% ../nbs/API/01_core.ipynb 6
+# %% ../nbs/API/01_core.ipynb 8
 class ValueFormatter:
     """Handles formatting of different data types for display."""
     
@@ -130,12 +226,12 @@ class ValueFormatter:
             try:
                 parsed_date = pd.to_datetime(val)
                 if isinstance(parsed_date, pd.Timestamp):
-                    DebugLogger.log(f'val: {val}')
+                    DebugLogger.log('val: %s', val, sample_every=100)
                     if parsed_date.year >= 2023:
                         formatted = parsed_date.strftime('%b %d, %Y')
                         return formatted
                     else:
-                        DebugLogger.log(f"Year less than 2023: {parsed_date.year}")
+                        DebugLogger.log('Year less than 2023: %s', parsed_date.year, sample_every=100)
             except Exception:
                 pass
         
@@ -144,10 +240,12 @@ class ValueFormatter:
         return formatted
 
 
-# %% ../nbs/API/01_core.ipynb 7
+# %% ../nbs/API/01_core.ipynb 9
 class SlackFormatter:
     """Utilities for formatting data for Slack messages."""
     
+    COPPER_URL_PREFIX = "https://app.copper.com/companies/326784/app#/browse/list/companies/default?fullProfile=companies-"
+    
     @staticmethod
     def right_hand_details(row: pd.Series, detail_columns: List[str], df: pd.DataFrame) -> str:
         """Format row details for Slack message with aligned values.
@@ -226,7 +324,7 @@ class SlackFormatter:
 
         # Copper ID takes priority
         if copper_id is not None:
-            copper_url = f"https://app.copper.com/companies/326784/app#/browse/list/companies/default?fullProfile=companies-{copper_id}"
+            copper_url = f"{SlackFormatter.COPPER_URL_PREFIX}{copper_id}"
             return f"*<{copper_url}|{title}>*"
 
         # Check for valid TITLE_LINK
@@ -238,11 +336,140 @@ class SlackFormatter:
 
         # Plain fallback
         return f"*{title}*"
+    
+    @staticmethod
+    def _string_values(values: pd.Series) -> pd.Series:
+        """Get the strings of a column as a string Series, NA where the value is not a string.
+        
+        Object columns may hold no strings at all (e.g. numbers or Decimals from Snowflake),
+        which the `.str` accessor does not accept.
+        
+        Args:
+            values: Column of any dtype
+            
+        Returns:
+            Series of dtype 'string' aligned with the input index
+        """
+        if pd.api.types.is_object_dtype(values):
+            values = values.where(values.map(lambda v: isinstance(v, str)))
+        elif not pd.api.types.is_string_dtype(values):
+            return pd.Series(pd.NA, index=values.index, dtype='string')
+        return values.astype('string')
+    
+    @staticmethod
+    def _is_finite_number(value: Any) -> bool:
+        """Check whether a value is an int, or a float or Decimal that is neither NaN nor infinite."""
+        if isinstance(value, Decimal):
+            return value.is_finite()
+        if isinstance(value, float):
+            return bool(np.isfinite(value))
+        return isinstance(value, (int, np.integer))
+    
+    @staticmethod
+    def _clean_copper_ids(values: pd.Series) -> pd.Series:
+        """Convert a Copper ID column into ID strings, NA where the value is not a valid ID.
+        
+        Integer, float and Decimal IDs are all linked, as are strings of digits.
+        
+        Args:
+            values: Column holding Copper IDs
+            
+        Returns:
+            Series of ID strings (or NA) aligned with the input index
+        """
+        if pd.api.types.is_bool_dtype(values):
+            return values.astype(int).astype(str)
+        if pd.api.types.is_integer_dtype(values):
+            return values.astype(str).where(values.notna())
+        if pd.api.types.is_float_dtype(values):
+            # IDs within the int64 range are converted at once, larger ones one by one; NaN and infinity are not IDs
+            finite = values.abs().lt(np.inf).fillna(False).astype(bool)
+            in_range = values.abs().lt(2 ** 63).fillna(False).astype(bool)
+            ids = values.where(in_range, 0).astype('int64').astype(str).where(in_range)
+            large = finite & ~in_range
+            if large.any():
+                ids = ids.astype(object).where(~large, values[large].map(lambda v: str(int(v))))
+            return ids
+        if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+            return pd.Series(pd.NA, index=values.index, dtype=object)
+        
+        # Strings that look like ints
+        stripped = SlackFormatter._string_values(values).str.strip()
+        ids = stripped.where(stripped.str.isdigit().fillna(False).astype(bool)).str.lstrip('0').replace('', '0')
+        
+        # Numbers stored in object columns
+        is_number = values.map(SlackFormatter._is_finite_number)
+        ids = ids.astype(object).where(ids.notna())
+        if is_number.any():
+            numbers = values[is_number].map(lambda v: str(int(v)))
+            ids = ids.where(~is_number, numbers)
+        return ids
+    
+    @staticmethod
+    def _clean_titles(values: pd.Series) -> pd.Series:
+        """Strip a title column, NA where the value is empty, non-string or contains digits.
+        
+        Args:
+            values: Column holding titles
+            
+        Returns:
+            Series of cleaned titles (or NA) aligned with the input index
+        """
+        stripped = SlackFormatter._string_values(values).str.strip()
+        valid = (stripped.ne('') & ~stripped.str.contains(r'\d', regex=True)).fillna(False).astype(bool)
+        return stripped.astype(object).where(valid)
+    
+    @staticmethod
+    def format_section_names(df: pd.DataFrame) -> pd.Series:
+        """Create Slack-formatted section titles for every row of a DataFrame at once.
+        
+        Frame-level equivalent of `format_section_name`: the Copper ID, title and
+        TITLE_LINK columns are resolved once and cleaned with vectorized string
+        operations instead of per row.
 
-# %% ../nbs/API/01_core.ipynb 8
+        Args:
+            df: DataFrame with alert data
+
+        Returns:
+            Series of Slack-formatted section titles aligned with `df.index`
+        """
+        col_map = ColumnUtils.normalize_columns(df.columns)
+        synonyms = ColumnUtils.get_column_synonyms()
+        
+        # First valid Copper ID across the synonym columns
+        copper_ids = pd.Series(pd.NA, index=df.index, dtype=object)
+        for key in sorted(synonyms['copper_id']):
+            if key in col_map:
+                copper_ids = copper_ids.where(copper_ids.notna(), SlackFormatter._clean_copper_ids(df[col_map[key]]))
+        
+        # First valid title across the synonym columns, with fallback
+        titles = pd.Series(pd.NA, index=df.index, dtype=object)
+        for key in sorted(synonyms['title']):
+            if key in col_map:
+                titles = titles.where(titles.notna(), SlackFormatter._clean_titles(df[col_map[key]]))
+        titles = titles.fillna("Untitled").astype(str)
+        
+        # Plain fallback
+        names = '*' + titles + '*'
+        
+        # Valid TITLE_LINK
+        if 'TITLE_LINK' in col_map:
+            links = SlackFormatter._string_values(df[col_map['TITLE_LINK']]).str.strip()
+            has_link = links.str.lower().str.startswith('http').fillna(False).astype(bool)
+            names = names.where(~has_link, '*<' + links.astype(object).where(has_link, '') + '|' + titles + '>*')
+        
+        # Copper ID takes priority
+        has_copper = copper_ids.notna()
+        copper_names = '*<' + SlackFormatter.COPPER_URL_PREFIX + copper_ids.where(has_copper, '') + '|' + titles + '>*'
+        return names.where(~has_copper, copper_names).astype(object)
+
+# %% ../nbs/API/01_core.ipynb 15
 class SlackMessenger:
     """Handles creation and sending of Slack messages in various templates."""
     
+    # `attrs` key of the row data of a rendered message holding its rows already formatted for logging
+    LOGGING_DATA_ATTR = 'logging_data'
+    
     @staticmethod
     def process_section_row(section_text: str, detail_text: str) -> Dict[str, Any]:
         """Create Slack message section block.
@@ -297,7 +524,8 @@ class SlackMessenger:
         channel_id: str,
         message_text: str,
         payload_blocks: List[Dict[str, Any]],
-        view: str
+        view: str,
+        **send_kwargs
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Send alert to Slack and handle response.
         
@@ -307,13 +535,14 @@ class SlackMessenger:
             message_text: Main message text
             payload_blocks: Slack blocks to send
             view: View name for logging
+            **send_kwargs: Extra message arguments for the send function (e.g. thread_ts)
             
         Returns:
             Tuple of (success_flag, error_details)
         """
         try:
-            response = send_to_slack_func(channel_id, message_text, payload_blocks=payload_blocks)
-            DebugLogger.log(f'Response: {response.text if hasattr(response, "text") else response}')
+            response = send_to_slack_func(channel_id, message_text, payload_blocks=payload_blocks, **send_kwargs)
+            DebugLogger.log('Response: %s', response.text if hasattr(response, 'text') else response)
             
             # Check response
             if hasattr(response, 'status_code') and response.status_code == 200:
@@ -341,20 +570,75 @@ class SlackMessenger:
             print(f'   Error sending alert for {view}: {e}')
             return False, {'slack_api_error': str(e)}
     
+    @staticmethod
+    def _unpack_send_result(result: Tuple) -> Tuple[bool, Optional[Dict[str, Any]], Any]:
+        """Unpack the result of a `send_to_slack_func` in the metadata style.
+        
+        Send functions return (success, error_details), or (success, error_details, response)
+        when the caller needs the API response (e.g. the message `ts`).
+        
+        Args:
+            result: Tuple returned by the send function
+            
+        Returns:
+            Tuple of (success_flag, error_details, response or None)
+        """
+        success, error_details, *rest = result
+        return success, error_details, rest[0] if rest else None
+    
+    @staticmethod
+    def _message_ts(response: Any) -> Optional[str]:
+        """Get the `ts` of the message a Slack API response refers to, if any.
+        
+        Args:
+            response: API response (SlackResponse, SlackAPIResponse, requests.Response, dict) or None
+            
+        Returns:
+            Message timestamp or None
+        """
+        try:
+            if hasattr(response, 'get'):
+                return response.get('ts')
+            if hasattr(response, 'json'):
+                return response.json().get('ts')
+        except Exception:
+            pass
+        return None
+    
     @staticmethod
     def _format_data_for_logging(df: pd.DataFrame) -> List[Dict[str, Any]]:
         """Format DataFrame data for logging.
         
+        Values are formatted column by column, so a whole run of rows can be
+        formatted in one pass.
+        
         Args:
             df: DataFrame with alert data
             
         Returns:
             List of dictionaries with formatted values
         """
-        return [{
-            key: ValueFormatter.format_value(value) 
-            for key, value in row.items()
-        } for row in df.to_dict('records')]
+        columns = {
+            key: [ValueFormatter.format_value(value) for value in values]
+            for key, values in df.to_dict('list').items()
+        }
+        return [{key: values[i] for key, values in columns.items()} for i in range(len(df))]
+    
+    @staticmethod
+    def _logging_data(row_data: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Get the rows of a message formatted for logging.
+        
+        Renderers format the rows of a whole chunk at once and keep each row's
+        part in `attrs`; other row data is formatted now.
+        
+        Args:
+            row_data: Rows the message was built from
+            
+        Returns:
+            List of dictionaries with formatted values
+        """
+        data = row_data.attrs.get(SlackMessenger.LOGGING_DATA_ATTR)
+        return data if data is not None else SlackMessenger._format_data_for_logging(row_data)
     
     @staticmethod
     def _log_alert(
@@ -380,17 +664,45 @@ class SlackMessenger:
             message_text: Main message text
         """
         try:
-            log_alert_history_func(
-                related_view=view,
-                team=view_group,
-                channel=channel_id,
-                rows_grouped=True,
-                row_num=None,
-                data=formatted_data,
-                was_success=success,
-                error_details=error_details,
-                message_details={'format': 'f1', 'message_text': message_text}
-            )
+            log_alert_history_func(**SlackMessenger._alert_record(
+                view, view_group, channel_id, success, error_details, formatted_data, message_text
+            ))
         except Exception as e:
             print(f"Error logging alert history: {e}")
+    
+    @staticmethod
+    def _alert_record(
+        view: str,
+        view_group: str,
+        channel_id: str,
+        success: bool,
+        error_details: Optional[Dict[str, Any]],
+        formatted_data: Optional[List[Dict[str, Any]]],
+        message_text: str
+    ) -> Dict[str, Any]:
+        """Build an alert history record, as passed to the alert history functions.
+        
+        Args:
+            view: View name
+            view_group: Group name for the view
+            channel_id: Slack channel ID
+            success: Whether the alert was sent successfully
+            error_details: Details of any error
+            formatted_data: Formatted data for logging
+            message_text: Main message text
+            
+        Returns:
+            Dictionary of alert history fields
+        """
+        return dict(
+            related_view=view,
+            team=view_group,
+            channel=channel_id,
+            rows_grouped=True,
+            row_num=None,
+            data=formatted_data,
+            was_success=success,
+            error_details=error_details,
+            message_details={'format': 'f1', 'message_text': message_text}
+        )
 
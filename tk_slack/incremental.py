@@ -0,0 +1,207 @@
+"""Send only the rows of a view that are new or changed since the last run"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/17_incremental.ipynb.
+
+# %% auto 0
+__all__ = ['AlertDeduplicator', 'DedupeRun']
+
+# %% ../nbs/API/17_incremental.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from .core import DebugLogger, ColumnUtils, ValueFormatter, SlackFormatter
+from .state_store import StateStore
+from typing import List, Dict, Any, Optional, Hashable
+from hashlib import blake2b
+import threading
+import pandas as pd
+
+# %% ../nbs/API/17_incremental.ipynb 6
+class AlertDeduplicator:
+    """
+    Filters alert frames down to the rows that changed since they were last sent.
+    """
+    
+    def __init__(self, 
+                 store: Optional[StateStore] = None, 
+                 key_columns: Optional[List[str]] = None,
+                 hash_columns: Optional[List[str]] = None, 
+                 ignore_columns: Optional[List[str]] = None):
+        """Initialize the deduplicator.
+        
+        Args:
+            store: State store for the row hashes (defaults to an in-memory store)
+            key_columns: Columns identifying a row across runs (defaults to the Copper ID column)
+            hash_columns: Columns whose changes trigger a new alert (defaults to all columns)
+            ignore_columns: Columns left out of the hash
+        """
+        self.store = store if store is not None else StateStore()
+        self.key_columns = key_columns
+        self.hash_columns = hash_columns
+        self.ignore_columns = set(ignore_columns or [])
+        self.stats = {'sent': 0, 'suppressed': 0}
+        self._lock = threading.Lock()
+
+# %% ../nbs/API/17_incremental.ipynb 7
+@patch_to(AlertDeduplicator)
+def _digest(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    """Hash the rendered values of `columns`, row by row."""
+    rendered = [df[col].map(ValueFormatter.format_value).tolist() for col in columns]
+    digests = [
+        blake2b('\x1f'.join(f'{col}\x1e{value}' for col, value in zip(columns, values)).encode('utf-8'),
+                digest_size=16).hexdigest()
+        for values in zip(*rendered)
+    ] if columns else [blake2b(b'', digest_size=16).hexdigest()] * len(df)
+    return pd.Series(digests, index=df.index, dtype=object)
+
+@patch_to(AlertDeduplicator)
+def row_hashes(self, df: pd.DataFrame) -> pd.Series:
+    """Hash the alert-relevant content of every row.
+    
+    Args:
+        df: DataFrame with alert data
+        
+    Returns:
+        Series of hex digests, aligned with `df`
+    """
+    columns = self.hash_columns or list(df.columns)
+    return self._digest(df, [col for col in columns if col not in self.ignore_columns])
+
+@patch_to(AlertDeduplicator, cls_method=True)
+def _key_values(cls, values: pd.Series, is_id: bool = False) -> pd.Series:
+    """Render a key column as strings that don't depend on its dtype, '' where the value is missing."""
+    keys = values.astype(object).map(lambda v: '' if pd.isnull(v) else str(v))
+    if is_id:
+        # 1001, 1001.0, Decimal('1001') and '1001' are the same Copper ID
+        ids = SlackFormatter._clean_copper_ids(values)
+        keys = keys.where(ids.isna(), ids)
+    return keys
+
+@patch_to(AlertDeduplicator)
+def row_keys(self, df: pd.DataFrame, hashes: Optional[pd.Series] = None) -> pd.Series:
+    """Get the key identifying every row across runs.
+    
+    Args:
+        df: DataFrame with alert data
+        hashes: Row hashes, used as the key when there are no key columns
+        
+    Returns:
+        Series of unique string keys, aligned with `df`
+    """
+    col_map = ColumnUtils.normalize_columns(list(df.columns))
+    copper_col = next((col_map[name] for name in ('COPPER_ID', 'COMPANY_ID') if name in col_map), None)
+    key_columns = self.key_columns
+    if key_columns is None:
+        key_columns = [copper_col] if copper_col else []
+    
+    if key_columns:
+        keys = None
+        for col in key_columns:
+            values = self._key_values(df[col], is_id=col == copper_col)
+            keys = values if keys is None else keys + '|' + values
+    else:
+        keys = hashes if hashes is not None else self.row_hashes(df)
+    
+    # Tell apart rows sharing a key by their position among them
+    duplicates = keys.duplicated(keep=False)
+    if duplicates.any():
+        keys = keys.where(~duplicates, keys + '#' + keys.groupby(keys).cumcount().astype(str))
+    return keys.astype(object)
+
+# %% ../nbs/API/17_incremental.ipynb 8
+class DedupeRun:
+    """
+    The rows of one frame to send, and the bookkeeping of which were sent.
+    """
+    
+    def __init__(self, dedupe: AlertDeduplicator, view: str, channel: Optional[str], df: pd.DataFrame):
+        """Compare a frame with the stored state of its view and channel.
+        
+        Args:
+            dedupe: Deduplicator the run belongs to
+            view: View name
+            channel: Slack channel ID
+            df: DataFrame with alert data
+        """
+        self.dedupe = dedupe
+        self.view = view
+        self.channel = channel
+        # Rows are identified by their position, as index labels may repeat
+        df = df.reset_index(drop=True)
+        self.hashes = dedupe.row_hashes(df)
+        self.keys = dedupe.row_keys(df, self.hashes)
+        self.state = dedupe.store.get(view, channel)
+        
+        stored = pd.Series([self.state.get(key, {}).get('hash') for key in self.keys], index=df.index, dtype=object)
+        self.changed = df[(stored != self.hashes).to_numpy()]
+        self.stats = {'sent': 0, 'suppressed': len(df) - len(self.changed)}
+        self._sent = []
+        
+        # Forget rows that have left the view
+        dedupe.store.delete(view, channel, set(self.state) - set(self.keys))
+
+# %% ../nbs/API/17_incremental.ipynb 9
+@patch_to(DedupeRun)
+def mark_sent(self, index: Hashable, **fields):
+    """Record that the row with index `index` in `changed` was sent.
+    
+    Args:
+        index: Index label of the row in `changed`; labels that are not in the frame are ignored
+        **fields: Extra state fields to store for the row
+    """
+    if index in self.keys.index:
+        self._sent.append((index, fields))
+
+@patch_to(DedupeRun)
+def message_ts(self, index: Hashable) -> Optional[str]:
+    """Get the `ts` of the message previously sent for a row, if one was recorded.
+    
+    Args:
+        index: Index label of the row in `changed`
+        
+    Returns:
+        Message timestamp or None
+    """
+    if index not in self.keys.index:
+        return None
+    return self.state.get(self.keys[index], {}).get('ts')
+
+@patch_to(DedupeRun)
+def mark_all_sent(self):
+    """Record that all changed rows were sent (e.g. together in one message)."""
+    for index in self.changed.index:
+        self.mark_sent(index)
+
+@patch_to(DedupeRun)
+def commit(self) -> Dict[str, int]:
+    """Store the hashes of the rows that were sent, and update the statistics.
+    
+    Returns:
+        Counts of the rows sent and suppressed in this run
+    """
+    self.dedupe.store.put(self.view, self.channel, {
+        self.keys[index]: {'hash': self.hashes[index], **fields}
+        for index, fields in self._sent
+    })
+    self.stats['sent'] = len(self._sent)
+    self._sent = []
+    
+    with self.dedupe._lock:
+        for key, value in self.stats.items():
+            self.dedupe.stats[key] += value
+    DebugLogger.info('%s in %s: %s rows sent, %s unchanged rows suppressed', 
+                     self.view, self.channel, self.stats['sent'], self.stats['suppressed'])
+    return self.stats
+
+@patch_to(AlertDeduplicator)
+def start(self, df: pd.DataFrame, view: str, channel: Optional[str]) -> DedupeRun:
+    """Start a run, finding the rows of `df` that are new or changed.
+    
+    Args:
+        df: DataFrame with alert data
+        view: View name
+        channel: Slack channel ID
+        
+    Returns:
+        The run, with the rows to send in `changed`
+    """
+    return DedupeRun(self, view, channel, df)
@@ -6,6 +6,7 @@ __all__ = ['InteractionBuilder']
 # %% ../nbs/API/03_interection_builder.ipynb 3
 from .core import ValueFormatter
 from .slack_actions import ActionIdManager
+from . import serialization
 
 from fastcore.basics import patch_to
 from fastcore.test import *
@@ -13,7 +14,6 @@ from fastcore.test import *
 from typing import List, Tuple, Dict, Any, Callable, Optional
 
 import pandas as pd
-import json
 
 # %% ../nbs/API/03_interection_builder.ipynb 5
 class InteractionBuilder:
@@ -267,17 +267,17 @@ def detect_and_create_interactive_elements(
     if view_info and metadata:
         # Combine view_info with existing metadata
         try:
-            meta_dict = json.loads(metadata) if isinstance(metadata, str) else metadata
+            meta_dict = serialization.loads(metadata) if isinstance(metadata, str) else metadata
             if isinstance(meta_dict, dict) and isinstance(view_info, dict):
                 meta_dict.update(view_info)
-                metadata = json.dumps(meta_dict)
+                metadata = serialization.dumps(meta_dict)
         except:
             # If metadata isn't JSON, append view info to metadata
-            view_info_str = json.dumps(view_info)
+            view_info_str = serialization.dumps(view_info)
             metadata = f"{metadata}|{view_info_str}"
     elif view_info:
         # Just use view_info as metadata
-        metadata = json.dumps(view_info)
+        metadata = serialization.dumps(view_info)
     
     elements = []
     
@@ -0,0 +1,171 @@
+"""Read-through, write-through cache of the interactions of users and views"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/25_interaction_cache.ipynb.
+
+# %% auto 0
+__all__ = ['InteractionCache']
+
+# %% ../nbs/API/25_interaction_cache.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from . import serialization
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime
+import threading
+import time
+
+# %% ../nbs/API/25_interaction_cache.ipynb 5
+class InteractionCache:
+    """
+    LRU cache of the recent interactions of users and views, bounded by entries and size.
+    """
+    
+    # Columns of the interactions table, as returned by the lookups
+    COLUMNS = ['ACTION_ID', 'VIEW', 'VIEW_GROUP', 'ACTION_TYPE', 'ACTION_INDEX', 'ACTION_METADATA', 
+               'USER_ID', 'USER_NAME', 'CHANNEL_ID', 'MESSAGE_TS', 'RESPONSE_VALUE', 'RESPONSE_TEXT', 
+               'RESPONSE_VALUES', 'RESPONSE_TEXTS', 'TIMESTAMP', 'RAW_PAYLOAD']
+    
+    def __init__(self, 
+                 connector: Any, 
+                 max_entries: int = 1024, 
+                 max_bytes: int = 16 * 2 ** 20, 
+                 ttl: Optional[float] = 600.0):
+        """Initialize the cache.
+        
+        Args:
+            connector: `SnowflakeConnector` (or an object with the same lookup methods) to load from
+            max_entries: Maximum number of cached lists
+            max_bytes: Maximum JSON size of the cached records, in bytes
+            ttl: Seconds after which a list is loaded again (None to keep it until evicted)
+        """
+        self.connector = connector
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = {'hits': 0, 'misses': 0, 'appended': 0, 'evicted': 0}
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Keys being loaded: [number of loads in flight, number of records added since the first one started]
+        self._loading = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def size_bytes(self) -> int:
+        """JSON size of the cached records, in bytes."""
+        return self._bytes
+    
+    def get_user_interactions(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get recent interactions for a specific user, newest first (see `SnowflakeConnector`)."""
+        return self._lookup('user', user_id, limit, self.connector.get_user_interactions)
+    
+    def get_interactions_by_view(self, view: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get recent interactions for a specific view, newest first (see `SnowflakeConnector`)."""
+        return self._lookup('view', view, limit, self.connector.get_interactions_by_view)
+
+# %% ../nbs/API/25_interaction_cache.ipynb 6
+@patch_to(InteractionCache)
+def _lookup(self, kind: str, value: str, limit: int, load: Callable) -> List[Dict[str, Any]]:
+    """Serve a lookup from the cache, or load and cache its records."""
+    key = (kind, value)
+    with self._lock:
+        entry = self._entries.get(key)
+        fresh = entry is not None and (self.ttl is None or time.monotonic() - entry['loaded_at'] < self.ttl)
+        if fresh and (entry['complete'] or limit <= entry['limit']):
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry['records'][:limit]
+        self.stats['misses'] += 1
+        loading = self._loading.setdefault(key, [0, 0])
+        loading[0] += 1
+        added = loading[1]
+    
+    records = None
+    try:
+        records = list(load(value, limit))
+    finally:
+        with self._lock:
+            loading[0] -= 1
+            if not loading[0]:
+                del self._loading[key]
+            # Records added during the load may be missing from it: don't cache it
+            if records is not None and loading[1] == added:
+                self._put(key, records, limit)
+    return list(records)
+
+@patch_to(InteractionCache)
+def _put(self, key: Tuple[str, str], records: List[Dict[str, Any]], limit: int):
+    """Cache the records of a lookup, replacing any older list."""
+    self._drop(key)
+    sizes = [len(serialization.dumps_bytes(record)) for record in records]
+    self._entries[key] = {
+        'records': records,
+        'sizes': sizes,
+        'limit': limit,
+        # Fewer records than asked for: these are all the records of the key
+        'complete': len(records) < limit,
+        'loaded_at': time.monotonic(),
+    }
+    self._bytes += sum(sizes)
+    self._evict()
+
+@patch_to(InteractionCache)
+def _drop(self, key: Tuple[str, str]):
+    """Remove a cached list."""
+    entry = self._entries.pop(key, None)
+    if entry is not None:
+        self._bytes -= sum(entry['sizes'])
+
+@patch_to(InteractionCache)
+def _evict(self):
+    """Evict the least recently used lists until the cache is within its bounds."""
+    while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+        key = next(iter(self._entries))
+        self._drop(key)
+        self.stats['evicted'] += 1
+
+# %% ../nbs/API/25_interaction_cache.ipynb 7
+@patch_to(InteractionCache)
+def add(self, record: Dict[str, Any]):
+    """Add a newly stored interaction to the cached lists of its user and view.
+    
+    Args:
+        record: Row inserted in the interactions table, with `USER_ID` and `VIEW`
+    """
+    record = self._row(record)
+    size = len(serialization.dumps_bytes(record))
+    with self._lock:
+        for key in (('user', record['USER_ID']), ('view', record['VIEW'])):
+            if key in self._loading:
+                self._loading[key][1] += 1
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            entry['records'] = [record] + entry['records']
+            entry['sizes'] = [size] + entry['sizes']
+            self._bytes += size
+            
+            # Keep the list at its loaded length, dropping the oldest record
+            if len(entry['records']) > entry['limit']:
+                entry['records'].pop()
+                self._bytes -= entry['sizes'].pop()
+                entry['complete'] = False
+            self.stats['appended'] += 1
+        self._evict()
+
+@patch_to(InteractionCache, cls_method=True)
+def _row(cls, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an inserted record to the shape of the rows returned by the lookups."""
+    row = {column: None for column in cls.COLUMNS}
+    row.update(record)
+    if isinstance(row['TIMESTAMP'], str):
+        row['TIMESTAMP'] = datetime.fromisoformat(row['TIMESTAMP'])
+    return row
+
+@patch_to(InteractionCache)
+def invalidate(self, kind: Optional[str] = None, value: Optional[str] = None):
+    """Forget cached lists: one list, all lists of a kind ('user' or 'view'), or everything."""
+    with self._lock:
+        for key in list(self._entries):
+            if (kind is None or key[0] == kind) and (value is None or key[1] == value):
+                self._drop(key)
@@ -0,0 +1,294 @@
+"""Synthetic Slack interaction load for measuring the action handler"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/26_load_harness.ipynb.
+
+# %% auto 0
+__all__ = ['ELEMENT_TYPES', 'ActionLoadGenerator', 'save_bodies', 'load_bodies', 'InMemoryConnector', 'run_action_load']
+
+# %% ../nbs/API/26_load_harness.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from .interaction_builder import InteractionBuilder
+from .metadata_handler import MessageMetadataHandler
+from .slack_actions import ActionHandler
+from .action_dedupe import ActionDeduplicator
+from . import serialization
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import datetime
+import random
+import threading
+import time
+
+# %% ../nbs/API/26_load_harness.ipynb 5
+# Element types of `InteractionBuilder`, with the options of the generated elements
+ELEMENT_TYPES = {
+    'button': (['Approve', 'Snooze', 'Dismiss'], ['approve', 'snooze', 'dismiss']),
+    'static_select': ([f'Stage {s}' for s in 'ABCDE'], [f'stage_{s.lower()}' for s in 'ABCDE']),
+    'multi_static_select': (['Email', 'Call', 'Meeting'], ['email', 'call', 'meeting']),
+    'datepicker': (['Follow-up date'], ['2024-05-01']),
+    'users_select': (['Assign to user'], ['']),
+    'channels_select': (['Share to channel'], ['']),
+}
+
+# %% ../nbs/API/26_load_harness.ipynb 6
+class ActionLoadGenerator:
+    """
+    Generates Slack `block_actions` bodies for the interactive elements of alerts.
+    """
+    
+    def __init__(self, 
+                 views: Sequence[str] = ('deals', 'leads'), 
+                 view_group: str = 'alerts', 
+                 users: int = 50, 
+                 element_types: Optional[Sequence[str]] = None, 
+                 duplicate_rate: float = 0.0, 
+                 seed: int = 0):
+        """Initialize the generator.
+        
+        Args:
+            views: Views the alert messages come from
+            view_group: View group of the views
+            users: Number of distinct users clicking
+            element_types: Element types to generate, from `ELEMENT_TYPES` (all by default)
+            duplicate_rate: Fraction of bodies that redeliver a recent body
+            seed: Random seed, also making the message timestamps of generators differ
+        """
+        self.views = list(views)
+        self.view_group = view_group
+        self.users = [(f'UL{seed}X{n}', f'load.user{n}') for n in range(users)]
+        self.element_types = list(element_types or ELEMENT_TYPES)
+        self.duplicate_rate = duplicate_rate
+        self.seed = seed
+        self.generated = 0
+        self.duplicates = 0
+        self._rng = random.Random(seed)
+        self._recent = deque(maxlen=100)
+        self._elements = {
+            action_type: InteractionBuilder.detect_and_create_interactive_elements(
+                *ELEMENT_TYPES[action_type], action_type=action_type)
+            for action_type in self.element_types
+        }
+    
+    def bodies(self, count: int) -> Iterator[Dict[str, Any]]:
+        """Generate `count` action bodies."""
+        for _ in range(count):
+            yield self.body()
+
+# %% ../nbs/API/26_load_harness.ipynb 7
+@patch_to(ActionLoadGenerator)
+def _action(self, element: Dict[str, Any], block_id: str) -> Dict[str, Any]:
+    """Get the action Slack reports for a user interacting with an element."""
+    rng = self._rng
+    action = {
+        'type': element['type'],
+        'action_id': element['action_id'],
+        'block_id': block_id,
+        'action_ts': f'{time.time():.6f}',
+    }
+    if element['type'] == 'button':
+        action.update(text=element['text'], value=element.get('value', ''))
+    elif element['type'] == 'static_select':
+        action['selected_option'] = rng.choice(element['options'])
+    elif element['type'] == 'multi_static_select':
+        options = element['options']
+        action['selected_options'] = rng.sample(options, rng.randint(1, len(options)))
+    elif element['type'] == 'datepicker':
+        day = datetime.date(2024, 1, 1) + datetime.timedelta(days=rng.randrange(366))
+        action['selected_date'] = day.isoformat()
+    elif element['type'] == 'users_select':
+        action['selected_user'] = rng.choice(self.users)[0]
+    elif element['type'] == 'channels_select':
+        action['selected_channel'] = f'CL{rng.randrange(20)}'
+    return action
+
+@patch_to(ActionLoadGenerator)
+def body(self) -> Dict[str, Any]:
+    """Generate the next action body."""
+    rng = self._rng
+    if self._recent and rng.random() < self.duplicate_rate:
+        self.duplicates += 1
+        return rng.choice(self._recent)
+    
+    i = self.generated
+    self.generated += 1
+    view = self.views[i % len(self.views)]
+    user_id, user_name = rng.choice(self.users)
+    channel_id = f'CL{i % 20}'
+    ts = f'{1800000000 + self.seed}.{i:06d}'
+    block_id = f'actions_{i}'
+    
+    action_type = rng.choice(self.element_types)
+    elements = self._elements[action_type]
+    metadata = MessageMetadataHandler.create_metadata(
+        f'{view}_notification',
+        view_info={'view': view, 'view_group': self.view_group},
+        response_config={'response_message': 'Thanks {user}, we recorded {value}{date}{values}'},
+        custom_data={'row_index': i},
+    )
+    body = {
+        'type': 'block_actions',
+        'user': {'id': user_id, 'username': user_name, 'name': user_name, 'team_id': 'TLOAD'},
+        'api_app_id': 'ALOAD',
+        'team': {'id': 'TLOAD', 'domain': 'load-test'},
+        'container': {'type': 'message', 'message_ts': ts, 'channel_id': channel_id, 'is_ephemeral': False},
+        'trigger_id': f'{i}.{rng.getrandbits(40)}',
+        'channel': {'id': channel_id, 'name': f'alerts-{view}'},
+        'message': {
+            'type': 'message',
+            'ts': ts,
+            'text': f'New {view} alert',
+            'blocks': [dict(InteractionBuilder.create_actions_block(elements), block_id=block_id)],
+            'metadata': metadata,
+        },
+        'response_url': f'https://hooks.slack.com/actions/TLOAD/{i}/load-test',
+        'actions': [self._action(rng.choice(elements), block_id)],
+    }
+    self._recent.append(body)
+    return body
+
+# %% ../nbs/API/26_load_harness.ipynb 10
+def save_bodies(bodies: Iterable[Dict[str, Any]], path: str) -> int:
+    """Save action bodies as JSON lines.
+    
+    Args:
+        bodies: Slack action bodies
+        path: File to write
+        
+    Returns:
+        Number of bodies saved
+    """
+    count = 0
+    with open(path, 'w') as f:
+        for body in bodies:
+            f.write(serialization.dumps(body) + '\n')
+            count += 1
+    return count
+
+def load_bodies(path: str) -> Iterator[Dict[str, Any]]:
+    """Load the action bodies of a JSON lines file, one at a time."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield serialization.loads(line)
+
+# %% ../nbs/API/26_load_harness.ipynb 12
+class InMemoryConnector:
+    """
+    Stand-in for `SnowflakeConnector` keeping the stored rows in memory.
+    """
+    
+    def __init__(self, latency: float = 0.0):
+        """Initialize the connector.
+        
+        Args:
+            latency: Seconds each insert or query takes, to simulate the warehouse
+        """
+        self.latency = latency
+        self.rows = []
+        self.queries = 0
+        self._lock = threading.Lock()
+    
+    def _wait(self):
+        if self.latency: time.sleep(self.latency)
+    
+    def insert_record(self, table_name: str, data: Dict[str, Any]) -> bool:
+        self._wait()
+        with self._lock:
+            self.rows.append(data)
+        return True
+    
+    def bulk_insert(self, table_name: str, df) -> bool:
+        self._wait()
+        with self._lock:
+            self.rows.extend(df.to_dict('records'))
+        return True
+    
+    def _select(self, column: str, value: str, limit: int) -> List[Dict[str, Any]]:
+        self._wait()
+        with self._lock:
+            self.queries += 1
+            return [row for row in reversed(self.rows) if row.get(column) == value][:limit]
+    
+    def get_user_interactions(self, user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        return self._select('USER_ID', user_id, limit)
+    
+    def get_interactions_by_view(self, view: str, limit: int = 100) -> List[Dict[str, Any]]:
+        return self._select('VIEW', view, limit)
+
+# %% ../nbs/API/26_load_harness.ipynb 13
+def _percentile(samples: List[float], q: float) -> float:
+    """Get a percentile of sorted samples."""
+    return samples[min(len(samples) - 1, int(len(samples) * q))]
+
+def run_action_load(bodies: Iterable[Dict[str, Any]], 
+                    rate: Optional[float] = None, 
+                    concurrency: int = 1, 
+                    connector: Optional[Any] = None, 
+                    respond_latency: float = 0.0, 
+                    handler: Optional[type] = None) -> Dict[str, Any]:
+    """Process action bodies with the action handler and measure it.
+    
+    Args:
+        bodies: Slack action bodies, e.g. from `ActionLoadGenerator.bodies` or `load_bodies`
+        rate: Bodies per second to send (None to send them as fast as they're processed)
+        concurrency: Number of workers processing bodies
+        connector: Connector to store the actions with (a new `InMemoryConnector` by default)
+        respond_latency: Seconds each call of the fake `respond` takes
+        handler: Handler class to drive (by default a subclass of `ActionHandler` using `connector`,
+            with its own deduplicator and no interaction cache)
+        
+    Returns:
+        Report with the counts of bodies, processed actions, duplicates, errors and responses,
+        the elapsed seconds, the throughput (actions per second) and latency percentiles (ms)
+    """
+    connector = connector if connector is not None else InMemoryConnector()
+    # The subclass keeps its own state, so that replays don't see each other's actions as duplicates
+    # and don't add their actions to the production deduplicator and interaction cache
+    handler = handler or type('LoadActionHandler', (ActionHandler,), {
+        'snowflake': connector, 'deduplicator': ActionDeduplicator(), 'interaction_cache': None
+    })
+    lock = threading.Lock()
+    counts = {'count': 0, 'processed': 0, 'duplicates': 0, 'errors': 0, 'responses': 0}
+    latencies = []
+    
+    def respond(**response):
+        if respond_latency: time.sleep(respond_latency)
+        with lock:
+            counts['responses'] += 1
+    
+    def process(body, scheduled):
+        started = time.perf_counter()
+        try:
+            result = handler.process_slack_action(body, respond)
+            outcome = 'processed' if result is not None else 'duplicates'
+        except Exception as e:
+            print(f"Error processing action: {e}")
+            outcome = 'errors'
+        latency = time.perf_counter() - (scheduled if rate else started)
+        with lock:
+            counts[outcome] += 1
+            latencies.append(latency)
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i, body in enumerate(bodies):
+            scheduled = start + i / rate if rate else start
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            counts['count'] += 1
+            executor.submit(process, body, scheduled)
+    elapsed = time.perf_counter() - start
+    
+    latencies.sort()
+    report = dict(counts, elapsed=elapsed, throughput=counts['processed'] / elapsed if elapsed else 0.0)
+    report['latency_ms'] = {
+        'mean': 1000 * sum(latencies) / len(latencies),
+        'p50': 1000 * _percentile(latencies, 0.50),
+        'p90': 1000 * _percentile(latencies, 0.90),
+        'p99': 1000 * _percentile(latencies, 0.99),
+        'max': 1000 * latencies[-1],
+    } if latencies else {}
+    return report
@@ -8,12 +8,24 @@ __all__ = ['MessageTemplate']
 # %% ../nbs/API/05_message_templates.ipynb 3
 from fastcore.basics import patch_to
 from fastcore.test import *
-from .core import DebugLogger, SlackMessenger, ColumnUtils, SlackFormatter
-from typing import List, Tuple, Dict, Any, Callable, Optional
+from .core import DebugLogger, SlackMessenger, ColumnUtils, SlackFormatter, ValueFormatter
+from typing import List, Tuple, Dict, Any, Callable, Optional, Iterable, Iterator
 from .block_builder import BlockBuilder
 from .template_engine import TemplateEngine
+from . import serialization
+from .parallel_render import ParallelRenderer
+from .streaming import stream_ahead
+from .concurrent_send import ConcurrentSender
+from .rate_limit import SlackRateLimiter
+from .alert_history import AlertHistoryBatch
+from .incremental import AlertDeduplicator, DedupeRun
+from .pagination import BlockPaginator
+from .outbox import AlertOutbox, OutboxRun
+from .scheduler import SendScheduler
+from .smoothing import SendSmoother, SmoothedRun
+from .block_template import BlockTemplate
 import pandas as pd
-import json
+import uuid
 
 # %% ../nbs/API/05_message_templates.ipynb 4
 class MessageTemplate:
@@ -22,136 +34,328 @@ class MessageTemplate:
 
 # %% ../nbs/API/05_message_templates.ipynb 5
 @patch_to(MessageTemplate,cls_method=True)
+def _wrap_send_func(
+        cls,
+        send_func: Callable,
+        view: str,
+        view_group: str,
+        channel_id: Optional[str],
+        scheduler: Optional[SendScheduler] = None,
+        rate_limiter: Optional[SlackRateLimiter] = None,
+        smoothing: Optional[SmoothedRun] = None,
+        method: str = 'chat.postMessage'
+    ) -> Callable:
+        """Wrap a Slack call of a view with its scheduler, rate limiter and smoothing.
+        
+        Args:
+            send_func: Function calling Slack, e.g. `send_to_slack_func`
+            view: View name
+            view_group: View group name
+            channel_id: Slack channel ID the calls go to (None for calls not limited per channel)
+            scheduler: Optional `SendScheduler` to take turns with the other views sending at the same time
+            rate_limiter: Optional `SlackRateLimiter` to keep the calls within Slack's rate limits
+            smoothing: Optional `SmoothedRun` spreading the calls over a time window
+            method: Slack Web API method `send_func` calls
+            
+        Returns:
+            Function with the same signature as `send_func`
+        """
+        # Take turns with the other views sending at the same time; the rate limiter wraps the
+        # scheduler, so a view waiting for tokens or a Retry-After does not hold a slot
+        if scheduler is not None:
+            send_func = scheduler.wrap(send_func, view, view_group)
+        
+        # Only new messages can be scheduled with Slack
+        schedule = smoothing is not None and smoothing.schedule and method == 'chat.postMessage'
+        
+        # Wait for Slack's rate limits and retry rate limited calls
+        if rate_limiter is not None:
+            send_func = rate_limiter.wrap(send_func, method='chat.scheduleMessage' if schedule else method, channel=channel_id)
+        
+        # Send each call in its slot of the smoothing window, or schedule it with Slack within the
+        # per-channel cap; calls that can't be scheduled (e.g. updates) don't take a slot of a scheduled run
+        if smoothing is not None and (schedule or not smoothing.schedule):
+            send_func = smoothing.wrap(send_func, channel=channel_id)
+        return send_func
+
+# %% ../nbs/API/05_message_templates.ipynb 6
+@patch_to(MessageTemplate,cls_method=True)
 def _send_messages_and_log(
         self,
-        messages: List[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]],
+        messages: Iterable[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]],
         view: str,
         view_group: str,
         channel_id: str,
         send_to_slack_func: Callable,
-        log_alert_history_func: Callable
+        log_alert_history_func: Callable,
+        sender: Optional[ConcurrentSender] = None,
+        rate_limiter: Optional[SlackRateLimiter] = None,
+        scheduler: Optional[SendScheduler] = None,
+        log_alert_history_batch_func: Optional[Callable] = None
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Send multiple messages and log results.
         
         Args:
-            messages: List of (message_text, blocks, row_data) tuples
+            messages: Iterable of (message_text, blocks, row_data) tuples, consumed one at a time
             view: View name
             view_group: View group name
             channel_id: Slack channel ID
             send_to_slack_func: Function to send messages to Slack
             log_alert_history_func: Function to log alert history
+            sender: Optional `ConcurrentSender` to send several messages at once
+            rate_limiter: Optional `SlackRateLimiter` to keep sends within Slack's rate limits
+            scheduler: Optional `SendScheduler` to take turns with the other views sending at the same time
+            log_alert_history_batch_func: Function to log the alert history of all messages at once,
+                called with a DataFrame after the last send instead of `log_alert_history_func`
             
         Returns:
             Tuple of (success_flag, error_details)
         """
         all_success = True
         all_errors = []
+        history = AlertHistoryBatch() if log_alert_history_batch_func is not None else None
+        send_to_slack_func = self._wrap_send_func(send_to_slack_func, view, view_group, channel_id, scheduler, rate_limiter)
         
-        for idx, (message_text, payload_blocks, row_data) in enumerate(messages):
-            DebugLogger.log(f'Sending message for {view} - Item {idx}')
-            DebugLogger.log(f'Payload Blocks: {json.dumps(payload_blocks, default=str)}')
+        def send(item):
+            idx, (message_text, payload_blocks, row_data) = item
+            DebugLogger.log('Sending message for %s - Item %s', view, idx)
+            DebugLogger.log(lambda: f'Payload Blocks: {serialization.dumps(payload_blocks)}')
             
             # Send to Slack with error handling
-            success, error_details = SlackMessenger._send_alert_to_slack(
+            return SlackMessenger._send_alert_to_slack(
                 send_to_slack_func, 
                 channel_id, 
                 message_text, 
                 payload_blocks, 
                 f"{view}_item_{idx}"
             )
+        
+        # Results come back in message order, so logging stays in order
+        sender = sender or ConcurrentSender(max_workers=1)
+        for (idx, (message_text, payload_blocks, row_data)), result, error in sender.map(send, enumerate(messages), channel=channel_id):
+            success, error_details = result if error is None else (False, {'error': str(error)})
             
             if not success:
                 all_success = False
                 all_errors.append({f"item_{idx}": error_details})
             
-            # Format row data for logging
-            formatted_data = SlackMessenger._format_data_for_logging(row_data)
-            
-            # Log alert history
-            SlackMessenger._log_alert(
-                log_alert_history_func,
-                view=view,
-                view_group=view_group,
-                channel_id=channel_id,
-                success=success,
-                error_details=error_details,
-                formatted_data=formatted_data,
-                message_text=message_text
-            )
+            # Collect alert history for the batch, or log it right away
+            if history is not None:
+                history.add(view, view_group, channel_id, success, error_details, row_data, message_text)
+            else:
+                # Format row data for logging
+                formatted_data = SlackMessenger._logging_data(row_data)
+                
+                # Log alert history
+                SlackMessenger._log_alert(
+                    log_alert_history_func,
+                    view=view,
+                    view_group=view_group,
+                    channel_id=channel_id,
+                    success=success,
+                    error_details=error_details,
+                    formatted_data=formatted_data,
+                    message_text=message_text
+                )
+        
+        # Log the alert history of the whole run at once
+        if history is not None:
+            history.flush(log_alert_history_batch_func)
         
         return all_success, all_errors if not all_success else None
 
-# %% ../nbs/API/05_message_templates.ipynb 6
+# %% ../nbs/API/05_message_templates.ipynb 7
 @patch_to(MessageTemplate,cls_method=True)
 def _send_messages_and_log_with_metadata(
         self,
-        messages: List[Tuple[Dict[str, Any], pd.DataFrame]],
+        messages: Iterable[Tuple[Dict[str, Any], pd.DataFrame]],
         view: str,
         view_group: str,
         channel_id: str,
         send_to_slack_func: Callable,
-        log_alert_history_func: Callable
+        log_alert_history_func: Callable,
+        sender: Optional[ConcurrentSender] = None,
+        rate_limiter: Optional[SlackRateLimiter] = None,
+        scheduler: Optional[SendScheduler] = None,
+        log_alert_history_batch_func: Optional[Callable] = None,
+        on_sent: Optional[Callable] = None,
+        update_slack_func: Optional[Callable] = None,
+        outbox_run: Optional[OutboxRun] = None,
+        smoothing: Optional[SmoothedRun] = None
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Send multiple messages with metadata and log results.
         
         Args:
-            messages: List of (message_payload, row_data) tuples
+            messages: Iterable of (message_payload, row_data) tuples, consumed one at a time
             view: View name
             view_group: View group name
             channel_id: Slack channel ID
             send_to_slack_func: Function to send messages to Slack
             log_alert_history_func: Function to log alert history
+            sender: Optional `ConcurrentSender` to send several messages at once
+            rate_limiter: Optional `SlackRateLimiter` to keep sends within Slack's rate limits
+            scheduler: Optional `SendScheduler` to take turns with the other views sending at the same time
+            log_alert_history_batch_func: Function to log the alert history of all messages at once,
+                called with a DataFrame after the last send instead of `log_alert_history_func`
+            on_sent: Function called with (row_data, success, response) after each send
+            update_slack_func: Function to update posted messages, used for the payloads with a `ts`
+            outbox_run: Optional `OutboxRun` the messages are read from, to checkpoint each outcome
+            smoothing: Optional `SmoothedRun` spreading the sends over a time window
             
         Returns:
             Tuple of (success_flag, error_details)
         """
         all_success = True
         all_errors = []
+        history = AlertHistoryBatch() if log_alert_history_batch_func is not None else None
+        send_to_slack_func = self._wrap_send_func(send_to_slack_func, view, view_group, channel_id, 
+                                                  scheduler, rate_limiter, smoothing)
+        if update_slack_func is not None:
+            update_slack_func = self._wrap_send_func(update_slack_func, view, view_group, channel_id, 
+                                                     scheduler, rate_limiter, smoothing, method='chat.update')
         
-        for idx, (message_payload, row_data) in enumerate(messages):
-            DebugLogger.log(f'Sending message for {view} - Item {idx}')
+        def send(item):
+            idx, (message_payload, row_data) = item
+            DebugLogger.log('Sending message for %s - Item %s', view, idx)
+            
+            # Payloads with the ts of an earlier message update it in place (compiled payloads are bytes)
+            is_update = update_slack_func is not None and isinstance(message_payload, dict) and 'ts' in message_payload
+            func = update_slack_func if is_update else send_to_slack_func
             
+            # We need to use the Slack Web API client directly to support metadata
+            return func(
+                message_payload,
+                f"{view}_item_{idx}"
+            )
+        
+        # Results come back in message order, so logging stays in order
+        sender = sender or ConcurrentSender(max_workers=1)
+        for (idx, (message_payload, row_data)), result, error in sender.map(send, enumerate(messages), channel=channel_id):
             # Extract text and blocks from payload
+            if isinstance(message_payload, bytes):
+                message_payload = serialization.loads(message_payload)
             message_text = message_payload.get("text", "")
             
-            # Send to Slack with error handling
+            # Handle the send result
+            marked = False
             try:
-                # We need to use the Slack Web API client directly to support metadata
-                success, error_details = send_to_slack_func(
-                    message_payload,
-                    f"{view}_item_{idx}"
-                )
+                if error is not None:
+                    raise error
+                success, error_details, response = SlackMessenger._unpack_send_result(result)
+                
+                # Record the outcome, so a restart doesn't send this message again
+                if outbox_run is not None:
+                    outbox_run.mark(idx, success, error_details)
+                    marked = True
                 
                 if not success:
                     all_success = False
                     all_errors.append({f"item_{idx}": error_details})
                 
-                # Format row data for logging
-                formatted_data = SlackMessenger._format_data_for_logging(row_data)
+                # Collect alert history for the batch, or log it right away
+                if history is not None:
+                    history.add(view, view_group, channel_id, success, error_details, row_data, message_text)
+                else:
+                    # Format row data for logging
+                    formatted_data = SlackMessenger._logging_data(row_data)
+                    
+                    # Log alert history
+                    SlackMessenger._log_alert(
+                        log_alert_history_func,
+                        view=view,
+                        view_group=view_group,
+                        channel_id=channel_id,
+                        success=success,
+                        error_details=error_details,
+                        formatted_data=formatted_data,
+                        message_text=message_text
+                    )
                 
-                # Log alert history
-                SlackMessenger._log_alert(
-                    log_alert_history_func,
-                    view=view,
-                    view_group=view_group,
-                    channel_id=channel_id,
-                    success=success,
-                    error_details=error_details,
-                    formatted_data=formatted_data,
-                    message_text=message_text
-                )
+                # Report the outcome of the send to the caller
+                if on_sent is not None:
+                    on_sent(row_data, success, response)
             except Exception as e:
                 all_success = False
                 error_msg = f"Error sending message: {str(e)}"
                 all_errors.append({f"item_{idx}": error_msg})
+                
+                # Count the failed attempt (e.g. a send result that can't be read), so resuming
+                # the run gives up on the message after its retries instead of sending it forever
+                if outbox_run is not None and not marked:
+                    outbox_run.mark(idx, False, error_msg)
                 DebugLogger.log(error_msg)
         
-        return all_success, all_errors if not all_errors else None
+        # Log the alert history of the whole run at once
+        if history is not None:
+            history.flush(log_alert_history_batch_func)
+        
+        return all_success, all_errors if all_errors else None
 
-# %% ../nbs/API/05_message_templates.ipynb 7
+# %% ../nbs/API/05_message_templates.ipynb 8
+@patch_to(MessageTemplate,cls_method=True)
+def _send_pages(
+        cls,
+        pages: List[List[Dict[str, Any]]],
+        title: str,
+        view: str,
+        channel_id: str,
+        message_text: str,
+        send_to_slack_func: Callable,
+        thread_replies: bool = False
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Send the pages of a paginated message, each under its own header.
+        
+        Args:
+            pages: Pages of row blocks, from `BlockPaginator.paginate`
+            title: Header title
+            view: View name
+            channel_id: Slack channel ID
+            message_text: Main message text
+            send_to_slack_func: Function to send messages to Slack
+            thread_replies: Post the pages after the first as replies in its thread
+            
+        Returns:
+            Tuple of (success_flag, error_details), with the errors per page when there are several
+        """
+        if len(pages) == 1:
+            header = BlockBuilder.create_header_block(title)
+            return SlackMessenger._send_alert_to_slack(
+                send_to_slack_func, channel_id, message_text, [header] + pages[0], view
+            )
+        
+        # Keep the responses, to thread the later pages under the first
+        responses = []
+        def send_page(*args, **kwargs):
+            response = send_to_slack_func(*args, **kwargs)
+            responses.append(response)
+            return response
+        
+        all_success = True
+        all_errors = []
+        thread_ts = None
+        
+        for page, page_blocks in enumerate(pages, 1):
+            counter = f'({page}/{len(pages)})'
+            send_kwargs = {'thread_ts': thread_ts} if thread_ts else {}
+            if not thread_ts:
+                page_blocks = [BlockBuilder.create_header_block(f'{title} {counter}')] + page_blocks
+            
+            success, error_details = SlackMessenger._send_alert_to_slack(
+                send_page, channel_id, f'{message_text} {counter}', page_blocks, f'{view}_page_{page}', **send_kwargs
+            )
+            
+            if not success:
+                all_success = False
+                all_errors.append({f"page_{page}": error_details})
+            elif thread_replies and page == 1:
+                thread_ts = SlackMessenger._message_ts(responses[-1])
+        
+        return all_success, all_errors if all_errors else None
+
+# %% ../nbs/API/05_message_templates.ipynb 9
 @patch_to(MessageTemplate,cls_method=True)
 def template_f1(
-        self,
+        cls,
         df: pd.DataFrame,
         view: str,
         view_group: str,
@@ -160,6 +364,13 @@ def template_f1(
         view_config: Dict[str, Any],
         send_to_slack_func: Callable = None,
         log_alert_history_func: Callable = None,
+        rate_limiter: Optional[SlackRateLimiter] = None,
+        scheduler: Optional[SendScheduler] = None,
+        log_alert_history_batch_func: Optional[Callable] = None,
+        dedupe: Optional[AlertDeduplicator] = None,
+        paginator: Optional[BlockPaginator] = None,
+        thread_replies: bool = False,
+        smoother: Optional[SendSmoother] = None,
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """Slack Message Format 1: Single message with row sections and details on the right.
         
@@ -172,17 +383,34 @@ def template_f1(
             view_config: Configuration for the view
             send_to_slack_func: Function to send messages to Slack
             log_alert_history_func: Function to log alert history
+            rate_limiter: Optional `SlackRateLimiter` to keep the send within Slack's rate limits
+            scheduler: Optional `SendScheduler` to take turns with the other views sending at the same time
+            log_alert_history_batch_func: Function to log alert history as a DataFrame of records,
+                used instead of `log_alert_history_func`
+            dedupe: Optional `AlertDeduplicator` to only send the rows that are new or changed
+            paginator: `BlockPaginator` splitting the rows over messages that fit Slack's limits
+            thread_replies: Post the pages after the first as replies in its thread
+            smoother: Optional `SendSmoother` to spread the pages of a non-urgent view over a time window
             
         Returns:
             Tuple of (success_flag, error_details)
         """
-        DebugLogger.log(f'Processing template_f1 for view: {view}')
+        DebugLogger.log('Processing template_f1 for view: %s', view)
+        
+        # Only send the rows that are new or changed since the last run
+        run = dedupe.start(df, view, channel_id) if dedupe is not None else None
+        if run is not None:
+            df = run.changed
+            if df.empty:
+                print(f'   No new or changed rows for {view}')
+                run.commit()
+                return True, None
         
         # Create title from view name
         title = view.lower().replace(view_group, '').replace('_', ' ').title()
         
-        # Initialize blocks with header
-        payload_blocks = [BlockBuilder.create_header_block(title)]
+        # Initialize row blocks, the header is added to each page
+        payload_blocks = []
         
         # Get columns for details
         df_columns = list(df.columns)
@@ -192,31 +420,60 @@ def template_f1(
             else ColumnUtils.get_detail_columns(df_columns)
         )
         
-        DebugLogger.log(f'df_columns: {df_columns}')
-        DebugLogger.log(f'detail_columns: {detail_columns}')
+        DebugLogger.log('df_columns: %s', df_columns)
+        DebugLogger.log('detail_columns: %s', detail_columns)
+        
+        # Build all section titles for the frame at once
+        section_names = SlackFormatter.format_section_names(df)
         
         # Process each row into a section
-        for idx, row in df.iterrows():
+        for pos, (idx, row) in enumerate(df.iterrows()):
             detail_text = SlackFormatter.right_hand_details(row, detail_columns, df)
-            section_text = SlackFormatter.format_section_name(row, df_columns)
-            payload_blocks.append(BlockBuilder.process_section_row(section_text, detail_text))
+            section_text = section_names.iat[pos]
+            payload_blocks.append(SlackMessenger.process_section_row(section_text, detail_text))
+        
+        DebugLogger.log(lambda: f'Payload Blocks: {serialization.dumps(payload_blocks)}')
+        
+        # Split the rows over as few messages as fit Slack's limits, keeping room for the header
+        paginator = paginator or BlockPaginator()
+        pages = paginator.paginate(
+            payload_blocks, 
+            reserved_blocks=1, 
+            reserved_chars=paginator.block_size(BlockBuilder.create_header_block(f'{title} (000/000)'))
+        )
+        print(f'   Sending Alert for {view}' + (f' in {len(pages)} messages' if len(pages) > 1 else ''))
         
-        DebugLogger.log(f'Payload Blocks: {json.dumps(payload_blocks, default=str)}')
-        print(f'   Sending Alert for {view}')
+        # Spread the pages of a non-urgent view over the smoothing window
+        smoothing = smoother.start(len(pages), view) if smoother is not None else None
+        send_to_slack_func = cls._wrap_send_func(send_to_slack_func, view, view_group, channel_id, 
+                                                 scheduler, rate_limiter, smoothing)
         
         # Send to Slack with error handling
-        success, error_details = SlackMessenger._send_alert_to_slack(
-            send_to_slack_func, 
+        success, error_details = cls._send_pages(
+            pages, 
+            title, 
+            view, 
             channel_id, 
             message_text, 
-            payload_blocks, 
-            view
+            send_to_slack_func, 
+            thread_replies
         )
         
-        # Format data for logging
-        formatted_data = SlackMessenger._format_data_for_logging(df)
+        # Remember the rows as sent, so they are suppressed until they change
+        if run is not None:
+            if success:
+                run.mark_all_sent()
+            run.commit()
         
-        if log_alert_history_func:
+        if log_alert_history_batch_func:
+            # Log alert history as a one-record batch
+            history = AlertHistoryBatch()
+            history.add(view, view_group, channel_id, success, error_details, df, message_text)
+            history.flush(log_alert_history_batch_func)
+        elif log_alert_history_func:
+            # Format data for logging
+            formatted_data = SlackMessenger._format_data_for_logging(df)
+            
             # Log alert history
             SlackMessenger._log_alert(
                 log_alert_history_func,
@@ -231,9 +488,9 @@ def template_f1(
         
         return success, error_details
 
-# %% ../nbs/API/05_message_templates.ipynb 8
+# %% ../nbs/API/05_message_templates.ipynb 10
 @patch_to(MessageTemplate,cls_method=True)
-def template_f2(
+def _iter_f2_messages(
     cls,
     df: pd.DataFrame,
     view: str,
@@ -241,26 +498,26 @@ def template_f2(
     message_text: str,
     channel_id: str,
     view_config: Dict[str, Any] = None,
-    send_to_slack_func: Callable = None,
-    log_alert_history_func: Callable = None,
-) -> Tuple[bool, Optional[Dict[str, Any]]]:
-    """Slack Message Format 2: Individual interactive messages for each row.
+    batch_size: int = 100
+) -> Iterator[Tuple[Dict[str, Any], pd.DataFrame]]:
+    """Lazily render the Format 2 message for each row of a DataFrame.
+    
+    Each row is rendered only when the caller asks for it, so the first
+    message is ready without waiting for the whole frame. Section titles
+    and the logging data are built `batch_size` rows at a time.
     
     Args:
-        df: DataFrame with alert data
+        df: DataFrame with alert data (the whole frame or a chunk of it)
         view: View name
         view_group: Group name for the view
         message_text: Main message text
         channel_id: Slack channel ID
         view_config: Configuration for the view
-        send_to_slack_func: Function to send messages to Slack
-        log_alert_history_func: Function to log alert history
+        batch_size: Number of rows to build section titles and logging data for at once
         
-    Returns:
-        Tuple of (success_flag, error_details)
+    Yields:
+        (message_payload, row_data) tuples in row order, the row data carrying its logging data
     """
-    DebugLogger.log(f'Processing template_f2 for view: {view}')
-    
     # Import MessageMetadataHandler here to avoid circular imports
     from tk_slack.metadata_handler import MessageMetadataHandler
     
@@ -268,11 +525,14 @@ def template_f2(
     df_columns = list(df.columns)
     col_map = ColumnUtils.normalize_columns(df_columns)
     
-    # Prepare messages for each row
-    messages = []
-    
     # Process each row
-    for idx, row in df.iterrows():
+    for pos, (idx, row) in enumerate(df.iterrows()):
+        # Build the section titles for the next batch of rows at once
+        if pos % batch_size == 0:
+            batch = df.iloc[pos:pos + batch_size]
+            section_names = SlackFormatter.format_section_names(batch)
+            logging_data = SlackMessenger._format_data_for_logging(batch)
+        
         # Get row-specific config or fallback to view_config
         config = TemplateEngine._parse_row_config(row, view_config, col_map)
         config['view'] = view
@@ -286,7 +546,9 @@ def template_f2(
             }
         
         # Build message blocks for this row
-        payload_blocks = TemplateEngine.build_individual_message_blocks(row, df_columns, col_map, config)
+        payload_blocks = TemplateEngine.build_individual_message_blocks(
+            row, df_columns, col_map, config, section_text=section_names.iat[pos % batch_size]
+        )
         
         # Message text can be customized per row or use the default
         row_message_col = col_map.get('MESSAGE_TEXT')
@@ -309,10 +571,418 @@ def template_f2(
             custom_data=custom_data
         )
         
-        # Add to message list
-        messages.append((message_with_metadata, pd.DataFrame([row])))
+        # A one-row slice keeps the dtypes of the frame and is much cheaper than a new frame
+        row_data = df.iloc[pos:pos + 1]
+        row_data.attrs[SlackMessenger.LOGGING_DATA_ATTR] = logging_data[pos % batch_size:pos % batch_size + 1]
+        yield message_with_metadata, row_data
+
+@patch_to(MessageTemplate,cls_method=True)
+def _render_f2_payloads(cls, df: pd.DataFrame, *args, **kwargs) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Render the Format 2 messages for a DataFrame into a list (used by worker processes).
+    
+    Only plain dicts go back from the workers: the rows themselves are taken
+    from the frame again by `_with_row_data`.
+    
+    Args:
+        df: DataFrame with alert data (the whole frame or a chunk of it)
+        *args: Positional arguments for `_iter_f2_messages`
+        **kwargs: Keyword arguments for `_iter_f2_messages`
+        
+    Returns:
+        List of (message_payload, logging_data) tuples in row order, with each row formatted for logging
+    """
+    return [(message_payload, row_data.attrs[SlackMessenger.LOGGING_DATA_ATTR][0]) 
+            for message_payload, row_data in cls._iter_f2_messages(df, *args, **kwargs)]
+
+@patch_to(MessageTemplate,cls_method=True)
+def _with_row_data(
+    cls,
+    rendered: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]],
+    df: pd.DataFrame
+) -> Iterator[Tuple[Dict[str, Any], pd.DataFrame]]:
+    """Pair the payloads rendered by `_render_f2_payloads` with the rows they were rendered from.
+    
+    Args:
+        rendered: Iterable of (message_payload, logging_data) tuples, in the row order of `df`
+        df: DataFrame the payloads were rendered from
+        
+    Yields:
+        (message_payload, row_data) tuples, as from `_iter_f2_messages`
+    """
+    for pos, (message_payload, logging_data) in enumerate(rendered):
+        row_data = df.iloc[pos:pos + 1]
+        row_data.attrs[SlackMessenger.LOGGING_DATA_ATTR] = [logging_data]
+        yield message_payload, row_data
+
+@patch_to(MessageTemplate,cls_method=True)
+def _iter_f2_compiled_messages(
+    cls,
+    df: pd.DataFrame,
+    block_template: BlockTemplate,
+    view: str,
+    view_group: str,
+    message_text: str,
+    channel_id: str,
+    batch_size: int = 100
+) -> Iterator[Tuple[bytes, pd.DataFrame]]:
+    """Lazily render the Format 2 message for each row by filling in a compiled message payload.
+    
+    The slots of `block_template` are filled with `channel`, `text` (the row's MESSAGE_TEXT
+    or `message_text`), `view`, `view_group`, `row_index`, `section_text` (see
+    `SlackFormatter.format_section_names`), and the values of the columns, formatted with
+    `ValueFormatter.format_value`, in slots named after the upper-case column names.
+    
+    Args:
+        df: DataFrame with alert data
+        block_template: Compiled payload of a whole message
+        view: View name
+        view_group: Group name for the view
+        message_text: Main message text
+        channel_id: Slack channel ID
+        batch_size: Number of rows to format at once
+        
+    Yields:
+        (message_payload, row_data) tuples in row order, the payloads as JSON bytes
+    """
+    col_map = ColumnUtils.normalize_columns(list(df.columns))
+    row_message_col = col_map.get('MESSAGE_TEXT')
+    slots = set(block_template.slots)
+    
+    for start in range(0, len(df), batch_size):
+        chunk = df.iloc[start:start + batch_size]
+        
+        # Format the rows a batch at a time, for the template slots and for logging alike
+        section_names = SlackFormatter.format_section_names(chunk)
+        logging_data = SlackMessenger._format_data_for_logging(chunk)
+        columns = {name: col for name, col in col_map.items() if name in slots}
+        texts = (chunk[row_message_col].where(chunk[row_message_col].notna(), message_text).tolist() 
+                 if row_message_col else [message_text] * len(chunk))
+        
+        for pos in range(len(chunk)):
+            values = {name: logging_data[pos][col] for name, col in columns.items()}
+            values.update(channel=channel_id, text=texts[pos], view=view, view_group=view_group,
+                          row_index=chunk.index[pos], section_text=section_names.iat[pos])
+            row_data = chunk.iloc[pos:pos + 1]
+            row_data.attrs[SlackMessenger.LOGGING_DATA_ATTR] = logging_data[pos:pos + 1]
+            yield block_template.render(values), row_data
+
+# %% ../nbs/API/05_message_templates.ipynb 11
+@patch_to(MessageTemplate,cls_method=True)
+def _with_message_ts(
+    cls,
+    messages: Iterable[Tuple[Dict[str, Any], pd.DataFrame]],
+    run: DedupeRun
+) -> Iterator[Tuple[Dict[str, Any], pd.DataFrame]]:
+    """Add the `ts` of each row's previous message to its payload, turning it into an update.
+    
+    Args:
+        messages: Iterable of (message_payload, row_data) tuples
+        run: `DedupeRun` holding the message ts of the rows
+        
+    Yields:
+        (message_payload, row_data) tuples, with a `ts` in the payloads of rows sent before
+    """
+    for message_payload, row_data in messages:
+        ts = run.message_ts(row_data.index[0])
+        yield (dict(message_payload, ts=ts) if ts else message_payload), row_data
+
+# %% ../nbs/API/05_message_templates.ipynb 12
+@patch_to(MessageTemplate,cls_method=True)
+def template_f2(
+    cls,
+    df: pd.DataFrame,
+    view: str,
+    view_group: str,
+    message_text: str,
+    channel_id: str,
+    view_config: Dict[str, Any] = None,
+    send_to_slack_func: Callable = None,
+    log_alert_history_func: Callable = None,
+    renderer: Optional[ParallelRenderer] = None,
+    max_in_flight: int = 1,
+    sender: Optional[ConcurrentSender] = None,
+    rate_limiter: Optional[SlackRateLimiter] = None,
+    scheduler: Optional[SendScheduler] = None,
+    log_alert_history_batch_func: Optional[Callable] = None,
+    dedupe: Optional[AlertDeduplicator] = None,
+    update_slack_func: Optional[Callable] = None,
+    outbox: Optional[AlertOutbox] = None,
+    outbox_run_id: Optional[str] = None,
+    smoother: Optional[SendSmoother] = None,
+    block_template: Optional[BlockTemplate] = None,
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Slack Message Format 2: Individual interactive messages for each row.
     
-    # Send messages and log results
-    return cls._send_messages_and_log_with_metadata(
-        messages, view, view_group, channel_id, send_to_slack_func, log_alert_history_func
+    Args:
+        df: DataFrame with alert data
+        view: View name
+        view_group: Group name for the view
+        message_text: Main message text
+        channel_id: Slack channel ID
+        view_config: Configuration for the view
+        send_to_slack_func: Function to send messages to Slack
+        log_alert_history_func: Function to log alert history
+        renderer: Optional `ParallelRenderer` to render large frames in worker processes
+        max_in_flight: Maximum number of rendered messages waiting to be sent; above 1,
+            rendering runs ahead of sending in a background thread
+        sender: Optional `ConcurrentSender` to send several messages at once
+        rate_limiter: Optional `SlackRateLimiter` to keep sends within Slack's rate limits
+        scheduler: Optional `SendScheduler` to take turns with the other views sending at the same time
+        log_alert_history_batch_func: Function to log the alert history of all messages at once,
+            called with a DataFrame after the last send instead of `log_alert_history_func`
+        dedupe: Optional `AlertDeduplicator` to only send the rows that are new or changed
+        update_slack_func: Function to update posted messages (e.g. `PooledSlackClient.update_message`);
+            with `dedupe`, changed rows edit their earlier message instead of posting a new one
+        outbox: Optional `AlertOutbox` to store the rendered messages before sending them, checkpointing
+            each outcome
+        outbox_run_id: Id of the run in the outbox, e.g. the id of the scheduled job execution; a call
+            with the id of an unfinished run resumes it with the messages it did not send, without
+            rendering `df` again. Without it, each call is a new run, forgotten once it ends
+        smoother: Optional `SendSmoother` to spread the messages of a non-urgent view over a time window
+        block_template: Optional `BlockTemplate` of the whole message payload, filled in for each row
+            and sent as JSON bytes instead of building the blocks (see `_iter_f2_compiled_messages`
+            for its slots); the send functions must accept bytes, as those of `PooledSlackClient` do.
+            Not supported with `renderer`, `update_slack_func` or `outbox`
+        
+    Returns:
+        Tuple of (success_flag, error_details)
+    """
+    DebugLogger.log('Processing template_f2 for view: %s', view)
+    if block_template is not None and (renderer is not None or update_slack_func is not None or outbox is not None):
+        raise ValueError("block_template can't be combined with renderer, update_slack_func or outbox")
+    
+    # Only send the rows that are new or changed since the last run
+    run = dedupe.start(df, view, channel_id) if dedupe is not None else None
+    on_sent = None
+    if run is not None:
+        df = run.changed
+        
+        def on_sent(row_data, success, response):
+            # The messages of a resumed outbox run were rendered from an earlier frame, not from `df`
+            if success and not (outbox_run is not None and outbox_run.resumed):
+                # Keep the message ts, so the next change of the row can update this message
+                ts = SlackMessenger._message_ts(response)
+                run.mark_sent(row_data.index[0], **({'ts': ts} if ts else {}))
+    
+    # Lazily render a message for each row, in worker processes if configured
+    render_args = (view, view_group, message_text, channel_id, view_config)
+    if block_template is not None:
+        messages = cls._iter_f2_compiled_messages(df, block_template, view, view_group, message_text, channel_id)
+    elif renderer is not None:
+        messages = cls._with_row_data(renderer.render(cls._render_f2_payloads, df, *render_args), df)
+    else:
+        messages = cls._iter_f2_messages(df, *render_args)
+    
+    # Changed rows update the message they were last sent in
+    if run is not None and update_slack_func is not None:
+        messages = cls._with_message_ts(messages, run)
+    
+    # Store the rendered messages, or pick up the unsent messages of an interrupted run;
+    # only an explicit run id resumes a run, so a later call never replaces its rows with stale ones
+    outbox_run = None
+    if outbox is not None:
+        outbox_run = outbox.start(outbox_run_id or f'{view}:{channel_id}:{uuid.uuid4().hex}', messages)
+        messages = outbox_run.pending()
+    
+    # Spread the sends of a non-urgent view over the smoothing window
+    smoothing = None
+    if smoother is not None:
+        smoothing = smoother.start(outbox_run.remaining() if outbox_run is not None else len(df), view)
+    
+    # Keep rendering ahead of sending, within a bounded window
+    if max_in_flight > 1:
+        messages = stream_ahead(messages, window=max_in_flight - 1)
+    
+    # Send and log each message as soon as it is rendered
+    result = cls._send_messages_and_log_with_metadata(
+        messages, view, view_group, channel_id, send_to_slack_func, log_alert_history_func,
+        sender=sender, rate_limiter=rate_limiter, scheduler=scheduler,
+        log_alert_history_batch_func=log_alert_history_batch_func,
+        on_sent=on_sent, update_slack_func=update_slack_func, outbox_run=outbox_run,
+        smoothing=smoothing
     )
+    
+    # Forget the stored messages once nothing is left to send, or always when the run can't be resumed
+    if outbox_run is not None and not outbox_run.finish() and outbox_run_id is None:
+        outbox.clear(outbox_run.run_id)
+    
+    # Remember the rows that were sent, so they are suppressed until they change
+    if run is not None:
+        run.commit()
+    return result
+
+# %% ../nbs/API/05_message_templates.ipynb 13
+@patch_to(MessageTemplate,cls_method=True)
+def _build_digest_blocks(
+    cls,
+    df: pd.DataFrame,
+    group_by: Optional[str] = None,
+    top_n: int = 5,
+    max_groups: int = 20,
+    detail_columns: Optional[List[str]] = None,
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    has_attachment: bool = False
+) -> List[Dict[str, Any]]:
+    """Build the blocks of a digest: a summary, then the count and top rows of each group.
+    
+    Args:
+        df: DataFrame with alert data
+        group_by: Column to group the rows by (all rows form one group if None)
+        top_n: Number of rows listed per group
+        max_groups: Number of groups listed, largest first
+        detail_columns: Columns shown next to each listed row (the first three are used)
+        sort_by: Column ranking the rows within a group
+        ascending: Rank `sort_by` in ascending order
+        has_attachment: Whether the full detail is attached as a file
+        
+    Returns:
+        List of Slack blocks, without a header
+    """
+    frame = df.reset_index(drop=True)
+    section_names = SlackFormatter.format_section_names(frame)
+    if sort_by:
+        frame = frame.sort_values(sort_by, ascending=ascending, kind='stable')
+    if detail_columns is None:
+        detail_columns = ColumnUtils.get_detail_columns(list(frame.columns))
+    detail_columns = [col for col in detail_columns if col in frame.columns and col != group_by][:3]
+    
+    # Largest groups first, keeping the order of first appearance among equal sizes
+    groups = list(frame.groupby(group_by, sort=False, dropna=False)) if group_by else [(None, frame)]
+    groups.sort(key=lambda group: -len(group[1]))
+    
+    summary = f"*{len(frame)}* rows" + (f" in *{len(groups)}* groups by {group_by}" if group_by else "")
+    blocks = [BlockBuilder.create_section_block(summary)]
+    
+    for key, rows in groups[:max_groups]:
+        lines = [f"*{ValueFormatter.format_value(key) or '(blank)'}* · {len(rows)} rows"] if group_by else []
+        for pos, row in rows.head(top_n).iterrows():
+            details = ' · '.join(value for value in (ValueFormatter.format_value(row[col]) for col in detail_columns) if value)
+            lines.append(f"• {section_names[pos]}" + (f" — {details}" if details else ""))
+        if len(rows) > top_n:
+            lines.append(f"_…and {len(rows) - top_n} more_")
+        blocks.append(BlockBuilder.create_section_block('\n'.join(lines)[:3000]))
+    
+    notes = []
+    if len(groups) > max_groups:
+        hidden = groups[max_groups:]
+        notes.append(f"{len(hidden)} more groups with {sum(len(rows) for _, rows in hidden)} rows")
+    if has_attachment:
+        notes.append("full detail in the attached CSV")
+    if notes:
+        note = '; '.join(notes)
+        blocks.append(BlockBuilder.create_context_block(note[0].upper() + note[1:]))
+    return blocks
+
+# %% ../nbs/API/05_message_templates.ipynb 14
+@patch_to(MessageTemplate,cls_method=True)
+def template_digest(
+    cls,
+    df: pd.DataFrame,
+    view: str,
+    view_group: str,
+    message_text: str,
+    channel_id: str,
+    view_config: Dict[str, Any] = None,
+    send_to_slack_func: Callable = None,
+    log_alert_history_func: Callable = None,
+    upload_file_func: Optional[Callable] = None,
+    rate_limiter: Optional[SlackRateLimiter] = None,
+    scheduler: Optional[SendScheduler] = None,
+    log_alert_history_batch_func: Optional[Callable] = None,
+    paginator: Optional[BlockPaginator] = None,
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Slack Message Digest: group counts and top rows in one message, full detail as a CSV file.
+    
+    The digest is configured through `view_config`:
+    - digest_group_by: Column to group the rows by
+    - digest_top_n: Number of rows listed per group (default 5)
+    - digest_max_groups: Number of groups listed (default 20)
+    - digest_sort_by / digest_ascending: Ranking of the rows within a group
+    - detail_columns: Columns shown next to each listed row
+    
+    Args:
+        df: DataFrame with alert data
+        view: View name
+        view_group: Group name for the view
+        message_text: Main message text
+        channel_id: Slack channel ID
+        view_config: Configuration for the view
+        send_to_slack_func: Function to send messages to Slack, as for `template_f1`
+        log_alert_history_func: Function to log alert history
+        upload_file_func: Function uploading the CSV, called with (channel, filename, content, title=)
+            (e.g. `PooledSlackClient.upload_file`); no file is attached if None
+        rate_limiter: Optional `SlackRateLimiter` to keep the calls within Slack's rate limits
+        scheduler: Optional `SendScheduler` to take turns with the other views sending at the same time
+        log_alert_history_batch_func: Function to log alert history as a DataFrame of records,
+            used instead of `log_alert_history_func`
+        paginator: `BlockPaginator` splitting the digest if it exceeds Slack's limits
+        
+    Returns:
+        Tuple of (success_flag, error_details)
+    """
+    DebugLogger.log('Processing template_digest for view: %s', view)
+    view_config = view_config or {}
+    
+    # Create title from view name
+    title = view.lower().replace(view_group, '').replace('_', ' ').title()
+    attach = upload_file_func is not None and not df.empty
+    
+    payload_blocks = cls._build_digest_blocks(
+        df,
+        group_by=view_config.get('digest_group_by'),
+        top_n=view_config.get('digest_top_n', 5),
+        max_groups=view_config.get('digest_max_groups', 20),
+        detail_columns=view_config.get('detail_columns'),
+        sort_by=view_config.get('digest_sort_by'),
+        ascending=view_config.get('digest_ascending', False),
+        has_attachment=attach
+    )
+    
+    send_to_slack_func = cls._wrap_send_func(send_to_slack_func, view, view_group, channel_id, scheduler, rate_limiter)
+    if attach:
+        upload_file_func = cls._wrap_send_func(upload_file_func, view, view_group, None, scheduler, rate_limiter, 
+                                               method='files.getUploadURLExternal')
+    
+    # Send the digest, split only if it exceeds Slack's limits
+    paginator = paginator or BlockPaginator()
+    pages = paginator.paginate(
+        payload_blocks, 
+        reserved_blocks=1, 
+        reserved_chars=paginator.block_size(BlockBuilder.create_header_block(f'{title} (000/000)'))
+    )
+    print(f'   Sending Digest for {view}')
+    success, error_details = cls._send_pages(pages, title, view, channel_id, message_text, send_to_slack_func)
+    
+    # Attach the full detail as a CSV file
+    if attach:
+        try:
+            uploaded, upload_error, _ = SlackMessenger._unpack_send_result(upload_file_func(
+                channel_id, f'{view}.csv', df.to_csv(index=False), title=f'{title} - full detail'
+            ))
+        except Exception as e:
+            uploaded, upload_error = False, {'slack_api_error': str(e)}
+        if not uploaded:
+            print(f'   Error uploading detail file for {view}: {upload_error}')
+            success = False
+            error_details = {'message': error_details, 'upload': upload_error}
+    
+    if log_alert_history_batch_func:
+        # Log alert history as a one-record batch
+        history = AlertHistoryBatch()
+        history.add(view, view_group, channel_id, success, error_details, df, message_text)
+        history.flush(log_alert_history_batch_func)
+    elif log_alert_history_func:
+        # Log alert history
+        SlackMessenger._log_alert(
+            log_alert_history_func,
+            view=view,
+            view_group=view_group,
+            channel_id=channel_id,
+            success=success,
+            error_details=error_details,
+            formatted_data=SlackMessenger._format_data_for_logging(df),
+            message_text=message_text
+        )
+    
+    return success, error_details
@@ -6,7 +6,6 @@ __all__ = ['MessageMetadataHandler']
 # %% ../nbs/API/06_metadata_handler.ipynb 3
 from fastcore.basics import patch_to
 from fastcore.test import *
-import json
 from typing import Dict, Any, Optional, List
 
 # %% ../nbs/API/06_metadata_handler.ipynb 5
@@ -0,0 +1,225 @@
+"""Local mock of the Slack Web API, to benchmark and test sends offline"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/27_mock_slack.ipynb.
+
+# %% auto 0
+__all__ = ['MockSlackServer']
+
+# %% ../nbs/API/27_mock_slack.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from .rate_limit import TokenBucket
+from .slack_client import PooledSlackClient
+from . import serialization
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+import itertools
+import random
+import threading
+import math
+import time
+
+# %% ../nbs/API/27_mock_slack.ipynb 5
+class _MockSlackHandler(BaseHTTPRequestHandler):
+    """Request handler of `MockSlackServer`, answering through `server.mock`."""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path.startswith('/upload/'):
+            method, payload = 'upload', raw
+        else:
+            method = self.path.rsplit('/', 1)[-1]
+            if self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+                payload = {key: values[0] for key, values in parse_qs(raw.decode()).items()}
+            else:
+                payload = serialization.loads(raw) if raw else {}
+        
+        status, headers, data = self.server.mock.handle(method, payload)
+        body = serialization.dumps_bytes(data)
+        self.send_response(status)
+        for key, value in {**headers, 'Content-Type': 'application/json', 'Content-Length': str(len(body))}.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+# %% ../nbs/API/27_mock_slack.ipynb 6
+class MockSlackServer:
+    """
+    Local HTTP server mocking the Slack Web API, with configurable latency, errors and rate limits.
+    """
+    
+    # Error of the calls failing at `error_rate`
+    ERROR = 'internal_error'
+    
+    def __init__(self, 
+                 latency: float = 0.0, 
+                 jitter: float = 0.0, 
+                 error_rate: float = 0.0, 
+                 rate_limited_rate: float = 0.0, 
+                 method_rates: Optional[Dict[str, float]] = None, 
+                 retry_after: Optional[float] = None, 
+                 seed: Optional[int] = None, 
+                 host: str = '127.0.0.1', 
+                 port: int = 0):
+        """Initialize the server (started by `start` or by entering it as a context manager).
+        
+        Args:
+            latency: Seconds every call takes
+            jitter: Maximum random seconds added to `latency`
+            error_rate: Fraction of calls failing with `ERROR`
+            rate_limited_rate: Fraction of calls answered with HTTP 429
+            method_rates: Calls per second allowed for each method, e.g. {'chat.postMessage': 1}
+            retry_after: `Retry-After` of the 429 responses, in seconds (by default 1 for random
+                429s, and the time until the next allowed call, rounded up, for `method_rates`)
+            seed: Random seed of the latency, errors and 429s
+            host: Host to listen on
+            port: Port to listen on (0 for any free port)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limited_rate = rate_limited_rate
+        self.method_rates = method_rates or {}
+        self.retry_after = retry_after
+        self.host = host
+        self.port = port
+        self.calls = []
+        self.messages = {}
+        self.stats = {'calls': 0, 'ok': 0, 'errors': 0, 'rate_limited': 0}
+        self.client = None
+        self._rng = random.Random(seed)
+        self._buckets = {method: TokenBucket(rate, capacity=1) for method, rate in self.method_rates.items()}
+        self._ts = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    @property
+    def base_url(self) -> str:
+        """Web API base URL of the server, for `PooledSlackClient(base_url=...)`."""
+        return f'http://{self.host}:{self.port}/api/'
+    
+    @property
+    def send_to_slack_func(self) -> Callable:
+        """`send_message(payload, message_id)` of a client of the server, for `template_f2`."""
+        return self.client.send_message
+    
+    @property
+    def post_to_slack_func(self) -> Callable:
+        """`post_message(channel, text, payload_blocks)` of a client of the server, for `template_f1`."""
+        return self.client.post_message
+
+# %% ../nbs/API/27_mock_slack.ipynb 7
+@patch_to(MockSlackServer)
+def start(self, pool_size: int = 10) -> 'MockSlackServer':
+    """Start serving in a background thread, with a client of `pool_size` connections."""
+    self._httpd = ThreadingHTTPServer((self.host, self.port), _MockSlackHandler)
+    self._httpd.daemon_threads = True
+    self._httpd.mock = self
+    self.port = self._httpd.server_port
+    threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+    self.client = PooledSlackClient(token='xoxb-mock', base_url=self.base_url, pool_size=pool_size)
+    return self
+
+@patch_to(MockSlackServer)
+def stop(self):
+    """Close the client and stop the server."""
+    if self.client is not None:
+        self.client.close()
+    if self._httpd is not None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+
+@patch_to(MockSlackServer)
+def reset(self):
+    """Forget the recorded calls, messages and statistics."""
+    with self._lock:
+        self.calls.clear()
+        self.messages.clear()
+        self.stats = dict.fromkeys(self.stats, 0)
+
+# %% ../nbs/API/27_mock_slack.ipynb 8
+@patch_to(MockSlackServer)
+def _throttle(self, method: str) -> Optional[float]:
+    """Decide whether a call is rate limited, returning its `Retry-After` (None if it isn't)."""
+    bucket = self._buckets.get(method)
+    if bucket is not None:
+        wait = bucket.wait_time()
+        if wait > 0:
+            return self.retry_after if self.retry_after is not None else math.ceil(wait)
+        bucket.reserve()
+    if self.rate_limited_rate and self._rng.random() < self.rate_limited_rate:
+        return self.retry_after if self.retry_after is not None else 1
+    return None
+
+@patch_to(MockSlackServer)
+def handle(self, method: str, payload: Any) -> Tuple[int, Dict[str, str], Dict[str, Any]]:
+    """Answer a Web API call.
+    
+    Args:
+        method: Web API method, or 'upload' for the upload of a file's content
+        payload: Arguments of the call (the file's content for 'upload')
+        
+    Returns:
+        Tuple of (HTTP status, headers, response body)
+    """
+    with self._lock:
+        self.stats['calls'] += 1
+        self.calls.append((method, payload))
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        retry_after = self._throttle(method)
+        failed = retry_after is None and self.error_rate and self._rng.random() < self.error_rate
+        if retry_after is not None:
+            self.stats['rate_limited'] += 1
+        elif failed:
+            self.stats['errors'] += 1
+    if delay > 0:
+        time.sleep(delay)
+    
+    if retry_after is not None:
+        return 429, {'Retry-After': str(retry_after)}, {'ok': False, 'error': 'ratelimited'}
+    if failed:
+        return 200, {}, {'ok': False, 'error': self.ERROR}
+    data = self._respond(method, payload)
+    with self._lock:
+        self.stats['ok' if data.get('ok') else 'errors'] += 1
+    return 200, {}, data
+
+# %% ../nbs/API/27_mock_slack.ipynb 9
+@patch_to(MockSlackServer)
+def _respond(self, method: str, payload: Any) -> Dict[str, Any]:
+    """Get the successful response of a call, keeping track of the posted messages."""
+    if method in ('chat.postMessage', 'chat.update'):
+        channel = payload.get('channel')
+        if not channel:
+            return {'ok': False, 'error': 'channel_not_found'}
+        if method == 'chat.update':
+            ts = payload.get('ts')
+            if (channel, ts) not in self.messages:
+                return {'ok': False, 'error': 'message_not_found'}
+        else:
+            ts = f'1700000000.{next(self._ts):06d}'
+        with self._lock:
+            self.messages[(channel, ts)] = payload
+        return {'ok': True, 'channel': channel, 'ts': ts, 'message': {'text': payload.get('text', '')}}
+    if method == 'chat.scheduleMessage':
+        return {'ok': True, 'channel': payload.get('channel'), 'scheduled_message_id': f'Q{next(self._ts)}', 
+                'post_at': payload.get('post_at')}
+    if method == 'files.getUploadURLExternal':
+        file_id = f'F{next(self._ts)}'
+        return {'ok': True, 'file_id': file_id, 'upload_url': f'http://{self.host}:{self.port}/upload/{file_id}'}
+    if method in ('upload', 'files.completeUploadExternal'):
+        return {'ok': True}
+    return {'ok': False, 'error': 'unknown_method'}
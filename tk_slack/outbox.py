@@ -0,0 +1,235 @@
+"""Durable queue of rendered messages, so interrupted send runs resume where they stopped"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/19_outbox.ipynb.
+
+# %% auto 0
+__all__ = ['AlertOutbox', 'OutboxRun']
+
+# %% ../nbs/API/19_outbox.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from . import serialization
+from typing import List, Tuple, Dict, Any, Iterable, Iterator, Optional
+import pandas as pd
+import threading
+import sqlite3
+import time
+
+# %% ../nbs/API/19_outbox.ipynb 5
+class AlertOutbox:
+    """
+    Durable queue of rendered Slack messages, kept in an SQLite database.
+    """
+    
+    STATUSES = ('pending', 'sent', 'failed')
+    
+    def __init__(self, path: str, table: str = 'alert_outbox', max_attempts: int = 3):
+        """Initialize the outbox, creating its table if needed.
+        
+        Args:
+            path: Path of the database file (or ':memory:')
+            table: Table name
+            max_attempts: Number of times a message is sent before it is given up
+        """
+        self.path = path
+        self.table = table
+        self.max_attempts = max_attempts
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            # Cheap commits, since every send is checkpointed
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    run_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    row_data TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (run_id, seq)
+                )
+            """)
+    
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+    
+    @staticmethod
+    def _dump_rows(row_data: pd.DataFrame) -> str:
+        """Serialize the row data of a message, keeping its index."""
+        return serialization.dumps({
+            'columns': list(row_data.columns),
+            'index': list(row_data.index),
+            'data': row_data.values.tolist()
+        })
+    
+    @staticmethod
+    def _load_rows(text: str) -> pd.DataFrame:
+        """Rebuild the row data of a message."""
+        frame = serialization.loads(text)
+        return pd.DataFrame(frame['data'], index=frame['index'], columns=frame['columns'])
+
+# %% ../nbs/API/19_outbox.ipynb 6
+@patch_to(AlertOutbox)
+def has_run(self, run_id: str) -> bool:
+    """Check whether the outbox holds the messages of a run."""
+    with self._lock:
+        row = self._conn.execute(
+            f"SELECT 1 FROM {self.table} WHERE run_id = ? LIMIT 1", (run_id,)
+        ).fetchone()
+    return row is not None
+
+@patch_to(AlertOutbox)
+def runs(self) -> List[str]:
+    """List the runs the outbox holds messages of, e.g. to resume runs interrupted by a crash."""
+    with self._lock:
+        rows = self._conn.execute(f"SELECT DISTINCT run_id FROM {self.table} ORDER BY run_id").fetchall()
+    return [run_id for run_id, in rows]
+
+@patch_to(AlertOutbox)
+def enqueue(self, run_id: str, messages: Iterable[Tuple[Dict[str, Any], pd.DataFrame]], batch_size: int = 500) -> int:
+    """Store the rendered messages of a run as pending.
+    
+    Args:
+        run_id: Id of the run
+        messages: Iterable of (message_payload, row_data) tuples
+        batch_size: Number of messages written per transaction
+        
+    Returns:
+        Number of messages stored
+    """
+    count = 0
+    batch = []
+    
+    def write():
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (run_id, seq, payload, row_data, status, attempts, error, updated_at) "
+                "VALUES (?, ?, ?, ?, 'pending', 0, NULL, ?)",
+                batch
+            )
+        batch.clear()
+    
+    for message_payload, row_data in messages:
+        batch.append((run_id, count, serialization.dumps(message_payload), self._dump_rows(row_data), time.time()))
+        count += 1
+        if len(batch) >= batch_size:
+            write()
+    if batch:
+        write()
+    return count
+
+@patch_to(AlertOutbox)
+def start(self, run_id: str, messages: Iterable[Tuple[Dict[str, Any], pd.DataFrame]]) -> 'OutboxRun':
+    """Start a run, or resume it if the outbox still holds its messages.
+    
+    Args:
+        run_id: Id of the run, the same for a run and its restarts (e.g. the id of a scheduled job execution)
+        messages: Iterable of (message_payload, row_data) tuples, only consumed for a new run
+        
+    Returns:
+        `OutboxRun` to read the messages to send and record their outcomes
+    """
+    resumed = self.has_run(run_id)
+    if not resumed:
+        self.enqueue(run_id, messages)
+    return OutboxRun(self, run_id, resumed=resumed)
+
+@patch_to(AlertOutbox)
+def clear(self, run_id: str):
+    """Forget all messages of a run."""
+    with self._lock, self._conn:
+        self._conn.execute(f"DELETE FROM {self.table} WHERE run_id = ?", (run_id,))
+
+@patch_to(AlertOutbox)
+def stats(self, run_id: str) -> Dict[str, int]:
+    """Count the messages of a run by status."""
+    with self._lock:
+        rows = self._conn.execute(
+            f"SELECT status, COUNT(*) FROM {self.table} WHERE run_id = ? GROUP BY status", (run_id,)
+        ).fetchall()
+    counts = {status: 0 for status in self.STATUSES}
+    counts.update(rows)
+    return counts
+
+# %% ../nbs/API/19_outbox.ipynb 7
+class OutboxRun:
+    """
+    Messages of one send run in an `AlertOutbox`.
+    """
+    
+    def __init__(self, outbox: AlertOutbox, run_id: str, resumed: bool = False):
+        """Initialize the run.
+        
+        Args:
+            outbox: Outbox holding the messages
+            run_id: Id of the run
+            resumed: Whether the messages were stored by an earlier, interrupted run
+        """
+        self.outbox = outbox
+        self.run_id = run_id
+        self.resumed = resumed
+        self._seqs = []
+    
+    def pending(self) -> Iterator[Tuple[Dict[str, Any], pd.DataFrame]]:
+        """Read back the messages that still have to be sent, in order.
+        
+        Yields:
+            (message_payload, row_data) tuples; the position of each message in this
+            iteration is the `position` to pass to `mark`
+        """
+        outbox = self.outbox
+        self._seqs = []
+        with outbox._lock:
+            rows = outbox._conn.execute(
+                f"SELECT seq, payload, row_data FROM {outbox.table} "
+                "WHERE run_id = ? AND status != 'sent' AND attempts < ? ORDER BY seq",
+                (self.run_id, outbox.max_attempts)
+            ).fetchall()
+        for seq, payload, row_data in rows:
+            self._seqs.append(seq)
+            yield serialization.loads(payload), outbox._load_rows(row_data)
+    
+    def mark(self, position: int, success: bool, error: Any = None):
+        """Checkpoint the outcome of a send.
+        
+        Args:
+            position: Position of the message in the `pending` iteration
+            success: Whether the message was sent
+            error: Error details of a failed send
+        """
+        outbox = self.outbox
+        with outbox._lock, outbox._conn:
+            outbox._conn.execute(
+                f"UPDATE {outbox.table} SET status = ?, attempts = attempts + 1, error = ?, updated_at = ? "
+                "WHERE run_id = ? AND seq = ?",
+                ('sent' if success else 'failed', None if success else serialization.dumps(error),
+                 time.time(), self.run_id, self._seqs[position])
+            )
+    
+    def remaining(self) -> int:
+        """Count the messages that a resume would still send."""
+        outbox = self.outbox
+        with outbox._lock:
+            return outbox._conn.execute(
+                f"SELECT COUNT(*) FROM {outbox.table} WHERE run_id = ? AND status != 'sent' AND attempts < ?",
+                (self.run_id, outbox.max_attempts)
+            ).fetchone()[0]
+    
+    def finish(self) -> bool:
+        """Forget the run if nothing is left to send.
+        
+        Returns:
+            Whether the run is complete
+        """
+        if self.remaining():
+            return False
+        self.outbox.clear(self.run_id)
+        return True
+    
+    def stats(self) -> Dict[str, int]:
+        """Count the messages of the run by status."""
+        return self.outbox.stats(self.run_id)
@@ -0,0 +1,63 @@
+"""Split long block lists into messages that fit Slack's limits"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/18_pagination.ipynb.
+
+# %% auto 0
+__all__ = ['BlockPaginator']
+
+# %% ../nbs/API/18_pagination.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from . import serialization
+from typing import List, Dict, Any
+
+# %% ../nbs/API/18_pagination.ipynb 6
+class BlockPaginator:
+    """
+    Splits a list of blocks into pages that fit Slack's message limits.
+    """
+    
+    MAX_BLOCKS = 50
+    MAX_CHARS = 40000
+    
+    def __init__(self, max_blocks: int = MAX_BLOCKS, max_chars: int = MAX_CHARS):
+        """Initialize the paginator.
+        
+        Args:
+            max_blocks: Maximum number of blocks per message
+            max_chars: Maximum encoded size of the blocks of a message
+        """
+        self.max_blocks = max_blocks
+        self.max_chars = max_chars
+    
+    @staticmethod
+    def block_size(block: Dict[str, Any]) -> int:
+        """Measure the encoded size of a block."""
+        return len(serialization.dumps_bytes(block))
+
+# %% ../nbs/API/18_pagination.ipynb 7
+@patch_to(BlockPaginator)
+def paginate(self, blocks: List[Dict[str, Any]], reserved_blocks: int = 0, reserved_chars: int = 0) -> List[List[Dict[str, Any]]]:
+    """Split blocks into as few pages as fit the limits, keeping their order.
+    
+    Args:
+        blocks: Blocks to split
+        reserved_blocks: Number of blocks to leave room for on every page
+        reserved_chars: Encoded size to leave room for on every page
+        
+    Returns:
+        List of pages, each a list of blocks (one empty page if there are no blocks)
+    """
+    max_blocks = max(1, self.max_blocks - reserved_blocks)
+    max_chars = self.max_chars - reserved_chars
+    
+    pages = [[]]
+    page_chars = 0
+    for block in blocks:
+        size = self.block_size(block) + 1  # plus the separating comma
+        if pages[-1] and (len(pages[-1]) >= max_blocks or page_chars + size > max_chars):
+            pages.append([])
+            page_chars = 0
+        pages[-1].append(block)
+        page_chars += size
+    return pages
@@ -0,0 +1,100 @@
+"""Render very large alert frames in worker processes"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/10_parallel_render.ipynb.
+
+# %% auto 0
+__all__ = ['ParallelRenderer']
+
+# %% ../nbs/API/10_parallel_render.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from typing import List, Tuple, Dict, Any, Callable, Optional, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+import pandas as pd
+import os
+
+# %% ../nbs/API/10_parallel_render.ipynb 6
+class ParallelRenderer:
+    """
+    Renders DataFrame chunks in a process pool and streams the results back in order.
+    
+    The pool is created on first use and reused across calls; use the renderer as
+    a context manager (or call `close`) to shut the workers down.
+    """
+    
+    def __init__(self, 
+                 workers: Optional[int] = None, 
+                 chunk_size: int = 500, 
+                 min_rows: int = 2000,
+                 max_pending: Optional[int] = None):
+        """Initialize the renderer.
+        
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+            chunk_size: Rows per chunk sent to a worker
+            min_rows: Frames with fewer rows are rendered in-process
+            max_pending: Maximum number of chunks in flight (defaults to 2 per worker)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.min_rows = min_rows
+        self.max_pending = max_pending or 2 * self.workers
+        self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+# %% ../nbs/API/10_parallel_render.ipynb 7
+@patch_to(ParallelRenderer)
+def _get_executor(self) -> ProcessPoolExecutor:
+    """Get the process pool, creating it if needed."""
+    if self._executor is None:
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+    return self._executor
+
+@patch_to(ParallelRenderer)
+def close(self):
+    """Shut down the worker processes if they were started."""
+    if self._executor is not None:
+        self._executor.shutdown()
+        self._executor = None
+
+# %% ../nbs/API/10_parallel_render.ipynb 8
+@patch_to(ParallelRenderer)
+def uses_workers(self, df: pd.DataFrame) -> bool:
+    """Whether `df` is large enough to be rendered in worker processes."""
+    return self.workers > 1 and len(df) >= self.min_rows and len(df) > self.chunk_size
+
+@patch_to(ParallelRenderer)
+def render(self, render_func: Callable, df: pd.DataFrame, *args) -> Iterator[Any]:
+    """Render a DataFrame chunk by chunk, yielding the rendered items in row order.
+    
+    Args:
+        render_func: Importable function taking (chunk, *args) and returning a list of items
+        df: DataFrame to render
+        *args: Extra arguments passed to `render_func` with every chunk
+        
+    Yields:
+        Rendered items, in the same order as the rows of `df`
+    """
+    if not self.uses_workers(df):
+        yield from render_func(df, *args)
+        return
+        
+    executor = self._get_executor()
+    pending = deque()
+    
+    for start in range(0, len(df), self.chunk_size):
+        chunk = df.iloc[start:start + self.chunk_size]
+        pending.append(executor.submit(render_func, chunk, *args))
+        
+        # Keep a bounded number of chunks in flight, yielding the oldest first
+        if len(pending) >= self.max_pending:
+            yield from pending.popleft().result()
+            
+    while pending:
+        yield from pending.popleft().result()
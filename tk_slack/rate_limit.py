@@ -0,0 +1,275 @@
+"""Token-bucket scheduling for Slack API calls, with Retry-After handling"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/13_rate_limit.ipynb.
+
+# %% auto 0
+__all__ = ['TokenBucket', 'SlackRateLimiter']
+
+# %% ../nbs/API/13_rate_limit.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from .core import DebugLogger
+from typing import Tuple, Dict, Any, Callable, Optional
+import functools
+import re
+import threading
+import time
+
+# %% ../nbs/API/13_rate_limit.ipynb 5
+class TokenBucket:
+    """
+    Thread-safe token bucket spacing out calls at an adaptive rate.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None, min_rate: Optional[float] = None):
+        """Initialize the bucket.
+        
+        Args:
+            rate: Sustained rate, in calls per second
+            capacity: Maximum burst size (defaults to one second of calls, at least 1)
+            min_rate: Lowest rate the bucket slows down to (defaults to a tenth of `rate`)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 10
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+# %% ../nbs/API/13_rate_limit.ipynb 6
+@patch_to(TokenBucket)
+def _refill(self, now: float):
+    """Add the tokens earned since the last update."""
+    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+    self._updated = now
+
+@patch_to(TokenBucket)
+def reserve(self) -> float:
+    """Take a token, returning how long the caller must wait before using it (in seconds)."""
+    with self._lock:
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._paused_until - now)
+
+@patch_to(TokenBucket)
+def acquire(self) -> float:
+    """Wait for a token, returning the time waited (in seconds)."""
+    wait = self.reserve()
+    if wait > 0:
+        time.sleep(wait)
+    return wait
+
+@patch_to(TokenBucket)
+def wait_time(self) -> float:
+    """Get how long until a token is available, without taking it (in seconds)."""
+    with self._lock:
+        now = time.monotonic()
+        self._refill(now)
+        wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+        return max(wait, self._paused_until - now)
+
+@patch_to(TokenBucket)
+def pause(self, seconds: float):
+    """Hold all calls for `seconds`, dropping any saved-up burst."""
+    with self._lock:
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+        self._paused_until = max(self._paused_until, now + seconds)
+
+@patch_to(TokenBucket)
+def slow_down(self, factor: float = 0.5):
+    """Lower the rate after being throttled."""
+    with self._lock:
+        self._refill(time.monotonic())
+        self.rate = max(self.min_rate, self.rate * factor)
+
+@patch_to(TokenBucket)
+def speed_up(self, factor: float = 1.1):
+    """Raise the rate back towards its maximum after a successful call."""
+    if self.rate < self.max_rate:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate * factor)
+
+# %% ../nbs/API/13_rate_limit.ipynb 9
+class SlackRateLimiter:
+    """
+    Schedules Slack API calls within per-method and per-channel rate limits.
+    """
+    
+    # Calls per second for each method, from Slack's rate limit tiers
+    TIER_RATES = {1: 1 / 60, 2: 20 / 60, 3: 50 / 60, 4: 100 / 60}
+    METHOD_RATES = {
+        'chat.postMessage': 5.0,
+        'chat.postEphemeral': TIER_RATES[4],
+        'chat.update': TIER_RATES[3],
+        'chat.delete': TIER_RATES[3],
+        'chat.scheduleMessage': TIER_RATES[3],
+        'files.upload': TIER_RATES[2],
+        'files.getUploadURLExternal': TIER_RATES[4],
+        'files.completeUploadExternal': TIER_RATES[4],
+        'views.open': TIER_RATES[4],
+        'response_url': 1.0,
+    }
+    
+    # Methods that are also limited per channel
+    CHANNEL_METHODS = {'chat.postMessage', 'chat.postEphemeral'}
+    
+    # Delay used when Slack does not say how long to wait
+    DEFAULT_RETRY_AFTER = 1.0
+    
+    def __init__(self, 
+                 method_rates: Optional[Dict[str, float]] = None, 
+                 channel_rate: float = 1.0,
+                 channel_burst: float = 3,
+                 max_retries: int = 5):
+        """Initialize the limiter.
+        
+        Args:
+            method_rates: Overrides of `METHOD_RATES`, in calls per second
+            channel_rate: Messages per second per channel
+            channel_burst: Maximum burst of messages to a channel
+            max_retries: Maximum number of retries of a rate limited call
+        """
+        self.method_rates = {**self.METHOD_RATES, **(method_rates or {})}
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.max_retries = max_retries
+        self.stats = {'calls': 0, 'throttled': 0, 'retries': 0, 'waited': 0.0}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+# %% ../nbs/API/13_rate_limit.ipynb 10
+@patch_to(SlackRateLimiter)
+def _buckets_for(self, method: str, channel: Optional[str] = None) -> Tuple[TokenBucket, ...]:
+    """Get the buckets a call to `method` in `channel` takes tokens from."""
+    keys = [('method', method)]
+    if channel is not None and method in self.CHANNEL_METHODS:
+        keys.append(('channel', channel))
+        
+    with self._lock:
+        for key in keys:
+            if key not in self._buckets:
+                if key[0] == 'method':
+                    self._buckets[key] = TokenBucket(self.method_rates.get(method, self.TIER_RATES[3]))
+                else:
+                    self._buckets[key] = TokenBucket(self.channel_rate, capacity=self.channel_burst)
+        return tuple(self._buckets[key] for key in keys)
+
+@patch_to(SlackRateLimiter)
+def _count(self, **increments):
+    """Add to the limiter statistics."""
+    with self._lock:
+        for key, value in increments.items():
+            self.stats[key] += value
+
+# %% ../nbs/API/13_rate_limit.ipynb 11
+# Error texts of rate limited calls: Slack's error code, or an HTTP 429 status
+_RATE_LIMITED_REGEX = re.compile(r'\bratelimited\b|\bHTTP 429\b|\b429 Client Error\b|\bToo Many Requests\b', re.IGNORECASE)
+
+@patch_to(SlackRateLimiter, cls_method=True)
+def retry_after(cls, outcome: Any) -> Optional[float]:
+    """Get the delay requested by a rate limited call, or None if it was not rate limited.
+    
+    Args:
+        outcome: Value returned or exception raised by a send function
+        
+    Returns:
+        Seconds to wait before retrying, or None
+    """
+    # Exceptions carrying the HTTP response, such as SlackApiError
+    if isinstance(outcome, BaseException):
+        outcome = getattr(outcome, 'response', None)
+        
+    # (success, error_details[, response]) results of the send functions
+    if isinstance(outcome, tuple):
+        for part in outcome[1:][::-1]:
+            delay = cls.retry_after(part)
+            if delay is not None:
+                return delay
+        return None
+    
+    if getattr(outcome, 'status_code', None) == 429:
+        headers = getattr(outcome, 'headers', None) or {}
+        return float(headers.get('Retry-After', cls.DEFAULT_RETRY_AFTER))
+    
+    if isinstance(outcome, dict):
+        if outcome.get('retry_after') is not None:
+            return float(outcome['retry_after'])
+        if any(cls.retry_after(value) is not None for value in outcome.values()):
+            return cls.DEFAULT_RETRY_AFTER
+        return None
+    
+    if isinstance(outcome, str):
+        return cls.DEFAULT_RETRY_AFTER if _RATE_LIMITED_REGEX.search(outcome) else None
+    
+    # Slack API payloads such as SlackResponse (whose body may not be JSON)
+    try:
+        error = outcome.get('error') if hasattr(outcome, 'get') else None
+    except Exception:
+        return None
+    return cls.DEFAULT_RETRY_AFTER if error == 'ratelimited' else None
+
+# %% ../nbs/API/13_rate_limit.ipynb 13
+@patch_to(SlackRateLimiter)
+def call(self, func: Callable, *args, method: str = 'chat.postMessage', channel: Optional[str] = None, **kwargs) -> Any:
+    """Call a send function within the rate limits, retrying it while it is rate limited.
+    
+    Args:
+        func: Send function
+        *args: Positional arguments for `func`
+        method: Slack Web API method the call uses
+        channel: Channel ID the call posts to
+        **kwargs: Keyword arguments for `func`
+        
+    Returns:
+        The result of the last attempt (rate limited only once `max_retries` is exhausted)
+    """
+    buckets = self._buckets_for(method, channel)
+    
+    for attempt in range(self.max_retries + 1):
+        waited = sum(bucket.acquire() for bucket in buckets)
+        self._count(calls=1, waited=waited, retries=1 if attempt else 0)
+        
+        try:
+            result = func(*args, **kwargs)
+            delay = self.retry_after(result)
+        except Exception as e:
+            delay = self.retry_after(e)
+            if delay is None or attempt == self.max_retries:
+                raise
+        
+        if delay is None:
+            for bucket in buckets:
+                bucket.speed_up()
+            return result
+        
+        self._count(throttled=1)
+        DebugLogger.log('Rate limited on %s (channel %s), retrying in %ss', method, channel, delay, level='WARNING')
+        for bucket in buckets:
+            bucket.slow_down()
+            bucket.pause(delay)
+    
+    return result
+
+@patch_to(SlackRateLimiter)
+def wrap(self, func: Callable, method: str = 'chat.postMessage', channel: Optional[str] = None) -> Callable:
+    """Wrap a send function so every call goes through `call`.
+    
+    Args:
+        func: Send function
+        method: Slack Web API method the function uses
+        channel: Channel ID the function posts to
+        
+    Returns:
+        Function with the same signature as `func`
+    """
+    @functools.wraps(func)
+    def limited(*args, **kwargs):
+        return self.call(func, *args, method=method, channel=channel, **kwargs)
+    return limited
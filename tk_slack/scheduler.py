@@ -0,0 +1,231 @@
+"""Fair-share scheduling of Slack sends across views and view groups"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/20_scheduler.ipynb.
+
+# %% auto 0
+__all__ = ['SendScheduler']
+
+# %% ../nbs/API/20_scheduler.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from .rate_limit import TokenBucket
+from typing import List, Dict, Any, Callable, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import deque
+import functools
+import itertools
+import threading
+import time
+
+# %% ../nbs/API/20_scheduler.ipynb 5
+class SendScheduler:
+    """
+    Shares send slots across views by priority, weight and view group quota.
+    """
+    
+    def __init__(self, slots: int = 1, max_samples: int = 1000):
+        """Initialize the scheduler.
+        
+        Args:
+            slots: Number of sends that may run at once, across all views
+            max_samples: Number of queueing delays kept per view for the metrics
+        """
+        self.slots = slots
+        self.max_samples = max_samples
+        self._free = slots
+        self._views = {}
+        self._groups = {}
+        self._quotas = {}
+        self._passes = {}
+        self._vtime = 0.0
+        self._waiting = []
+        self._waits = {}
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+    
+    def set_view(self, view: str, priority: Optional[int] = None, weight: Optional[float] = None):
+        """Set the priority and weight of a view, overriding those of its group.
+        
+        Args:
+            view: View name
+            priority: Views with a higher priority are served first
+            weight: Share of the slots relative to the other views with the same priority
+        """
+        with self._cond:
+            self._views[view] = {'priority': priority, 'weight': weight}
+    
+    def set_group(self, 
+                  view_group: str, 
+                  priority: Optional[int] = None, 
+                  weight: Optional[float] = None, 
+                  quota: Optional[float] = None,
+                  burst: Optional[float] = None):
+        """Set the defaults and quota of a view group.
+        
+        Args:
+            view_group: View group name
+            priority: Default priority of the group's views
+            weight: Default weight of the group's views
+            quota: Maximum sends per second of all the group's views together
+            burst: Maximum burst of sends within the quota (defaults to 1)
+        """
+        with self._cond:
+            self._groups[view_group] = {'priority': priority, 'weight': weight}
+            if quota:
+                self._quotas[view_group] = TokenBucket(quota, capacity=burst or 1)
+            else:
+                self._quotas.pop(view_group, None)
+    
+    def _setting(self, view: str, view_group: Optional[str], name: str, default: Any) -> Any:
+        """Get a setting of a view, falling back to its group's and then to `default`."""
+        value = self._views.get(view, {}).get(name)
+        if value is None:
+            value = self._groups.get(view_group, {}).get(name)
+        return default if value is None else value
+
+# %% ../nbs/API/20_scheduler.ipynb 6
+@patch_to(SendScheduler)
+def _pick(self):
+    """Choose the waiting send to serve next.
+    
+    Returns:
+        Tuple of (ticket or None, seconds until a quota lets a send through)
+    """
+    best, best_key, quota_wait = None, None, None
+    for ticket in self._waiting:
+        bucket = self._quotas.get(ticket['view_group'])
+        if bucket is not None:
+            wait = bucket.wait_time()
+            if wait > 0:
+                quota_wait = wait if quota_wait is None else min(quota_wait, wait)
+                continue
+        key = (-ticket['priority'], self._passes[ticket['view']], ticket['seq'])
+        if best_key is None or key < best_key:
+            best, best_key = ticket, key
+    return best, quota_wait
+
+@patch_to(SendScheduler)
+def acquire(self, view: str, view_group: Optional[str] = None) -> float:
+    """Wait for a send slot.
+    
+    Args:
+        view: View name
+        view_group: View group name
+        
+    Returns:
+        Time waited, in seconds
+    """
+    with self._cond:
+        ticket = {
+            'view': view,
+            'view_group': view_group,
+            'priority': self._setting(view, view_group, 'priority', 0),
+            'seq': next(self._counter),
+            'queued': time.monotonic(),
+        }
+        # A view that was idle starts at the current virtual time, without saved-up credit
+        self._passes[view] = max(self._passes.get(view, 0.0), self._vtime)
+        self._waiting.append(ticket)
+        self._cond.notify_all()
+        
+        while True:
+            timeout = None
+            if self._free > 0:
+                best, timeout = self._pick()
+                if best is ticket:
+                    break
+                if best is not None:
+                    # Another send goes first; wake it in case it is asleep
+                    self._cond.notify_all()
+            self._cond.wait(timeout)
+        
+        self._waiting.remove(ticket)
+        self._free -= 1
+        bucket = self._quotas.get(view_group)
+        if bucket is not None:
+            bucket.reserve()
+        self._vtime = self._passes[view]
+        self._passes[view] += 1.0 / self._setting(view, view_group, 'weight', 1.0)
+        
+        waited = time.monotonic() - ticket['queued']
+        self._waits.setdefault(view, deque(maxlen=self.max_samples)).append(waited)
+        return waited
+
+@patch_to(SendScheduler)
+def release(self):
+    """Give back a send slot."""
+    with self._cond:
+        self._free += 1
+        self._cond.notify_all()
+
+@patch_to(SendScheduler)
+@contextmanager
+def slot(self, view: str, view_group: Optional[str] = None):
+    """Hold a send slot for the duration of a `with` block."""
+    self.acquire(view, view_group)
+    try:
+        yield
+    finally:
+        self.release()
+
+@patch_to(SendScheduler)
+def wrap(self, func: Callable, view: str, view_group: Optional[str] = None) -> Callable:
+    """Wrap a send function so that each call waits for a slot.
+    
+    Args:
+        func: Function to wrap, e.g. `send_to_slack_func`
+        view: View name
+        view_group: View group name
+        
+    Returns:
+        Function with the same signature as `func`
+    """
+    @functools.wraps(func)
+    def scheduled(*args, **kwargs):
+        with self.slot(view, view_group):
+            return func(*args, **kwargs)
+    return scheduled
+
+# %% ../nbs/API/20_scheduler.ipynb 7
+@patch_to(SendScheduler)
+def metrics(self) -> Dict[str, Dict[str, float]]:
+    """Summarize the queueing delay of each view, over its last `max_samples` sends.
+    
+    Returns:
+        Dictionary of view name to its number of samples, number of sends waiting now,
+        and mean, 95th percentile and maximum delay (in seconds)
+    """
+    with self._cond:
+        waits = {view: sorted(samples) for view, samples in self._waits.items()}
+        waiting = {}
+        for ticket in self._waiting:
+            waiting[ticket['view']] = waiting.get(ticket['view'], 0) + 1
+    
+    metrics = {}
+    for view, samples in waits.items():
+        metrics[view] = {
+            'samples': len(samples),
+            'waiting': waiting.get(view, 0),
+            'mean_wait': sum(samples) / len(samples),
+            'p95_wait': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            'max_wait': samples[-1],
+        }
+    return metrics
+
+@patch_to(SendScheduler)
+def run(self, calls: Iterable[Callable[[], Any]]) -> List[Any]:
+    """Run template calls at the same time, each in its own thread.
+    
+    Args:
+        calls: Functions without arguments, e.g. a template call with this scheduler
+        
+    Returns:
+        The results of the calls, in order
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix='tk_slack-view') as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
@@ -0,0 +1,226 @@
+"""JSON encoding and decoding shared by the whole library, with an optional fast backend"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/09_serialization.ipynb.
+
+# %% auto 0
+__all__ = ['JSONDecodeError', 'to_jsonable', 'available_backends', 'get_backend', 'set_backend', 'dumps', 'dumps_bytes', 'loads',
+           'benchmark_backends']
+
+# %% ../nbs/API/09_serialization.ipynb 3
+from fastcore.test import *
+from typing import List, Tuple, Dict, Any, Callable, Optional, Union
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
+import pandas as pd
+import numpy as np
+import json, math, os, timeit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# %% ../nbs/API/09_serialization.ipynb 5
+def _replace_non_finite(obj: Any, _parents: Optional[set] = None) -> Any:
+    """Replace NaN and infinite floats with None, in nested lists and dicts too."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if not isinstance(obj, (dict, list, tuple)):
+        return obj
+    
+    # Fail on a container nested in itself like the encoders do, instead of recursing forever
+    _parents = set() if _parents is None else _parents
+    if id(obj) in _parents:
+        raise ValueError("Circular reference detected")
+    _parents.add(id(obj))
+    try:
+        if isinstance(obj, dict):
+            return {key: _replace_non_finite(value, _parents) for key, value in obj.items()}
+        return [_replace_non_finite(value, _parents) for value in obj]
+    finally:
+        _parents.discard(id(obj))
+
+def to_jsonable(obj: Any) -> Any:
+    """Convert a value the JSON backends can't serialize natively.
+    
+    Used as the `default` hook of both backends.
+    
+    Args:
+        obj: Value to convert
+        
+    Returns:
+        JSON serializable equivalent of the value
+    """
+    # Missing values (NaT, pd.NA) first, before the datetime checks
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+        
+    # Datetimes (pd.Timestamp is a datetime subclass)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, np.datetime64):
+        return None if np.isnat(obj) else pd.Timestamp(obj).isoformat()
+    if isinstance(obj, (timedelta, np.timedelta64)):
+        return str(pd.Timedelta(obj))
+        
+    # Numpy scalars
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj) if np.isfinite(obj) else None
+        
+    # Collections
+    if isinstance(obj, (np.ndarray, pd.Series, pd.Index)):
+        return _replace_non_finite(obj.tolist())
+    if isinstance(obj, (set, frozenset)):
+        return _replace_non_finite(list(obj))
+    if isinstance(obj, Decimal):
+        return float(obj) if obj.is_finite() else None
+    
+    # Fall back to the string representation
+    return str(obj)
+
+# %% ../nbs/API/09_serialization.ipynb 8
+JSONDecodeError = json.JSONDecodeError
+
+_stdlib_encoder = json.JSONEncoder(default=to_jsonable, separators=(',', ':'), ensure_ascii=False, allow_nan=False)
+
+def _json_dumps(obj: Any) -> str:
+    try:
+        return _stdlib_encoder.encode(obj)
+    except ValueError as e:
+        # NaN or infinite floats: write them as null, like orjson, instead of invalid JSON;
+        # other errors (e.g. circular references) are raised as they are
+        if not str(e).startswith('Out of range float values'):
+            raise
+        return _stdlib_encoder.encode(_replace_non_finite(obj))
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj, default=to_jsonable, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+def _orjson_dumps_bytes(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=to_jsonable, option=orjson.OPT_NON_STR_KEYS)
+
+_BACKENDS = {
+    'json': {
+        'dumps': _json_dumps,
+        'dumps_bytes': lambda obj: _json_dumps(obj).encode('utf-8'),
+        'loads': json.loads
+    }
+}
+if orjson is not None:
+    _BACKENDS['orjson'] = {
+        'dumps': _orjson_dumps,
+        'dumps_bytes': _orjson_dumps_bytes,
+        'loads': orjson.loads
+    }
+
+_backend = {}
+
+# %% ../nbs/API/09_serialization.ipynb 9
+def available_backends() -> List[str]:
+    """Names of the JSON backends that can be used in this environment."""
+    return list(_BACKENDS)
+
+def get_backend() -> str:
+    """Name of the JSON backend currently in use."""
+    return _backend['name']
+
+def set_backend(name: Optional[str] = None) -> str:
+    """Select the JSON backend.
+    
+    Args:
+        name: 'json' or 'orjson'. If None, uses the `TK_SLACK_JSON_BACKEND`
+            environment variable, then the fastest installed backend.
+            
+    Returns:
+        Name of the selected backend
+    """
+    if name is None:
+        name = os.environ.get('TK_SLACK_JSON_BACKEND') or ('orjson' if 'orjson' in _BACKENDS else 'json')
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not available. Choose from: {available_backends()}")
+    _backend.clear()
+    _backend.update(_BACKENDS[name], name=name)
+    return name
+
+set_backend()
+
+# %% ../nbs/API/09_serialization.ipynb 11
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON string
+    """
+    return _backend['dumps'](obj)
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON bytes.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON bytes
+    """
+    return _backend['dumps_bytes'](obj)
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize a JSON string or bytes.
+    
+    Args:
+        data: JSON text
+        
+    Returns:
+        Deserialized object
+        
+    Raises:
+        JSONDecodeError: If the data is not valid JSON
+    """
+    return _backend['loads'](data)
+
+# %% ../nbs/API/09_serialization.ipynb 15
+def benchmark_backends(payload: Any = None, number: int = 2000) -> Dict[str, Dict[str, float]]:
+    """Time `dumps` and `loads` with every available backend.
+    
+    Args:
+        payload: Object to serialize. Defaults to a typical interactive message payload.
+        number: Number of repetitions per measurement
+        
+    Returns:
+        Dictionary mapping backend name to microseconds per `dumps`/`loads` call
+    """
+    if payload is None:
+        payload = {
+            "channel": "C0123456789",
+            "text": "Daily lead alert",
+            "blocks": [
+                {"type": "section", "text": {"type": "mrkdwn", "text": f"*Lead {i}*"},
+                 "fields": [{"type": "mrkdwn", "text": f"*Field {j}*\nValue {i}-{j}"} for j in range(6)]}
+                for i in range(10)
+            ],
+            "metadata": {"event_type": "lead_alert",
+                         "event_payload": {"view": "leads", "view_group": "sales", "custom_row_index": 3,
+                                           "run_time": datetime(2025, 5, 1, 8, 0)}}
+        }
+        
+    current = get_backend()
+    results = {}
+    try:
+        for name in available_backends():
+            set_backend(name)
+            encoded = dumps(payload)
+            results[name] = {
+                'dumps_us': timeit.timeit(lambda: dumps(payload), number=number) / number * 1e6,
+                'loads_us': timeit.timeit(lambda: loads(encoded), number=number) / number * 1e6
+            }
+    finally:
+        set_backend(current)
+        
+    return results
@@ -4,8 +4,11 @@
 __all__ = ['ActionHandler', 'ActionIdManager']
 
 # %% ../nbs/API/03_slack_actions.ipynb 3
-from .core import ValueFormatter
+from .core import ValueFormatter, DebugLogger
 from .snowflake_connector import SnowflakeConnector
+from . import serialization
+from .action_registry import ActionRegistry, ActionRoute
+from .async_actions import AsyncActionWriter
 
 from fastcore.basics import patch_to
 from fastcore.test import *
@@ -14,7 +17,10 @@ from fastcore.test import *
 from typing import List, Tuple, Dict, Any, Callable, Optional
 
 import pandas as pd
-import json, re, os
+import re, os
+import functools
+import inspect
+import asyncio
 from datetime import datetime
 import pytz
 import time
@@ -33,6 +39,19 @@ class ActionHandler:
     # Singleton instance
     _instance = None
     snowflake = SnowflakeConnector()
+    
+    # Routes of the actions by type and view, see `ActionRegistry`
+    registry = ActionRegistry()
+    
+    # Recently processed actions, to drop redeliveries and double clicks (off by default), see `ActionDeduplicator`
+    deduplicator = None
+    
+    # Cache of recent interactions kept up to date with the stored actions, see `InteractionCache`
+    interaction_cache = None
+    
+    # Writer storing the actions of the async handler, see `setup_async_slack_action_handler`
+    action_writer = None
+    
     @classmethod
     def get_instance(cls):
         """Get or create the singleton instance.
@@ -67,9 +86,9 @@ class ActionHandler:
         """
         action = body["actions"][0]
         action_id = action["action_id"]
-        print(f'Actiob Body: {body}')
-        print(f'Action ID: {action_id}')
-        print(f'Action: {action}')
+        DebugLogger.log('Action Body: %s', body)
+        DebugLogger.log('Action ID: %s', action_id)
+        DebugLogger.log('Action: %s', action)
         # Get common fields
         payload = {
             "user_id": body["user"]["id"],
@@ -106,10 +125,48 @@ class ActionHandler:
         return payload
 
 # %% ../nbs/API/03_slack_actions.ipynb 7
+# Placeholders of response templates, each with the function rendering it from the action data
+# (None when the action data has no value for it, leaving the placeholder as is)
+_RESPONSE_FIELDS = {
+    "user": lambda action_data: action_data["user_name"],
+    "user_id": lambda action_data: action_data["user_id"],
+    "channel": lambda action_data: action_data["channel_id"],
+    "value": lambda action_data: str(action_data["value"]) if "value" in action_data else None,
+    "text": lambda action_data: str(action_data["text"]) if "text" in action_data else None,
+    "date": lambda action_data: _format_response_date(action_data["selected_date"]) if "selected_date" in action_data else None,
+    "selected_user": lambda action_data: str(action_data["selected_user"]) if "selected_user" in action_data else None,
+    "selected_channel": lambda action_data: str(action_data["selected_channel"]) if "selected_channel" in action_data else None,
+    # For multi-select values, join them
+    "values": lambda action_data: ", ".join(str(v) for v in action_data["values"]) if "values" in action_data else None,
+    "texts": lambda action_data: ", ".join(str(t) for t in action_data["texts"]) if "texts" in action_data else None,
+}
+_RESPONSE_PLACEHOLDER_REGEX = re.compile(r"\{(" + "|".join(_RESPONSE_FIELDS) + r")\}")
+
+@functools.lru_cache(maxsize=1024)
+def _format_response_date(date_str: str) -> str:
+    """Format a selected date nicely, falling back to the raw date."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%B %d, %Y")
+    except (TypeError, ValueError):
+        return date_str
+
+@functools.lru_cache(maxsize=256)
+def _compile_response_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a response template into (literal text, placeholder name) pairs, once per template."""
+    parts = []
+    pos = 0
+    for match in _RESPONSE_PLACEHOLDER_REGEX.finditer(template):
+        parts.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((template[pos:], None))
+    return tuple(parts)
+
 @patch_to(ActionHandler,cls_method=True)
 def _format_response_text(self, template: str, action_data: Dict[str, Any]) -> str:
     """Format response text by replacing placeholders.
     
+    The template is compiled once and cached, then rendered in a single pass.
+    
     Args:
         template: Response text template
         action_data: Action data with values
@@ -117,58 +174,26 @@ def _format_response_text(self, template: str, action_data: Dict[str, Any]) -> s
     Returns:
         Formatted response text
     """
-    # Make a copy that we'll modify
-    result = template
-    
-    # Replace standard placeholders
-    result = result.replace("{user}", action_data["user_name"])
-    result = result.replace("{user_id}", action_data["user_id"])
-    result = result.replace("{channel}", action_data["channel_id"])
-    
-    # Action-specific replacements
-    if "value" in action_data:
-        result = result.replace("{value}", str(action_data["value"]))
-    
-    if "text" in action_data:
-        result = result.replace("{text}", str(action_data["text"]))
-        
-    if "selected_date" in action_data:
-        date_str = action_data["selected_date"]
-        try:
-            # Try to format the date nicely
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            formatted_date = date_obj.strftime("%B %d, %Y")
-            result = result.replace("{date}", formatted_date)
-        except:
-            # Fallback to raw date
-            result = result.replace("{date}", date_str)
-            
-    if "selected_user" in action_data:
-        result = result.replace("{selected_user}", str(action_data["selected_user"]))
-        
-    if "selected_channel" in action_data:
-        result = result.replace("{selected_channel}", str(action_data["selected_channel"]))
-        
-    # For multi-select values, join them
-    if "values" in action_data:
-        values_str = ", ".join(str(v) for v in action_data["values"])
-        result = result.replace("{values}", values_str)
-        
-    if "texts" in action_data:
-        texts_str = ", ".join(str(t) for t in action_data["texts"])
-        result = result.replace("{texts}", texts_str)    
-    return result
+    chunks = []
+    for literal, field in _compile_response_template(template):
+        chunks.append(literal)
+        if field is not None:
+            value = _RESPONSE_FIELDS[field](action_data)
+            chunks.append(f"{{{field}}}" if value is None else value)
+    return "".join(chunks)
 
-# %% ../nbs/API/03_slack_actions.ipynb 8
+# %% ../nbs/API/03_slack_actions.ipynb 9
 @patch_to(ActionHandler,cls_method=True)
-def _send_response(self, body, action_data: Dict[str, Any], respond):
-    """Send an appropriate response based on the action data.
+def _response_payload(self, body, action_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the response to an action from the response config in the message metadata.
     
     Args:
+        body: Slack event body
         action_data: Processed action data
-        respond: Slack respond function or response URL
+        
+    Returns:
+        Keyword arguments for the Slack respond function
     """
-    
     response_text = body['message']['metadata'].get('event_payload', {}).get("response_message", "Thank you for your response!")
     response_type = body['message']['metadata'].get('event_payload', {}).get("response_type", "ephemeral")
     fmt_text = self._format_response_text(response_text, action_data)
@@ -179,11 +204,59 @@ def _send_response(self, body, action_data: Dict[str, Any], respond):
         "replace_original": body['message']['metadata'].get('event_payload', {}).get("replace_original", False),
         "response_type": response_type
         }
+    return response_payload
+
+@patch_to(ActionHandler,cls_method=True)
+def _send_response(self, body, action_data: Dict[str, Any], respond):
+    """Send an appropriate response based on the action data.
+    
+    Args:
+        action_data: Processed action data
+        respond: Slack respond function or response URL
+    """
+    response_payload = self._response_payload(body, action_data)
     if callable(respond): respond(**response_payload)
 
     return response_payload
 
-# %% ../nbs/API/03_slack_actions.ipynb 10
+# %% ../nbs/API/03_slack_actions.ipynb 11
+@patch_to(ActionHandler,cls_method=True)
+def _snowflake_record(self, action_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert action data to a row of the interactions table.
+    
+    Args:
+        action_data: Action data to store
+        
+    Returns:
+        Dictionary of column name to value
+    """
+    view_info = action_data.get("view_info", {})
+    snowflake_data = {
+        "ACTION_ID": action_data["action_id"],
+        "VIEW": view_info.get("view",view_info.get("view_name","unknown")),
+        "VIEW_GROUP": view_info.get("view_group", "unknown"),
+        "ACTION_TYPE": action_data['action_type'],
+        "ACTION_INDEX": action_data['action_index'],
+        "ACTION_METADATA": serialization.dumps(action_data['metadata']),
+        "USER_ID": action_data["user_id"],
+        "USER_NAME": action_data["user_name"],
+        "CHANNEL_ID": action_data["channel_id"],
+        "MESSAGE_TS": action_data["message_ts"],
+        "RESPONSE_VALUE": action_data.get("value", 
+                        action_data.get("selected_date",
+                        action_data.get("selected_user",
+                        action_data.get("selected_channel", "")))),
+        "RESPONSE_TEXT": action_data.get("text", ""),
+        "TIMESTAMP": datetime.now().isoformat(),
+        "RAW_PAYLOAD": serialization.dumps(action_data)
+    }
+    
+    # If we have multiple values (from multi-select), store as JSON
+    if "values" in action_data:
+        snowflake_data["RESPONSE_VALUES"] = serialization.dumps(action_data["values"])
+        snowflake_data["RESPONSE_TEXTS"] = serialization.dumps(action_data["texts"])
+    return snowflake_data
+
 @patch_to(ActionHandler,cls_method=True)
 def _store_action_in_snowflake(self, action_data: Dict[str, Any],
                                 table_name: str = "SLACK_INTERACTIONS"):
@@ -193,43 +266,55 @@ def _store_action_in_snowflake(self, action_data: Dict[str, Any],
         action_data: Action data to store
         view_info: View information extracted from metadata
         table_name: Snowflake table name
+        
+    Returns:
+        True if the action was stored
     """
     if not self.snowflake: self.snowflake = SnowflakeConnector()
             
     try:
         # Convert to format suitable for Snowflake
-        view_info = action_data.get("view_info", {})
-        snowflake_data = {
-            "ACTION_ID": action_data["action_id"],
-            "VIEW": view_info.get("view",view_info.get("view_name","unknown")),
-            "VIEW_GROUP": view_info.get("view_group", "unknown"),
-            "ACTION_TYPE": action_data['action_type'],
-            "ACTION_INDEX": action_data['action_index'],
-            "ACTION_METADATA": json.dumps(action_data['metadata']),
-            "USER_ID": action_data["user_id"],
-            "USER_NAME": action_data["user_name"],
-            "CHANNEL_ID": action_data["channel_id"],
-            "MESSAGE_TS": action_data["message_ts"],
-            "RESPONSE_VALUE": action_data.get("value", 
-                            action_data.get("selected_date",
-                            action_data.get("selected_user",
-                            action_data.get("selected_channel", "")))),
-            "RESPONSE_TEXT": action_data.get("text", ""),
-            "TIMESTAMP": datetime.now().isoformat(),
-            "RAW_PAYLOAD": json.dumps(action_data)
-        }
-        
-        # If we have multiple values (from multi-select), store as JSON
-        if "values" in action_data:
-            snowflake_data["RESPONSE_VALUES"] = json.dumps(action_data["values"])
-            snowflake_data["RESPONSE_TEXTS"] = json.dumps(action_data["texts"])
+        snowflake_data = self._snowflake_record(action_data)
         
         # Use the connector to insert into Snowflake
         self.snowflake.insert_record(table_name, snowflake_data)
     except Exception as e:
         print(f"Error storing action in Snowflake: {e}")
+        return False
+    if self.interaction_cache is not None and table_name == "SLACK_INTERACTIONS":
+        self.interaction_cache.add(snowflake_data)
+    return True
 
-# %% ../nbs/API/03_slack_actions.ipynb 13
+@patch_to(ActionHandler,cls_method=True)
+def _store_actions_in_snowflake(self, actions: List[Dict[str, Any]],
+                                 table_name: str = "SLACK_INTERACTIONS"):
+    """Store the data of several interactions in Snowflake with one bulk insert.
+    
+    Args:
+        actions: Action data to store
+        table_name: Snowflake table name
+    """
+    if not actions:
+        return
+    if len(actions) == 1:
+        return self._store_action_in_snowflake(actions[0], table_name=table_name)
+    if not self.snowflake: self.snowflake = SnowflakeConnector()
+    
+    try:
+        snowflake_data = [self._snowflake_record(action_data) for action_data in actions]
+        # Only multi-selects have RESPONSE_VALUES and RESPONSE_TEXTS: the other rows get None, not NaN
+        columns = list(dict.fromkeys(column for record in snowflake_data for column in record))
+        df = pd.DataFrame([[record.get(column) for column in columns] for record in snowflake_data],
+                          columns=columns, dtype=object)
+        self.snowflake.bulk_insert(table_name, df)
+    except Exception as e:
+        print(f"Error storing {len(actions)} actions in Snowflake: {e}")
+        return
+    if self.interaction_cache is not None and table_name == "SLACK_INTERACTIONS":
+        for record in snowflake_data:
+            self.interaction_cache.add(record)
+
+# %% ../nbs/API/03_slack_actions.ipynb 14
 class ActionIdManager:
     """
     Manages action IDs for Slack interactive elements to ensure uniqueness
@@ -299,11 +384,12 @@ class ActionIdManager:
         
         # Set action type from mapping or keep as is
         components["action_type"] = type_map.get(components["type"], components["type"])
-        components["index"] = int(components["idx"])
+        # IDs without an index (e.g. `tk_interaction_btn_x`) are the first element, like unknown IDs
+        components["index"] = int(components["idx"]) if components["idx"] is not None else 0
             
         return components
 
-# %% ../nbs/API/03_slack_actions.ipynb 16
+# %% ../nbs/API/03_slack_actions.ipynb 17
 @patch_to(ActionHandler,cls_method=True)
 def setup_slack_action_handler(self, app):
     """Set up a single Slack action handler with the Bolt app.
@@ -317,10 +403,9 @@ def setup_slack_action_handler(self, app):
     """
     # Create the singleton action handler
     handler = ActionHandler.get_instance()
-    ACTION_ID_PREFIX_REGEX = re.compile(r"tk_interaction_(?P<type>[^_]+)_(?P<idx>\d+)?")
     
-    # Register the catch-all action handler
-    @app.action(ACTION_ID_PREFIX_REGEX)
+    # Register the catch-all action handler, which dispatches through `ActionHandler.registry`
+    @app.action(ActionIdManager.ACTION_ID_REGEX)
     def handle_all_actions(ack, body, logger, respond):
         """Universal handler for all interactive elements."""
         # Always acknowledge receipt
@@ -333,7 +418,7 @@ def setup_slack_action_handler(self, app):
                 return
                 
             if 'actions' not in body or not body['actions']:
-                logger.error(f"No actions in body: {json.dumps(body)}")
+                logger.error(f"No actions in body: {serialization.dumps(body)}")
                 return
                             
             # Process the action
@@ -345,7 +430,7 @@ def setup_slack_action_handler(self, app):
             
         except Exception as e:
             logger.error(f"Error processing action: {str(e)}")
-            logger.error(f"Action body: {json.dumps(body) if body else 'None'}")
+            logger.error(f"Action body: {serialization.dumps(body) if body else 'None'}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
     
@@ -353,41 +438,193 @@ def setup_slack_action_handler(self, app):
     
     return handler
 
-# %% ../nbs/API/03_slack_actions.ipynb 19
+# %% ../nbs/API/03_slack_actions.ipynb 20
 @patch_to(ActionHandler,cls_method=True)
-def process_slack_action(self, 
-                   body: Dict[str, Any], 
-                   respond: Callable):
-    """Process a Slack action event.
+def _parse_action(self, body: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[ActionRoute]]:
+    """Extract the action data from a Slack event body and look up its route.
     
     Args:
         body: Slack event body
-        respond: Slack respond function
 
     Returns:
-        Processed action data
+        Tuple of (action_data, route), or (None, None) for a duplicate of a recent action
     """
-    print(body)
+    DebugLogger.log('Action body: %s', body)
+    action = body['actions'][0]
+    
+    # Parse the action ID once
+    parsed_id = ActionIdManager.parse_action_id(action['action_id'])
+    
     action_data = {}
-    action_data['action_id'] = body['actions'][0]['action_id']
-    action_data['action_type'] = body['actions'][0]['type']
+    action_data['action_id'] = action['action_id']
+    action_data['action_type'] = action['type']
     action_data['user_id'] = body['user']['id']
     action_data['user_name'] = body['user']['name']
-    action_data['action_index'] = body['actions'][0]['action_id'].split("_")[3]
+    action_data['action_index'] = parsed_id.get('idx') or str(parsed_id['index'])
     action_data['channel_id'] = body['channel']['id']
     action_data['message_ts'] = body['message']['ts']
-    action_data['value'] = body['actions'][0].get('value', '')
-    action_data['selected_date'] = body['actions'][0].get('selected_date', '')
-    action_data['selected_user'] = body['actions'][0].get('selected_user', '')
-    action_data['selected_channel'] = body['actions'][0].get('selected_channel', '')
-    action_data['metadata'] = body['actions'][0].get('metadata', {})
+    action_data['value'] = action.get('value', '')
+    action_data['selected_date'] = action.get('selected_date', '')
+    action_data['selected_user'] = action.get('selected_user', '')
+    action_data['selected_channel'] = action.get('selected_channel', '')
+    # Values of the options chosen in a select, which has no `value`
+    selected = [action['selected_option']] if action.get('selected_option') else action.get('selected_options') or []
+    action_data['selected_options'] = [option.get('value') for option in selected]
+    action_data['metadata'] = action.get('metadata', {})
     action_data['view_info'] = body['message']['metadata'].get('event_payload', {})
+    
+    # Drop redelivered actions and double clicks before any I/O
+    if self.deduplicator is not None and self.deduplicator.is_duplicate(action_data):
+        DebugLogger.log('Dropped duplicate action %s from %s', action_data['action_id'], action_data['user_id'])
+        return None, None
+    
+    # Look up how actions of this type are handled in this view
+    view_info = action_data['view_info']
+    route = self.registry.resolve(action_data['action_type'], view_info.get('view', view_info.get('view_name')))
+    return action_data, route
+
+@patch_to(ActionHandler,cls_method=True)
+def process_slack_action(self, 
+                   body: Dict[str, Any], 
+                   respond: Callable):
+    """Process a Slack action event.
+    
+    The action is handled by its route in `registry`, by action type and view:
+    the built-in response unless the route has its own handler, then storing
+    the action in Snowflake unless the route skips it.
+    
+    Args:
+        body: Slack event body
+        respond: Slack respond function
+
+    Returns:
+        Processed action data, or None for a duplicate of a recent action
+    """
+    action_data, route = self._parse_action(body)
+    if action_data is None:
+        return None
+    parsed = dict(action_data)
+    
+    try:
+        if route.handler is not None:
+            result = route.handler(action_data, body, respond)
+            if result is not None:
+                action_data = result
+        elif route.respond:
+            responce_payload = self._send_response(body, action_data, respond)
+            action_data['text'] = responce_payload['text']
+    except Exception:
+        self._release_action(parsed)
+        raise
 
     # Store interaction in Snowflake
-    responce_payload = self._send_response(body, action_data, respond)
+    if route.store and not self._store_action_in_snowflake(action_data = action_data):
+        self._release_action(parsed)
+    
+    return action_data
 
-    action_data['text'] = responce_payload['text']
+@patch_to(ActionHandler,cls_method=True)
+def _release_action(self, action_data: Dict[str, Any]):
+    """Forget an action whose processing failed in the deduplicator, so that a retry is processed."""
+    if self.deduplicator is not None:
+        self.deduplicator.release(action_data)
 
-    self._store_action_in_snowflake(action_data = action_data)
+# %% ../nbs/API/03_slack_actions.ipynb 23
+@patch_to(ActionHandler,cls_method=True)
+async def process_slack_action_async(self, 
+                   body: Dict[str, Any], 
+                   respond: Callable,
+                   writer: Optional[AsyncActionWriter] = None):
+    """Process a Slack action event on an asyncio event loop.
+    
+    Same as `process_slack_action`, with an async `respond` function: async
+    route handlers are awaited, and the action is queued in `writer` to be
+    stored in the background rather than inserted before returning.
+    
+    Args:
+        body: Slack event body
+        respond: Async Slack respond function
+        writer: Writer storing the action (without one, the insert runs in a thread and is awaited)
+
+    Returns:
+        Processed action data, or None for a duplicate of a recent action
+    """
+    action_data, route = self._parse_action(body)
+    if action_data is None:
+        return None
+    parsed = dict(action_data)
+    
+    try:
+        if route.handler is not None:
+            result = route.handler(action_data, body, respond)
+            if inspect.isawaitable(result):
+                result = await result
+            if result is not None:
+                action_data = result
+        elif route.respond:
+            response_payload = self._response_payload(body, action_data)
+            if callable(respond): await respond(**response_payload)
+            action_data['text'] = response_payload['text']
+    except Exception:
+        self._release_action(parsed)
+        raise
+    
+    # Store interaction in Snowflake, off the event loop
+    if route.store:
+        if writer is not None:
+            await writer.put(action_data)
+        else:
+            loop = asyncio.get_running_loop()
+            stored = await loop.run_in_executor(None, functools.partial(self._store_action_in_snowflake, action_data))
+            if not stored:
+                self._release_action(parsed)
     
     return action_data
+
+@patch_to(ActionHandler,cls_method=True)
+def setup_async_slack_action_handler(self, app, writer: Optional[AsyncActionWriter] = None):
+    """Set up a single Slack action handler with an async Bolt app (`AsyncApp`).
+    
+    The writer is kept in `ActionHandler.action_writer`. It holds the actions
+    not stored yet: await its `close()` when the app shuts down, or they are lost.
+    
+    Args:
+        app: Async Slack Bolt app
+        writer: Writer storing the actions, defaults to batched bulk inserts in Snowflake
+        
+    Returns:
+        Initialized ActionHandler instance
+    """
+    # Create the singleton action handler
+    handler = ActionHandler.get_instance()
+    writer = writer or AsyncActionWriter(handler._store_actions_in_snowflake)
+    self.action_writer = writer
+    
+    # Register the catch-all action handler, which dispatches through `ActionHandler.registry`
+    @app.action(ActionIdManager.ACTION_ID_REGEX)
+    async def handle_all_actions(ack, body, logger, respond):
+        """Universal handler for all interactive elements."""
+        # Always acknowledge receipt
+        await ack()
+        
+        try:
+            # Validate body structure
+            if not body:
+                logger.error("Body is None")
+                return
+                
+            if 'actions' not in body or not body['actions']:
+                logger.error(f"No actions in body: {serialization.dumps(body)}")
+                return
+            
+            await handler.process_slack_action_async(body, respond, writer)
+            
+        except Exception as e:
+            logger.error(f"Error processing action: {str(e)}")
+            logger.error(f"Action body: {serialization.dumps(body) if body else 'None'}")
+            import traceback
+            logger.error(f"Traceback: {traceback.format_exc()}")
+    
+    print("Registered async universal action handler for all block actions")
+    
+    return handler
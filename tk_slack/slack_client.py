@@ -0,0 +1,333 @@
+"""A long-lived, pooled Slack Web API client to send alerts with"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/14_slack_client.ipynb.
+
+# %% auto 0
+__all__ = ['SlackAPIResponse', 'PooledSlackClient']
+
+# %% ../nbs/API/14_slack_client.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from .core import DebugLogger
+from . import serialization
+from typing import Tuple, Dict, Any, Optional, Union
+from urllib.parse import urlsplit, urlencode
+import http.client
+import threading
+import select
+import queue
+import os
+
+# %% ../nbs/API/14_slack_client.ipynb 5
+class SlackAPIResponse:
+    """
+    Response of a Slack Web API call.
+    
+    Mirrors the parts of `requests.Response` the library uses (`status_code`,
+    `headers`, `text`, `json()`) and reads like the API payload (`resp['ok']`).
+    """
+    
+    def __init__(self, status_code: int, headers: Any, body: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self._data = None
+    
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+    
+    def json(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = serialization.loads(self.body) if self.body else {}
+        return self._data
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.json().get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.json()[key]
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded at both the HTTP and the Slack API level."""
+        try:
+            return self.status_code == 200 and bool(self.get('ok'))
+        except serialization.JSONDecodeError:
+            return False
+
+# %% ../nbs/API/14_slack_client.ipynb 6
+class PooledSlackClient:
+    """
+    Thread-safe Slack Web API client reusing keep-alive connections.
+    """
+    
+    BASE_URL = 'https://slack.com/api/'
+    
+    def __init__(self, 
+                 token: Optional[str] = None, 
+                 base_url: Optional[str] = None,
+                 pool_size: int = 10, 
+                 timeout: float = 30):
+        """Initialize the client.
+        
+        Args:
+            token: Bot token (defaults to the SLACK_BOT_TOKEN environment variable)
+            base_url: Web API base URL, e.g. a local mock server (defaults to `BASE_URL`)
+            pool_size: Maximum number of idle connections kept open
+            timeout: Socket timeout in seconds
+        """
+        self.token = token or os.environ.get('SLACK_BOT_TOKEN')
+        self.base_url = base_url or self.BASE_URL
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.stats = {'requests': 0, 'connections': 0}
+        self._lock = threading.Lock()
+        
+        url = urlsplit(self.base_url)
+        self._connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self._host = url.hostname
+        self._port = url.port
+        self._path = url.path.rstrip('/') + '/'
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+# %% ../nbs/API/14_slack_client.ipynb 7
+@patch_to(PooledSlackClient)
+def _get_connection(self) -> Tuple[http.client.HTTPConnection, bool]:
+    """Take an idle connection from the pool or open a new one, returning (connection, reused)."""
+    while True:
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            break
+        # An idle connection is readable only once the server has closed it
+        if connection.sock is None or not select.select([connection.sock], [], [], 0)[0]:
+            return connection, True
+        connection.close()
+    
+    with self._lock:
+        self.stats['connections'] += 1
+    return self._connection_class(self._host, self._port, timeout=self.timeout), False
+
+@patch_to(PooledSlackClient)
+def _release(self, connection: http.client.HTTPConnection):
+    """Return a connection to the pool, closing it if the pool is full."""
+    try:
+        self._pool.put_nowait(connection)
+    except queue.Full:
+        connection.close()
+
+@patch_to(PooledSlackClient)
+def close(self):
+    """Close all idle connections."""
+    while True:
+        try:
+            self._pool.get_nowait().close()
+        except queue.Empty:
+            return
+
+# %% ../nbs/API/14_slack_client.ipynb 8
+@patch_to(PooledSlackClient)
+def api_call(self, method: str, payload: Union[Dict[str, Any], bytes, None] = None, form: bool = False) -> SlackAPIResponse:
+    """Call a Slack Web API method with a JSON (or form encoded) body.
+    
+    Args:
+        method: API method, e.g. 'chat.postMessage'
+        payload: Request body, as a dict or as already serialized JSON bytes
+        form: Send the payload form encoded, for the methods that don't take JSON
+        
+    Returns:
+        The API response
+    """
+    if form:
+        body = urlencode({
+            key: value if isinstance(value, str) else serialization.dumps(value) 
+            for key, value in (payload or {}).items()
+        }).encode('utf-8')
+        content_type = 'application/x-www-form-urlencoded'
+    else:
+        body = payload if isinstance(payload, bytes) else serialization.dumps_bytes(payload or {})
+        content_type = 'application/json; charset=utf-8'
+    headers = {
+        'Authorization': f'Bearer {self.token}',
+        'Content-Type': content_type,
+    }
+    
+    while True:
+        connection, reused = self._get_connection()
+        sent = False
+        try:
+            connection.request('POST', self._path + method, body=body, headers=headers)
+            sent = True
+            response = connection.getresponse()
+            data = response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            # The server closed an idle keep-alive connection before the request went out, try again
+            # on a new one; once sent, Slack may have processed it and a retry could post a message twice
+            if reused and not sent:
+                DebugLogger.log('Pooled connection closed by the server, reconnecting')
+                continue
+            raise
+        except Exception:
+            connection.close()
+            raise
+        
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        with self._lock:
+            self.stats['requests'] += 1
+        return SlackAPIResponse(response.status, response.headers, data)
+
+# %% ../nbs/API/14_slack_client.ipynb 9
+@patch_to(PooledSlackClient)
+def post_message(
+    self, 
+    channel: str, 
+    text: str, 
+    payload_blocks: Optional[list] = None, 
+    post_at: Optional[float] = None, 
+    **fields
+) -> SlackAPIResponse:
+    """Post a message, in the `send_to_slack_func` style of `template_f1`.
+    
+    Args:
+        channel: Slack channel ID
+        text: Message text
+        payload_blocks: Slack blocks
+        post_at: Unix time to schedule the message for, with chat.scheduleMessage
+        **fields: Other chat.postMessage arguments
+        
+    Returns:
+        The API response
+    """
+    payload = {'channel': channel, 'text': text, **fields}
+    if payload_blocks is not None:
+        payload['blocks'] = payload_blocks
+    if post_at is not None:
+        payload['post_at'] = int(post_at)
+        return self.api_call('chat.scheduleMessage', payload)
+    return self.api_call('chat.postMessage', payload)
+
+@patch_to(PooledSlackClient)
+def _send_payload(self, method: str, message_payload: Union[Dict[str, Any], bytes], message_id: str = None) -> Tuple[bool, Optional[Dict[str, Any]], Optional[SlackAPIResponse]]:
+    """Call a message method, returning the result in the `send_to_slack_func` style."""
+    try:
+        response = self.api_call(method, message_payload)
+    except Exception as e:
+        return False, {'slack_api_error': str(e)}, None
+    
+    if response.ok:
+        return True, None, response
+    
+    DebugLogger.log('Error sending %s: %s', message_id, response.text, level='WARNING')
+    error_details = {'slack_api_error': response.text, 'status_code': response.status_code}
+    if response.status_code == 429:
+        error_details['retry_after'] = float(response.headers.get('Retry-After', 1))
+    return False, error_details, response
+
+@patch_to(PooledSlackClient)
+def send_message(
+    self, 
+    message_payload: Union[Dict[str, Any], bytes], 
+    message_id: str = None, 
+    post_at: Optional[float] = None
+) -> Tuple[bool, Optional[Dict[str, Any]], Optional[SlackAPIResponse]]:
+    """Post a complete message payload, in the `send_to_slack_func` style of `template_f2`.
+    
+    Args:
+        message_payload: chat.postMessage payload (e.g. with metadata), as a dict or JSON bytes
+        message_id: ID for logging/tracking
+        post_at: Unix time to schedule the message for, with chat.scheduleMessage
+        
+    Returns:
+        Tuple of (success, error_details, response), the response carrying the message `ts`
+        (or, for a scheduled message, its `scheduled_message_id`)
+    """
+    if post_at is not None:
+        if isinstance(message_payload, bytes):
+            message_payload = serialization.loads(message_payload)
+        return self._send_payload('chat.scheduleMessage', dict(message_payload, post_at=int(post_at)), message_id)
+    return self._send_payload('chat.postMessage', message_payload, message_id)
+
+@patch_to(PooledSlackClient)
+def update_message(self, message_payload: Union[Dict[str, Any], bytes], message_id: str = None) -> Tuple[bool, Optional[Dict[str, Any]], Optional[SlackAPIResponse]]:
+    """Update a posted message in place, in the `update_slack_func` style of `template_f2`.
+    
+    Args:
+        message_payload: chat.update payload, with the `channel` and `ts` of the message
+        message_id: ID for logging/tracking
+        
+    Returns:
+        Tuple of (success, error_details, response)
+    """
+    return self._send_payload('chat.update', message_payload, message_id)
+
+# %% ../nbs/API/14_slack_client.ipynb 10
+@patch_to(PooledSlackClient)
+def _post_url(self, url: str, body: bytes):
+    """Post raw bytes to a URL outside the API, such as a file upload URL."""
+    url = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+    connection = connection_class(url.hostname, url.port, timeout=self.timeout)
+    try:
+        path = url.path + (f'?{url.query}' if url.query else '')
+        connection.request('POST', path, body=body, headers={'Content-Type': 'application/octet-stream'})
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise http.client.HTTPException(f'Upload failed with HTTP status {response.status}')
+    finally:
+        connection.close()
+
+@patch_to(PooledSlackClient)
+def upload_file(
+    self, 
+    channel: str, 
+    filename: str, 
+    content: Union[bytes, str], 
+    title: Optional[str] = None,
+    initial_comment: Optional[str] = None,
+    thread_ts: Optional[str] = None
+) -> Tuple[bool, Optional[Dict[str, Any]], Optional[SlackAPIResponse]]:
+    """Upload a file into a channel, with Slack's external upload flow.
+    
+    Args:
+        channel: Slack channel ID
+        filename: File name
+        content: File content (text is UTF-8 encoded)
+        title: File title (defaults to the file name)
+        initial_comment: Message posted with the file
+        thread_ts: Post the file in the thread of this message
+        
+    Returns:
+        Tuple of (success, error_details, response)
+    """
+    content = content.encode('utf-8') if isinstance(content, str) else content
+    try:
+        ticket = self.api_call('files.getUploadURLExternal', {'filename': filename, 'length': len(content)}, form=True)
+        if not ticket.ok:
+            return False, {'slack_api_error': ticket.text, 'status_code': ticket.status_code}, ticket
+        
+        self._post_url(ticket['upload_url'], content)
+        
+        fields = {'files': [{'id': ticket['file_id'], 'title': title or filename}], 'channel_id': channel}
+        if initial_comment:
+            fields['initial_comment'] = initial_comment
+        if thread_ts:
+            fields['thread_ts'] = thread_ts
+        response = self.api_call('files.completeUploadExternal', fields, form=True)
+    except Exception as e:
+        return False, {'slack_api_error': str(e)}, None
+    
+    if response.ok:
+        return True, None, response
+    return False, {'slack_api_error': response.text, 'status_code': response.status_code}, response
@@ -0,0 +1,158 @@
+"""Spreading the sends of non-urgent views over a time window"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/21_smoothing.ipynb.
+
+# %% auto 0
+__all__ = ['SendSmoother', 'SmoothedRun']
+
+# %% ../nbs/API/21_smoothing.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from typing import List, Dict, Any, Callable, Optional
+from hashlib import blake2b
+import bisect
+import functools
+import threading
+import time
+
+# %% ../nbs/API/21_smoothing.ipynb 5
+class SendSmoother:
+    """
+    Spreads the sends of a view evenly over a time window.
+    """
+    
+    # Slack schedules at most 30 messages per channel in any 5-minute window (`restricted_too_many`)
+    MAX_SCHEDULED = 30
+    SCHEDULE_WINDOW = 300.0
+    
+    def __init__(self, window: float = 900.0, schedule: bool = False, lead: float = 60.0):
+        """Initialize the smoother.
+        
+        Args:
+            window: Number of seconds to spread the sends of a view over
+            schedule: Schedule the messages with Slack (`post_at`) instead of delaying them locally
+            lead: Seconds between now and the start of the window when scheduling with Slack
+        """
+        self.window = window
+        self.schedule = schedule
+        self.lead = lead
+        self._scheduled = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _phase(view: str) -> float:
+        """Get the stable offset of a view, as a fraction of an interval in [0, 1)."""
+        digest = blake2b(view.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big') / 2 ** 64
+    
+    def slots(self, count: int, view: str = '', start: Optional[float] = None) -> List[float]:
+        """Get the send times of the messages of a view.
+        
+        Args:
+            count: Number of messages
+            view: View name
+            start: Unix time the window starts at (defaults to now, plus `lead` when scheduling)
+            
+        Returns:
+            Unix times, in order
+        """
+        if start is None:
+            start = time.time() + (self.lead if self.schedule else 0.0)
+        phase = self._phase(view)
+        return [start + self.window * (i + phase) / max(count, 1) for i in range(count)]
+    
+    def reserve(self, channel: Optional[str], post_at: float) -> bool:
+        """Reserve a scheduled message in a channel, unless Slack's cap would be exceeded.
+        
+        Args:
+            channel: Slack channel ID (`None` is not capped)
+            post_at: Unix time the message would be posted at
+            
+        Returns:
+            True if the message can be scheduled at `post_at`
+        """
+        if channel is None:
+            return True
+        with self._lock:
+            times = self._scheduled.setdefault(channel, [])
+            del times[:bisect.bisect_left(times, time.time() - self.SCHEDULE_WINDOW)]
+            pos = bisect.bisect_left(times, post_at)
+            candidate = times[:pos] + [post_at] + times[pos:]
+            # Every run of MAX_SCHEDULED + 1 messages including the new one must span a full window
+            for first in range(max(pos - self.MAX_SCHEDULED, 0), min(pos, len(candidate) - self.MAX_SCHEDULED - 1) + 1):
+                if candidate[first + self.MAX_SCHEDULED] - candidate[first] < self.SCHEDULE_WINDOW:
+                    return False
+            times.insert(pos, post_at)
+            return True
+    
+    def start(self, count: int, view: str = '') -> 'SmoothedRun':
+        """Start spreading the sends of a view.
+        
+        Args:
+            count: Number of messages the view is about to send
+            view: View name
+            
+        Returns:
+            `SmoothedRun` to wrap the send functions of the view with
+        """
+        return SmoothedRun(self, self.slots(count, view))
+
+# %% ../nbs/API/21_smoothing.ipynb 6
+class SmoothedRun:
+    """
+    Send times of one view, handed out to its sends in order.
+    """
+    
+    def __init__(self, smoother: SendSmoother, slots: List[float]):
+        """Initialize the run.
+        
+        Args:
+            smoother: Smoother the run belongs to
+            slots: Unix times to send the messages at
+        """
+        self.smoother = smoother
+        self.schedule = smoother.schedule
+        self.slots = slots
+        self.stats = {'scheduled': 0, 'delayed': 0, 'waited': 0.0}
+        self._next = 0
+        self._lock = threading.Lock()
+    
+    def next_slot(self) -> float:
+        """Take the next send time (after the last slot, sends go out right away)."""
+        with self._lock:
+            slot = self.slots[self._next] if self._next < len(self.slots) else time.time()
+            self._next += 1
+            return slot
+    
+    def wrap(self, func: Callable, schedule: Optional[bool] = None, channel: Optional[str] = None) -> Callable:
+        """Wrap a send function so that each call takes the next slot.
+        
+        Args:
+            func: Function to wrap, e.g. `send_to_slack_func`
+            schedule: Pass the slot to `func` as `post_at` instead of waiting for it
+                (defaults to the smoother's `schedule`; messages can't be updated on a schedule).
+                Once `channel` has `SendSmoother.MAX_SCHEDULED` messages scheduled within
+                `SendSmoother.SCHEDULE_WINDOW` seconds of the slot, the send waits for it instead
+            channel: Slack channel ID `func` posts to (`None` is not capped)
+            
+        Returns:
+            Function with the same signature as `func`
+        """
+        schedule = self.schedule if schedule is None else schedule
+        
+        @functools.wraps(func)
+        def smoothed(*args, **kwargs):
+            slot = self.next_slot()
+            if schedule and self.smoother.reserve(channel, slot):
+                with self._lock:
+                    self.stats['scheduled'] += 1
+                return func(*args, post_at=slot, **kwargs)
+            
+            wait = slot - time.time()
+            if wait > 0:
+                with self._lock:
+                    self.stats['delayed'] += 1
+                    self.stats['waited'] += wait
+                time.sleep(wait)
+            return func(*args, **kwargs)
+        return smoothed
@@ -6,6 +6,7 @@ __all__ = ['SnowflakeConnector']
 # %% ../nbs/API/07_snowflake_connector.ipynb 3
 from fastcore.basics import patch
 from fastcore.test import *
+from .core import DebugLogger
 
 from typing import List, Tuple, Dict, Any, Callable, Optional
 
@@ -13,7 +14,8 @@ import snowflake.connector
 from snowflake.connector.pandas_tools import write_pandas
 
 import pandas as pd
-import json, re, os
+import re, os
+from . import serialization
 from datetime import datetime
 import pytz
 
@@ -274,18 +276,18 @@ def _prepare_values_and_expressions(
             select_exprs.append("PARSE_JSON(%s)")
             # Always convert to JSON string, even if it's already a dict
             if isinstance(value, (dict, list)):
-                values.append(json.dumps(value))
+                values.append(serialization.dumps(value))
             elif isinstance(value, str):
                 # If it's already a string, validate it's valid JSON
                 try:
-                    json.loads(value)  # Validate JSON
+                    serialization.loads(value)  # Validate JSON
                     values.append(value)
-                except json.JSONDecodeError:
+                except serialization.JSONDecodeError:
                     # If not valid JSON, wrap it as a string value
-                    values.append(json.dumps(value))
+                    values.append(serialization.dumps(value))
             else:
                 # For other types, convert to JSON
-                values.append(json.dumps(value))
+                values.append(serialization.dumps(value))
         
         else:
             select_exprs.append("%s")
@@ -319,14 +321,14 @@ def _validate_json_data(self: SnowflakeConnector, data: Dict[str, Any], db_schem
                 elif isinstance(value, str):
                     # Validate existing JSON string
                     try:
-                        json.loads(value)
+                        serialization.loads(value)
                         validated_data[key] = value
-                    except json.JSONDecodeError:
+                    except serialization.JSONDecodeError:
                         # Convert invalid JSON string to valid JSON
-                        validated_data[key] = json.dumps(value)
+                        validated_data[key] = serialization.dumps(value)
                 else:
                     # Convert dict, list, or other types to JSON string
-                    validated_data[key] = json.dumps(value)
+                    validated_data[key] = serialization.dumps(value)
             else:
                 validated_data[key] = value
         else:
@@ -396,7 +398,7 @@ def insert_record(self: SnowflakeConnector, table_name: str, data: Dict[str, Any
     
     # Get table schema
     db_schema = self._get_table_schema(table_name)
-    print('db_schema', db_schema, 'sc')
+    DebugLogger.log('db_schema %s', db_schema)
     if not db_schema:
         raise ValueError(f"Could not retrieve schema for {options['database']}.{options['schema']}.{table_name}")
         
@@ -625,14 +627,14 @@ def _prepare_dataframe(
                     elif isinstance(x, str):
                         # If it's already a string, validate and return as-is
                         try:
-                            json.loads(x)  # Validate JSON
+                            serialization.loads(x)  # Validate JSON
                             return x
-                        except json.JSONDecodeError:
+                        except serialization.JSONDecodeError:
                             # If not valid JSON, wrap it as a JSON string
-                            return json.dumps(x)
+                            return serialization.dumps(x)
                     else:
                         # Convert dict, list, or other types to JSON string
-                        return json.dumps(x)
+                        return serialization.dumps(x)
                 
                 result_df[col] = result_df[col].apply(convert_to_json_string)
     
@@ -0,0 +1,172 @@
+"""Local stores for per-row alert state, keyed by view and channel"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/16_state_store.ipynb.
+
+# %% auto 0
+__all__ = ['StateStore', 'FileStateStore', 'SQLiteStateStore']
+
+# %% ../nbs/API/16_state_store.ipynb 3
+from fastcore.basics import patch_to
+from fastcore.test import *
+from . import serialization
+from typing import Dict, Any, Iterable, Optional
+import threading
+import sqlite3
+import time
+import os
+
+# %% ../nbs/API/16_state_store.ipynb 5
+class StateStore:
+    """
+    In-memory store of per-row state, keyed by view and channel.
+    
+    Also the base class of the persistent stores, which override `_save` or
+    the whole get/put/delete interface.
+    """
+    
+    def __init__(self):
+        self._state = {}
+        self._lock = threading.RLock()
+    
+    def get(self, view: str, channel: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the state of all rows of a view in a channel.
+        
+        Args:
+            view: View name
+            channel: Slack channel ID
+            
+        Returns:
+            Dictionary of row key to state fields
+        """
+        with self._lock:
+            rows = self._state.get(view, {}).get(channel or '', {})
+            return {key: dict(fields) for key, fields in rows.items()}
+    
+    def put(self, view: str, channel: Optional[str], entries: Dict[str, Dict[str, Any]]):
+        """Merge state fields into the state of rows.
+        
+        Args:
+            view: View name
+            channel: Slack channel ID
+            entries: Dictionary of row key to the state fields to set
+        """
+        if not entries:
+            return
+        with self._lock:
+            rows = self._state.setdefault(view, {}).setdefault(channel or '', {})
+            for key, fields in entries.items():
+                rows.setdefault(key, {}).update(fields)
+            self._save()
+    
+    def delete(self, view: str, channel: Optional[str], row_keys: Iterable[str]):
+        """Forget the state of rows.
+        
+        Args:
+            view: View name
+            channel: Slack channel ID
+            row_keys: Keys of the rows to forget
+        """
+        row_keys = list(row_keys)
+        if not row_keys:
+            return
+        with self._lock:
+            rows = self._state.get(view, {}).get(channel or '', {})
+            for key in row_keys:
+                rows.pop(key, None)
+            self._save()
+    
+    def _save(self):
+        """Persist the state after a change (nothing to do in memory)."""
+        pass
+
+# %% ../nbs/API/16_state_store.ipynb 6
+class FileStateStore(StateStore):
+    """
+    State store kept in a JSON file.
+    """
+    
+    def __init__(self, path: str):
+        """Initialize the store, loading the file if it exists.
+        
+        Args:
+            path: Path of the JSON file
+        """
+        super().__init__()
+        self.path = path
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                self._state = serialization.loads(f.read())
+    
+    def _save(self):
+        """Write the state to a temporary file and move it over the old one."""
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(serialization.dumps_bytes(self._state))
+        os.replace(tmp_path, self.path)
+
+# %% ../nbs/API/16_state_store.ipynb 7
+class SQLiteStateStore(StateStore):
+    """
+    State store kept in an SQLite database.
+    """
+    
+    def __init__(self, path: str, table: str = 'alert_state'):
+        """Initialize the store, creating its table if needed.
+        
+        Args:
+            path: Path of the database file (or ':memory:')
+            table: Table name
+        """
+        super().__init__()
+        self.path = path
+        self.table = table
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    view TEXT NOT NULL,
+                    channel TEXT NOT NULL,
+                    row_key TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (view, channel, row_key)
+                )
+            """)
+    
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+# %% ../nbs/API/16_state_store.ipynb 8
+@patch_to(SQLiteStateStore)
+def get(self, view: str, channel: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Get the state of all rows of a view in a channel."""
+    with self._lock:
+        rows = self._conn.execute(
+            f"SELECT row_key, state FROM {self.table} WHERE view = ? AND channel = ?",
+            (view, channel or '')
+        ).fetchall()
+    return {key: serialization.loads(state) for key, state in rows}
+
+@patch_to(SQLiteStateStore)
+def put(self, view: str, channel: Optional[str], entries: Dict[str, Dict[str, Any]]):
+    """Merge state fields into the state of rows."""
+    if not entries:
+        return
+    with self._lock, self._conn:
+        current = self.get(view, channel)
+        now = time.time()
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO {self.table} (view, channel, row_key, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+            [(view, channel or '', key, serialization.dumps({**current.get(key, {}), **fields}), now)
+             for key, fields in entries.items()]
+        )
+
+@patch_to(SQLiteStateStore)
+def delete(self, view: str, channel: Optional[str], row_keys: Iterable[str]):
+    """Forget the state of rows."""
+    with self._lock, self._conn:
+        self._conn.executemany(
+            f"DELETE FROM {self.table} WHERE view = ? AND channel = ? AND row_key = ?",
+            [(view, channel or '', key) for key in row_keys]
+        )
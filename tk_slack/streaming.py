@@ -0,0 +1,71 @@
+"""Overlap message rendering with sending through a bounded window"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/11_streaming.ipynb.
+
+# %% auto 0
+__all__ = ['stream_ahead']
+
+# %% ../nbs/API/11_streaming.ipynb 3
+from fastcore.test import *
+from typing import Iterable, Iterator, Any
+import threading
+import queue
+
+# %% ../nbs/API/11_streaming.ipynb 5
+class _ProducerError:
+    """Wraps an exception raised by the producer thread."""
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+_DONE = object()
+
+def stream_ahead(items: Iterable[Any], window: int = 8) -> Iterator[Any]:
+    """Iterate over `items` while a background thread produces up to `window` items ahead.
+    
+    Args:
+        items: Iterable to consume, typically a generator of rendered messages
+        window: Maximum number of produced items waiting to be consumed
+        
+    Yields:
+        The items of `items`, in order
+    """
+    if window < 1:
+        yield from items
+        return
+    
+    buffer = queue.Queue(maxsize=window)
+    stopped = threading.Event()
+    
+    def put(item) -> bool:
+        # Block while the buffer is full, but give up once the consumer has stopped
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_ProducerError(e))
+            return
+        put(_DONE)
+    
+    producer = threading.Thread(target=produce, name='tk_slack-stream-ahead', daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.exc
+            yield item
+    finally:
+        stopped.set()
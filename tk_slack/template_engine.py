@@ -12,8 +12,8 @@ from typing import List, Tuple, Dict, Any, Callable, Optional
 from .core import ValueFormatter, DebugLogger, ColumnUtils, SlackFormatter
 from .block_builder import BlockBuilder
 from .interaction_builder import InteractionBuilder
+from . import serialization
 import pandas as pd
-import json
 import numpy as np
 
 # %% ../nbs/API/04_template_engine.ipynb 4
@@ -103,27 +103,29 @@ def _parse_row_config(self,row: pd.Series, view_config: Dict[str, Any],
             Merged configuration
         """
         # Start with the view config
-        config = view_config.copy()
+        config = dict(view_config or {})
         
         # Check for row-specific config
         if 'ROW_CONFIG' in col_map and pd.notna(row[col_map['ROW_CONFIG']]):
             try:
                 row_config = row[col_map['ROW_CONFIG']]
-                if not isinstance(row_config, dict):    row_config = json.loads(row_config)
+                if not isinstance(row_config, dict):    row_config = serialization.loads(row_config)
                 config.update(row_config)
                 return config
-            except (json.JSONDecodeError, TypeError):
+            except (serialization.JSONDecodeError, TypeError):
                 DebugLogger.log(f"Error parsing row config. Using view_config.")
         
         if 'CONFIG' in col_map and pd.notna(row[col_map['CONFIG']]):
             try:
                 row_config = row[col_map['CONFIG']]
-                if not isinstance(row_config, dict): row_config = json.loads(row_config)
+                if not isinstance(row_config, dict): row_config = serialization.loads(row_config)
                 # Merge with view_config, with row_config taking precedence
                 config.update(row_config)
                 return config
-            except (json.JSONDecodeError, TypeError):
+            except (serialization.JSONDecodeError, TypeError):
                 DebugLogger.log(f"Error parsing row config. Using view_config.")
+        
+        return config
 
 # %% ../nbs/API/04_template_engine.ipynb 7
 @patch_to(TemplateEngine,cls_method=True)
@@ -258,17 +260,17 @@ def _extract_response_metadata(self,row: pd.Series, col_map: Dict[str, str],
         if response_meta:
             # Convert existing metadata to dict if possible
             try:
-                meta_dict = json.loads(response_meta) if isinstance(response_meta, str) else response_meta
+                meta_dict = serialization.loads(response_meta) if isinstance(response_meta, str) else response_meta
                 if isinstance(meta_dict, dict):
                     meta_dict.update(response_config)
-                    return json.dumps(meta_dict)
-            except (json.JSONDecodeError, TypeError):
+                    return serialization.dumps(meta_dict)
+            except (serialization.JSONDecodeError, TypeError):
                 # If not valid JSON, use as is and append response config
-                combined = f"{response_meta}|{json.dumps(response_config)}"
+                combined = f"{response_meta}|{serialization.dumps(response_config)}"
                 return combined
         else:
             # Just use response config as metadata
-            return json.dumps(response_config)
+            return serialization.dumps(response_config)
             
     return response_meta
 
@@ -279,7 +281,8 @@ def build_individual_message_blocks(cls,
                                     row: pd.Series, 
                                     df_columns: List[str], 
                                     col_map: Dict[str, str], 
-                                    config: Dict[str, Any]) -> List[Dict[str, Any]]:
+                                    config: Dict[str, Any],
+                                    section_text: Optional[str] = None) -> List[Dict[str, Any]]:
     """Build message blocks for a single row.
     
     Args:
@@ -287,6 +290,7 @@ def build_individual_message_blocks(cls,
         df_columns: DataFrame column names
         col_map: Column name mapping
         config: Configuration dictionary
+        section_text: Optional pre-formatted title (see `SlackFormatter.format_section_names`)
         
     Returns:
         List of Slack blocks for the message
@@ -295,7 +299,8 @@ def build_individual_message_blocks(cls,
     payload_blocks = []
     
     # 1. Title Section - Use SlackFormatter for title with proper linking
-    section_text = SlackFormatter.format_section_name(row, df_columns)
+    if section_text is None:
+        section_text = SlackFormatter.format_section_name(row, df_columns)
     payload_blocks.append(BlockBuilder.create_section_block(section_text))
     
     # 2. Description Text - Look for TEXT or DESCRIPTION column